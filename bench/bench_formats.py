@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+#
+# Compares writing a create mode report as JSON and YAML: time, and
+# peak memory allocated while writing, for a report with a given
+# number of (synthetic) files.
+#
+# usage: PYTHONPATH=. bench/bench_formats.py [FILES ...]
+#
+
+import os
+import sys
+import time
+import tracemalloc
+
+from scancode_manifestor.file_record import FileRecordFactory
+from scancode_manifestor.format_json import JSONFormatter
+from scancode_manifestor.format_yaml import YamlFormatter
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import FilterAttribute
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+LICENSES = [ "mit", "bsd-new", "apache-2.0", "gpl-2.0-or-later", "x11" ]
+
+def report(utils, count):
+    factory = FileRecordFactory()
+    files = { 'included': [], 'excluded': [] }
+    for i in range(count):
+        lic = LICENSES[i % len(LICENSES)]
+        name = "file" + str(i) + ".c"
+        path = "proj/dir" + str(i % 100) + "/" + name
+        f = factory.record(path, name, "file", "C source, ASCII text", [ lic ], [ lic.upper() ], [ "Copyright (c) " + str(i % 10) + " Inc" ])
+        if i % 4 == 0:
+            utils._add_filter_data(f, FilterAttribute.PATH, FilterAction.EXCLUDE, "dir[0-9]*/")
+            files['excluded'].append(f)
+        else:
+            utils._add_scancode_manifestor_data(f, 'license_key', lic)
+            utils._add_scancode_manifestor_data(f, 'license_spdx', lic.upper())
+            utils._add_scancode_manifestor_data(f, 'copyright', list(f['copyright_values']))
+            files['included'].append(f)
+    files['included_files_count'] = len(files['included'])
+    files['excluded_files_count'] = len(files['excluded'])
+    return { 'files': files,
+             'conclusion': { 'copyright': [], 'license_expression': " & ".join(LICENSES) },
+             'meta': { 'arguments': {} } }
+
+def bench(formatter, report):
+    with open(os.devnull, "w") as out:
+        start = time.perf_counter()
+        formatter.format_stream(report, out)
+        seconds = time.perf_counter() - start
+
+        # again, tracemalloc slows down the formatting
+        tracemalloc.start()
+        formatter.format_stream(report, out)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak
+
+def main():
+    counts = [ int(count) for count in sys.argv[1:] ]
+    if not counts:
+        counts = [ 10000, 100000 ]
+
+    utils = ManifestUtils(ManifestLogger(False))
+    print("%-8s %10s %10s %12s" % ("format", "files", "seconds", "peak (kB)"))
+    for count in counts:
+        r = report(utils, count)
+        for name, formatter in [ ("json", JSONFormatter({}, utils)), ("yaml", YamlFormatter({}, utils)) ]:
+            seconds, peak = bench(formatter, r)
+            print("%-8s %10d %10.3f %12d" % (name, count, seconds, peak / 1024))
+
+if __name__ == '__main__':
+    main()
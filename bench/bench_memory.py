@@ -0,0 +1,186 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+#
+# Measures the memory used by each stage of the pipe (load, filter,
+# transform, curate, report, validate and format) when creating a
+# manifest from generated scancode reports (see report_generator.py),
+# in bytes per file in the report.
+#
+# The manifestor is run (as from the command line) with the stages
+# profiled (see stage_profiler.py), twice for each report and format:
+#
+# * with tracemalloc, for the memory allocated in each stage: the
+#   peak while in the stage and what is kept after the stage
+# * without tracemalloc (it uses a lot of memory itself), for the
+#   growth of the peak resident set size (RSS) in each stage
+#
+# The files are read from the report while they are filtered, so the
+# memory used to read them is in the filter stage, not the load
+# stage.
+#
+# The peak allocated in a stage, and the growth of the peak RSS from
+# the load stage, must not be more than the budgets (bytes per file)
+# in memory_budgets.json. A run exceeding a budget fails. E.g. an RSS
+# budget of 1400 bytes per file (see memory_budgets.json) keeps a report
+# with 2M files within 2.8GB (and the interpreter).
+#
+# usage: PYTHONPATH=. bench/bench_memory.py [-of FORMAT] [-b STAGE=BYTES] [SIZES ...]
+#
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from bench.report_generator import ReportGenerator
+
+BENCH_DIR = os.path.dirname(os.path.realpath(__file__))
+TOP_DIR = os.path.dirname(BENCH_DIR)
+BUDGETS_FILE = os.path.join(BENCH_DIR, "memory_budgets.json")
+
+DEFAULT_SIZES = [ 100000 ]
+FORMATS = [ "markdown", "text", "json", "yaml", "html" ]
+
+# arguments to the manifestor, with the report and the format
+MANIFESTOR_ARGS = [ "-ede",
+                    "-cl", "x11", "mit",
+                    "-cml", "mit",
+                    "-pn", "bench", "-pv", "1.0" ]
+
+#
+# Stages (as written by the stage profiler) when creating a manifest
+# from report in output_format
+#
+def profile(report, output_format, tmp_dir, traced):
+    stages_file = os.path.join(tmp_dir, "stages.json")
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([ TOP_DIR ] + [ path for path in [ env.get('PYTHONPATH') ] if path ])
+    if traced:
+        env['PYTHONTRACEMALLOC'] = "1"
+    else:
+        env.pop('PYTHONTRACEMALLOC', None)
+    command = [ sys.executable, "-m", "scancode_manifestor",
+                "-i", report,
+                "-of", output_format,
+                "-o", os.devnull,
+                "-psf", stages_file ] + MANIFESTOR_ARGS + [ "create" ]
+    subprocess.run(command, env=env, check=True)
+    with open(stages_file) as fp:
+        return json.load(fp)['stages']
+
+#
+# Bytes per file for each stage: peak and kept allocated memory and
+# the growth of the peak RSS
+#
+def measure(report, files, output_format, tmp_dir):
+    traced = profile(report, output_format, tmp_dir, True)
+    untraced = profile(report, output_format, tmp_dir, False)
+
+    stages = {}
+    for stage in traced:
+        stages[stage['name']] = { 'peak': stage['traced_peak'] / files,
+                                  'kept': stage['traced_delta'] / files }
+    for stage in untraced:
+        stages[stage['name']]['rss'] = stage['max_rss_growth_kb'] * 1024 / files
+
+    # the peak RSS, from the load stage on (the interpreter and
+    # license data are not counted)
+    rss = (untraced[-1]['max_rss_kb'] - untraced[0]['max_rss_kb']) * 1024 / files
+    return stages, rss
+
+#
+# Budgets exceeded by the stages (bytes per file), and the rss
+#
+def check(stages, rss, budgets):
+    failures = []
+    for name, stage in stages.items():
+        budget = budgets['peak_bytes_per_file'].get(name)
+        if budget != None and stage['peak'] > budget:
+            failures.append(name + ": " + str(int(stage['peak'])) + " bytes per file allocated, budget " + str(budget))
+    budget = budgets.get('rss_bytes_per_file')
+    if budget != None and rss > budget:
+        failures.append("rss: " + str(int(rss)) + " bytes per file, budget " + str(budget))
+    return failures
+
+def write(size, output_format, stages, rss, budgets, stream):
+    for name, stage in stages.items():
+        budget = budgets['peak_bytes_per_file'].get(name, "")
+        stream.write("%-10s %10d %-10s %12d %12d %12d %12s\n" % (output_format, size, name, stage['peak'], stage['kept'], stage['rss'], budget))
+    stream.write("%-10s %10d %-10s %12s %12s %12d %12s\n" % (output_format, size, "total", "", "", rss, budgets.get('rss_bytes_per_file', "")))
+
+def read_budgets(file_name, overrides, rss_budget):
+    budgets = { 'peak_bytes_per_file': {} }
+    if file_name != None:
+        with open(file_name) as fp:
+            budgets.update(json.load(fp))
+    for override in overrides:
+        stage, separator, budget = override.partition("=")
+        if separator == "":
+            raise ValueError("Budget must be given as STAGE=BYTES: " + override)
+        budgets['peak_bytes_per_file'][stage] = int(budget)
+    if rss_budget != None:
+        budgets['rss_bytes_per_file'] = rss_budget
+    return budgets
+
+def parse():
+    parser = argparse.ArgumentParser(description="Measure the memory used by each stage of the manifestor on generated scancode reports")
+    parser.add_argument('sizes', type=int, nargs='*',
+                        help='number of files in the reports (default ' + " ".join([ str(size) for size in DEFAULT_SIZES ]) + ')')
+    parser.add_argument('-of', '--output-format', action='append', dest='formats', default=None,
+                        help='format of the manifest, can be given more than once (default all: ' + ", ".join(FORMATS) + ')')
+    parser.add_argument('-bf', '--budget-file', default=BUDGETS_FILE,
+                        help='budgets, bytes per file (default ' + BUDGETS_FILE + ')')
+    parser.add_argument('-b', '--budget', action='append', default=[],
+                        help='peak bytes per file allocated in a stage, e.g. filter=800, overrides the budget file')
+    parser.add_argument('-rb', '--rss-budget', type=int, default=None,
+                        help='growth of the peak RSS in bytes per file, overrides the budget file')
+    return parser.parse_args()
+
+def main():
+    args = parse()
+    sizes = args.sizes
+    if not sizes:
+        sizes = DEFAULT_SIZES
+    formats = args.formats
+    if not formats:
+        formats = FORMATS
+
+    try:
+        budgets = read_budgets(args.budget_file, args.budget, args.rss_budget)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(str(e) + "\n")
+        exit(2)
+
+    failures = []
+    sys.stdout.write("%-10s %10s %-10s %12s %12s %12s %12s\n" % ("format", "files", "stage", "peak (B/f)", "kept (B/f)", "rss (B/f)", "budget"))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            report = os.path.join(tmp_dir, "report.json")
+            with open(report, "w") as fp:
+                ReportGenerator(size).write(fp)
+            for output_format in formats:
+                stages, rss = measure(report, size, output_format, tmp_dir)
+                write(size, output_format, stages, rss, budgets, sys.stdout)
+                sys.stdout.flush()
+                for failure in check(stages, rss, budgets):
+                    failures.append(output_format + ", " + str(size) + " files, " + failure)
+
+    for failure in failures:
+        sys.stderr.write(failure + "\n")
+    if failures:
+        exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+#
+# Times the stages of the pipe (filter, transform, curate, report and
+# each formatter) on generated scancode reports (see
+# report_generator.py) of the given sizes.
+#
+# The times can be compared with the baselines in baselines.json,
+# which are updated with --update. Since the baselines are measured
+# on another machine, the check (--check) compares how each stage
+# scales: the time per file at each size relative to the time per
+# file at the smallest size. A stage getting (more) superlinear fails
+# the check.
+#
+# usage: PYTHONPATH=. bench/bench_pipeline.py [--check|--update] [SIZES ...]
+#
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from bench.report_generator import ReportGenerator
+from scancode_manifestor.__main__ import ScancodeManifestor
+from scancode_manifestor.__main__ import parse as parse_manifestor
+from scancode_manifestor.file_record import file_records
+from scancode_manifestor.format_html import HtmlFormatter
+from scancode_manifestor.format_json import JSONFormatter
+from scancode_manifestor.format_markdown import MarkdownFormatter
+from scancode_manifestor.format_text import TextFormatter
+from scancode_manifestor.format_yaml import YamlFormatter
+from scancode_manifestor.manifestor_commands import ManifestorCommands
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+BENCH_DIR = os.path.dirname(os.path.realpath(__file__))
+BASELINES_FILE = os.path.join(BENCH_DIR, "baselines.json")
+
+DEFAULT_SIZES = [ 10000, 100000 ]
+DEFAULT_REPEAT = 3
+# allowed growth of the scaling, compared to the baseline
+DEFAULT_TOLERANCE = 1.5
+# stages faster than this (seconds) are too noisy to check
+MIN_CHECKED_TIME = 0.01
+
+FORMATTERS = [ ("markdown", MarkdownFormatter),
+               ("text", TextFormatter),
+               ("json", JSONFormatter),
+               ("yaml", YamlFormatter),
+               ("html", HtmlFormatter) ]
+
+STAGES = [ "filter", "transform", "curate", "report" ] + [ "format_" + name for name, formatter in FORMATTERS ]
+
+# command line used for the manifestor arguments (nothing is read)
+MANIFESTOR_ARGS = [ "-i", "generated.json", "-ede",
+                    "-cl", "x11", "mit",
+                    "-cml", "mit",
+                    "-pn", "bench", "-pv", "1.0",
+                    "create" ]
+
+def manifestor_args(commands, logger, utils):
+    argv = sys.argv
+    try:
+        sys.argv = [ "scancode-manifestor" ] + MANIFESTOR_ARGS
+        args = parse_manifestor(commands).__dict__
+    finally:
+        sys.argv = argv
+    manifestor = ScancodeManifestor(commands, logger, utils)
+    manifestor._merge_exclude_files(args)
+    manifestor._merge_include_files(args)
+    return args
+
+#
+# Seconds spent in each stage, for one run on the files
+#
+def run(generator, records):
+    logger = ManifestLogger(False)
+    utils = ManifestUtils(logger)
+    args = manifestor_args(ManifestorCommands(), logger, utils)
+    files = utils._files_map(list(records), [])
+    scancode_report = { 'headers': generator.headers(), 'files_count': None }
+
+    times = {}
+    start = time.perf_counter()
+    files = utils._filter(files, args['included_regexps'], args['excluded_regexps'])
+    times['filter'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    utils._transform_files(files)
+    times['transform'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    utils._curate(files, args['file_curations'], args['license_curations'], args['missing_license_curation'])
+    times['curate'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = utils._report(args, scancode_report, files)
+    times['report'] = time.perf_counter() - start
+
+    with open(os.devnull, "w") as out:
+        for name, formatter in FORMATTERS:
+            start = time.perf_counter()
+            formatter(args, utils).format_stream(report, out)
+            times['format_' + name] = time.perf_counter() - start
+    return times
+
+#
+# Best (lowest) time of each stage, in repeat runs
+#
+def bench(size, repeat):
+    generator = ReportGenerator(size)
+    # the files are shared by the runs, only the manifestor
+    # information is added to them
+    records = list(file_records(generator.entries()))
+    best = {}
+    for i in range(repeat):
+        for f in records:
+            if 'scancode_manifestor' in f:
+                del f['scancode_manifestor']
+        for stage, seconds in run(generator, records).items():
+            best[stage] = min(seconds, best.get(stage, seconds))
+    return best
+
+# time per file at each size, relative to the time per file at the smallest size
+def scaling(results, stage):
+    sizes = sorted([ int(size) for size in results.keys() ])
+    smallest = results[str(sizes[0])][stage] / sizes[0]
+    return { str(size): (results[str(size)][stage] / size) / smallest for size in sizes }
+
+#
+# Stages scaling worse than in the baselines, with the tolerance
+#
+def check(results, baselines, tolerance):
+    failures = []
+    sizes = [ size for size in results.keys() if size in baselines['sizes'] ]
+    if len(sizes) < 2:
+        return [ "at least two sizes in the baselines are needed to check the scaling" ]
+    results = { size: results[size] for size in sizes }
+    base = { size: baselines['sizes'][size] for size in sizes }
+    smallest = str(min([ int(size) for size in sizes ]))
+    for stage in STAGES:
+        if results[smallest][stage] < MIN_CHECKED_TIME:
+            continue
+        result_scaling = scaling(results, stage)
+        base_scaling = scaling(base, stage)
+        for size in sizes:
+            if size != smallest and result_scaling[size] > base_scaling[size] * tolerance:
+                failures.append(stage + " at " + size + " files: " + ("%.2f" % result_scaling[size]) + " times the time per file at " + smallest + " files, baseline " + ("%.2f" % base_scaling[size]))
+    return failures
+
+def write(results, baselines, stream):
+    stream.write("%-16s %10s %10s %12s %12s\n" % ("stage", "files", "seconds", "us/file", "baseline"))
+    for size in sorted(results.keys(), key=int):
+        for stage in STAGES:
+            seconds = results[size][stage]
+            line = "%-16s %10s %10.3f %12.2f" % (stage, size, seconds, seconds * 1000000 / int(size))
+            if baselines != None and size in baselines['sizes']:
+                line += " %12.2f" % (baselines['sizes'][size][stage] * 1000000 / int(size))
+            stream.write(line + "\n")
+
+def read_baselines():
+    if not os.path.exists(BASELINES_FILE):
+        return None
+    with open(BASELINES_FILE) as fp:
+        return json.load(fp)
+
+def parse():
+    parser = argparse.ArgumentParser(description="Time the stages of the manifestor on generated scancode reports")
+    parser.add_argument('sizes', type=int, nargs='*',
+                        help='number of files in the reports (default ' + " ".join([ str(size) for size in DEFAULT_SIZES ]) + ')')
+    parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='runs for each size, the best time is kept (default ' + str(DEFAULT_REPEAT) + ')')
+    parser.add_argument('-c', '--check', action='store_true', default=False,
+                        help='fail if a stage scales worse than in the baselines')
+    parser.add_argument('-t', '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed growth of the scaling with --check (default ' + str(DEFAULT_TOLERANCE) + ')')
+    parser.add_argument('-u', '--update', action='store_true', default=False,
+                        help='write the times as the new baselines')
+    return parser.parse_args()
+
+def main():
+    args = parse()
+    sizes = args.sizes
+    if not sizes:
+        sizes = DEFAULT_SIZES
+
+    results = {}
+    for size in sizes:
+        results[str(size)] = bench(size, args.repeat)
+
+    baselines = read_baselines()
+    write(results, baselines, sys.stdout)
+
+    if args.update:
+        with open(BASELINES_FILE, "w") as fp:
+            json.dump({ 'python': platform.python_version(),
+                        'machine': platform.machine(),
+                        'sizes': results }, fp, indent=4)
+            fp.write("\n")
+
+    if args.check:
+        if baselines == None:
+            sys.stderr.write("No baselines in " + BASELINES_FILE + "\n")
+            exit(2)
+        failures = check(results, baselines, args.tolerance)
+        for failure in failures:
+            sys.stderr.write(failure + "\n")
+        if failures:
+            exit(1)
+
+if __name__ == '__main__':
+    main()
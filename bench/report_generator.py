@@ -0,0 +1,334 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+#
+# Generates (synthetic) scancode reports, shaped as the reports from
+# scancode-toolkit, of any size. The files are spread over a directory
+# tree of a given depth, with names (Makefile.am, README, .deps/ ...)
+# the default excludes match, licenses picked from a weighted mix and
+# copyrights for some of the files. The same arguments (and seed)
+# give the same report.
+#
+# usage: PYTHONPATH=. bench/report_generator.py -n FILES [-o FILE] ...
+#
+
+import argparse
+import json
+import math
+import random
+import sys
+
+DEFAULT_DEPTH = 4
+DEFAULT_FILES_PER_DIR = 20
+DEFAULT_COPYRIGHT_DENSITY = 0.6
+DEFAULT_UNKNOWN_RATIO = 0.1
+# files with two license expressions
+DUAL_LICENSE_RATIO = 0.05
+
+# license expression => weight
+DEFAULT_LICENSE_MIX = {
+    "mit": 30,
+    "apache-2.0": 20,
+    "gpl-2.0-or-later": 15,
+    "bsd-new": 10,
+    "lgpl-2.1-or-later": 8,
+    "gpl-3.0-or-later": 5,
+    "gpl-2.0 OR mit": 4,
+    "x11": 3,
+    "isc": 3,
+    "zlib": 2,
+}
+
+SPDX_KEYS = {
+    "mit": "MIT",
+    "apache-2.0": "Apache-2.0",
+    "gpl-2.0": "GPL-2.0-only",
+    "gpl-2.0-or-later": "GPL-2.0-or-later",
+    "gpl-3.0-or-later": "GPL-3.0-or-later",
+    "bsd-new": "BSD-3-Clause",
+    "lgpl-2.1-or-later": "LGPL-2.1-or-later",
+    "x11": "X11",
+    "isc": "ISC",
+    "zlib": "Zlib",
+}
+
+DIR_NAMES = [ "src", "lib", "include", "tests", "doc", "tools", "core", "util", "net", "ui", "m4", "po", ".deps", "autom4te.cache" ]
+
+# (name suffix, scancode file type, weight)
+FILE_KINDS = [
+    (".c", "C source, ASCII text", 30),
+    (".h", "C source, ASCII text", 18),
+    (".py", "Python script, ASCII text executable", 10),
+    (".js", "ASCII text", 6),
+    (".png", "PNG image data, 64 x 64, 8-bit/color RGBA, non-interlaced", 4),
+    (".txt", "ASCII text", 3),
+    ("Makefile.am", "makefile script, ASCII text", 3),
+    ("Makefile.in", "makefile script, ASCII text", 3),
+    ("README", "ASCII text", 2),
+    (".m4", "M4 macro processor script, ASCII text", 2),
+    (".po", "GNU gettext message catalogue, UTF-8 Unicode text", 2),
+    ("ChangeLog", "ASCII text", 1),
+    (".spec", "ASCII text", 1),
+]
+
+HOLDERS = 200
+
+#
+# The expressions in a license mix given as "mit=30,apache-2.0=20"
+#
+def parse_license_mix(mix):
+    res = {}
+    for item in mix.split(","):
+        expression, separator, weight = item.rpartition("=")
+        if separator == "":
+            expression = weight
+            weight = "1"
+        res[expression.strip()] = float(weight)
+    return res
+
+def _spdx_key(expression):
+    keys = []
+    for key in expression.split(" "):
+        if key in [ "OR", "AND", "WITH" ]:
+            keys.append(key)
+        else:
+            keys.append(SPDX_KEYS.get(key, "LicenseRef-scancode-" + key))
+    return " ".join(keys)
+
+#
+# Name of the directory with digits (the last digit is the directory's
+# number in its parent). The names are rotated per parent, so that all
+# names are used also with few directories in each.
+#
+def _dir_name(digits):
+    number = digits[-1] + (sum(digits[:-1]) * 3 + len(digits)) % len(DIR_NAMES)
+    name = DIR_NAMES[number % len(DIR_NAMES)]
+    if number >= len(DIR_NAMES):
+        name += str(number // len(DIR_NAMES))
+    return name
+
+def _dir_path(root, digits):
+    return "/".join([ root ] + [ _dir_name(digits[:level + 1]) for level in range(len(digits)) ])
+
+def _dir_entry(path, name):
+    return { 'path': path,
+             'type': "directory",
+             'name': name,
+             'base_name': name,
+             'extension': "",
+             'size': 0,
+             'sha1': None,
+             'mime_type': None,
+             'file_type': None,
+             'licenses': [],
+             'license_expressions': [],
+             'copyrights': [],
+             'holders': [],
+             'authors': [],
+             'files_count': 0,
+             'scan_errors': [] }
+
+class ReportGenerator:
+    def __init__(self, files,
+                 depth=DEFAULT_DEPTH,
+                 files_per_dir=DEFAULT_FILES_PER_DIR,
+                 license_mix=None,
+                 copyright_density=DEFAULT_COPYRIGHT_DENSITY,
+                 unknown_ratio=DEFAULT_UNKNOWN_RATIO,
+                 seed=0,
+                 root="proj"):
+        if files < 0 or depth < 0 or files_per_dir < 1:
+            raise ValueError("Files and depth must not be negative, files per directory must be positive")
+        if not 0 <= copyright_density <= 1 or not 0 <= unknown_ratio <= 1:
+            raise ValueError("Copyright density and unknown ratio must be between 0 and 1")
+        if license_mix is None:
+            license_mix = DEFAULT_LICENSE_MIX
+        if not license_mix:
+            raise ValueError("Empty license mix")
+        self.files = files
+        self.depth = depth
+        self.files_per_dir = files_per_dir
+        self.expressions = list(license_mix.keys())
+        self.weights = list(license_mix.values())
+        self.copyright_density = copyright_density
+        self.unknown_ratio = unknown_ratio
+        self.seed = seed
+        self.root = root
+
+        dirs = math.ceil(files / files_per_dir)
+        # directories in each directory, to get the leaf dirs needed
+        self.fanout = 1
+        if depth > 0:
+            self.fanout = max(1, math.ceil(dirs ** (1.0 / depth)))
+        self.kinds = [ (suffix, file_type) for suffix, file_type, weight in FILE_KINDS ]
+        self.kind_weights = [ weight for suffix, file_type, weight in FILE_KINDS ]
+
+    def headers(self):
+        return [ { 'tool_name': "scancode-toolkit",
+                   'tool_version': "3.2.3",
+                   'options': { 'input': [ self.root ], '--copyright': True, '--license': True, '--info': True, '--json-pp': "-" },
+                   'notice': "Generated with ScanCode and provided on an \"AS IS\" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.",
+                   'start_timestamp': "2021-01-01T000000.000000",
+                   'end_timestamp': "2021-01-01T000000.000000",
+                   'message': None,
+                   'errors': [],
+                   'extra_data': { 'files_count': self.files } } ]
+
+    # leaf directory (digits in base fanout) holding the file with index
+    def _dir_digits(self, index):
+        number = index // self.files_per_dir
+        digits = []
+        for level in range(self.depth):
+            digits.append(number % self.fanout)
+            number //= self.fanout
+        digits.reverse()
+        return digits
+
+    def _file_entry(self, rnd, dir_path, index):
+        suffix, file_type = rnd.choices(self.kinds, self.kind_weights)[0]
+        if suffix.startswith("."):
+            name = "file" + str(index) + suffix
+            extension = suffix
+        else:
+            # e.g. 12README, as unique names in the directory
+            name = str(index) + suffix
+            extension = ""
+
+        expressions = []
+        if rnd.random() >= self.unknown_ratio:
+            expressions.append(rnd.choices(self.expressions, self.weights)[0])
+            if rnd.random() < DUAL_LICENSE_RATIO:
+                other = rnd.choices(self.expressions, self.weights)[0]
+                if other not in expressions:
+                    expressions.append(other)
+        licenses = []
+        for line, expression in enumerate(expressions):
+            licenses.append({ 'key': expression,
+                              'score': 100.0,
+                              'name': expression,
+                              'short_name': expression,
+                              'category': "Permissive",
+                              'spdx_license_key': _spdx_key(expression),
+                              'start_line': line + 1,
+                              'end_line': line + 1,
+                              'matched_rule': { 'identifier': expression + "_1.RULE",
+                                                'license_expression': expression,
+                                                'licenses': expression.split(" OR ") } })
+
+        copyrights = []
+        holders = []
+        if rnd.random() < self.copyright_density:
+            for line in range(rnd.randint(1, 3)):
+                holder = "Example Holder " + str(rnd.randrange(HOLDERS))
+                year = str(rnd.randint(1990, 2021))
+                copyrights.append({ 'value': "Copyright (c) " + year + " " + holder, 'start_line': line + 1, 'end_line': line + 1 })
+                holders.append({ 'value': holder, 'start_line': line + 1, 'end_line': line + 1 })
+
+        size = rnd.randint(100, 100000)
+        return { 'path': dir_path + "/" + name,
+                 'type': "file",
+                 'name': name,
+                 'base_name': name[:len(name) - len(extension)],
+                 'extension': extension,
+                 'size': size,
+                 'sha1': "%040x" % rnd.getrandbits(160),
+                 'mime_type': "text/plain",
+                 'file_type': file_type,
+                 'licenses': licenses,
+                 'license_expressions': expressions,
+                 'copyrights': copyrights,
+                 'holders': holders,
+                 'authors': [],
+                 'files_count': 0,
+                 'scan_errors': [] }
+
+    #
+    # The entries (dicts) of the report, directories before the
+    # entries in them
+    #
+    def entries(self):
+        rnd = random.Random(self.seed)
+        yield _dir_entry(self.root, self.root)
+        # digits of the directories written
+        current = []
+        dir_path = self.root
+        for index in range(self.files):
+            digits = self._dir_digits(index)
+            if digits != current:
+                same = 0
+                while same < len(current) and current[same] == digits[same]:
+                    same += 1
+                for level in range(same, len(digits)):
+                    yield _dir_entry(_dir_path(self.root, digits[:level + 1]), _dir_name(digits[:level + 1]))
+                current = digits
+                dir_path = _dir_path(self.root, digits)
+            yield self._file_entry(rnd, dir_path, index)
+
+    #
+    # Write the report as JSON to fp, one entry at a time so that
+    # reports larger than the memory can be written
+    #
+    def write(self, fp, indent=None):
+        fp.write("{\n\"headers\": ")
+        fp.write(json.dumps(self.headers(), indent=indent))
+        fp.write(",\n\"files\": [")
+        separator = "\n"
+        for entry in self.entries():
+            fp.write(separator)
+            fp.write(json.dumps(entry, indent=indent))
+            separator = ",\n"
+        fp.write("\n]\n}\n")
+
+def parse():
+    parser = argparse.ArgumentParser(description="Generate a synthetic scancode report")
+    parser.add_argument('-n', '--files', type=int, default=10000,
+                        help='number of files in the report (default 10000)')
+    parser.add_argument('-d', '--depth', type=int, default=DEFAULT_DEPTH,
+                        help='depth of the directory tree (default ' + str(DEFAULT_DEPTH) + ')')
+    parser.add_argument('-fpd', '--files-per-dir', type=int, default=DEFAULT_FILES_PER_DIR,
+                        help='files in each leaf directory (default ' + str(DEFAULT_FILES_PER_DIR) + ')')
+    parser.add_argument('-l', '--license-mix', default=None,
+                        help='license expressions and weights, e.g. "mit=3,bsd-new=1"')
+    parser.add_argument('-c', '--copyright-density', type=float, default=DEFAULT_COPYRIGHT_DENSITY,
+                        help='share of the files with copyrights (default ' + str(DEFAULT_COPYRIGHT_DENSITY) + ')')
+    parser.add_argument('-u', '--unknown-ratio', type=float, default=DEFAULT_UNKNOWN_RATIO,
+                        help='share of the files without a license (default ' + str(DEFAULT_UNKNOWN_RATIO) + ')')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='random seed (default 0)')
+    parser.add_argument('-pp', '--pretty', action='store_true', default=False,
+                        help='indent the JSON, as scancode --json-pp')
+    parser.add_argument('-o', '--output', default=None,
+                        help='write the report to file (default stdout)')
+    return parser.parse_args()
+
+def main():
+    args = parse()
+    license_mix = None
+    if args.license_mix != None:
+        license_mix = parse_license_mix(args.license_mix)
+    try:
+        generator = ReportGenerator(args.files, args.depth, args.files_per_dir, license_mix, args.copyright_density, args.unknown_ratio, args.seed)
+    except ValueError as e:
+        sys.stderr.write(str(e) + "\n")
+        exit(1)
+
+    indent = None
+    if args.pretty:
+        indent = 2
+    if args.output != None:
+        with open(args.output, "w") as fp:
+            generator.write(fp, indent)
+    else:
+        generator.write(sys.stdout, indent)
+
+if __name__ == '__main__':
+    main()
@@ -27,19 +27,11 @@ then
     PATH=~/.local/bin:${PATH}
     #SCANCODE_MANIFESTOR_PY="$( realpath "${BASH_SOURCE[0]}" | sed 's,\.sh,\.py,g')"
     SCANCODE_MANIFESTOR_PY=scancode-manifestor
-    $SCANCODE_MANIFESTOR_PY $DEBUG_FLAGS -ae -i $SC_REPORT -c config.json -of markdown -- create > manifest.md
+    $SCANCODE_MANIFESTOR_PY $DEBUG_FLAGS -ae -i $SC_REPORT -c config.json -of html -- create > manifest.html
     if [ $? -ne 0 ]
     then
         echo "Failed (in $(pwd)):"
-        echo "$SCANCODE_MANIFESTOR_PY -ae -i $SC_REPORT -c config.json -of markdown -- create > manifest.md"
-        exit 2
-    fi
-        
-    pandoc manifest.md -o manifest.html
-    if [ $? -ne 0 ]
-    then
-        echo "Failed (in $(pwd)):"
-        echo "pandoc manifest.md -o manifest.html"
+        echo "$SCANCODE_MANIFESTOR_PY -ae -i $SC_REPORT -c config.json -of html -- create > manifest.html"
         exit 2
     fi
 else
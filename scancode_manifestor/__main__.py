@@ -15,6 +15,7 @@
 from argparse import RawTextHelpFormatter
 import argparse
 
+import atexit
 import json
 import os
 import re
@@ -34,6 +35,12 @@ from scancode_manifestor.format_markdown import MarkdownFormatter
 from scancode_manifestor.format_text import TextFormatter
 from scancode_manifestor.format_json import JSONFormatter
 from scancode_manifestor.format_yaml import YamlFormatter
+from scancode_manifestor.format_html import HtmlFormatter
+from scancode_manifestor.scancode_report import ScancodeReportReader
+from scancode_manifestor.file_record import file_records
+from scancode_manifestor.report_cache import ReportCache
+from scancode_manifestor.stage_profiler import StageProfiler
+from scancode_manifestor.filter_stats import FilterStats
 
 from scancode_manifestor.scancode_manifestor_config import scancode_manifestor_version
 
@@ -85,6 +92,7 @@ OUTPUT_FORMAT_TEXT="text"
 OUTPUT_FORMAT_JSON="json"
 OUTPUT_FORMAT_MARKDOWN="markdown"
 OUTPUT_FORMAT_YAML="yaml"
+OUTPUT_FORMAT_HTML="html"
 DEFAULT_OUTPUT_FORMAT=OUTPUT_FORMAT_TEXT
 
 def parse(commands):
@@ -121,6 +129,12 @@ def parse(commands):
                         help='format of output',
                         default=DEFAULT_OUTPUT_FORMAT)
     
+    parser.add_argument('-tpl', '--text-page-lines',
+                        dest='text_page_lines',
+                        type=int,
+                        help='split the files in the text report in pages with this many lines',
+                        default=None)
+    
     parser.add_argument('-fc', '--force-config',
                         action='store_true',
                         dest='forced_config_mode',
@@ -182,6 +196,33 @@ def parse(commands):
                         help='read input from file',
                         default=None)
 
+    parser.add_argument('-cd', '--cache-dir',
+                        dest='cache_dir',
+                        help='cache parsed scancode reports in this directory, later runs on the same report read the cache instead. The cache only holds data (JSON), but a cache in a directory others can write to may give a manifest for a report they changed',
+                        default=None)
+
+    parser.add_argument('-ps', '--profile-stages',
+                        action='store_true',
+                        dest='profile_stages',
+                        help='output time and memory used by each stage (load, filter, transform ...) to stderr',
+                        default=False)
+
+    parser.add_argument('-psf', '--profile-stages-file',
+                        dest='profile_stages_file',
+                        help='write time and memory used by each stage (load, filter, transform ...) as JSON to file',
+                        default=None)
+
+    parser.add_argument('-fs', '--filter-stats',
+                        action='store_true',
+                        dest='filter_stats',
+                        help='output, for each include and exclude expression, the paths tested and matched and the time spent to stderr',
+                        default=False)
+
+    parser.add_argument('-fsf', '--filter-stats-file',
+                        dest='filter_stats_file',
+                        help='write, for each include and exclude expression, the paths tested and matched and the time spent as JSON to file',
+                        default=None)
+
     parser.add_argument('-vf', '--verbose-file',
                         dest='verbose_file',
                         help='outpur all scancode information about file',
@@ -477,6 +518,8 @@ def get_formatter(args, utils):
         return MarkdownFormatter(args, utils)
     elif args['format'].lower() == OUTPUT_FORMAT_YAML:
         return YamlFormatter(args, utils)
+    elif args['format'].lower() == OUTPUT_FORMAT_HTML:
+        return HtmlFormatter(args, utils)
     return None
 
 def main():
@@ -485,6 +528,13 @@ def main():
     parsed_args = parse(commands)
 
     args = parsed_args.__dict__
+
+    # stages are output when the program exits
+    profiler = StageProfiler()
+    if args['profile_stages_file'] != None:
+        atexit.register(profiler.output, args['profile_stages_file'])
+    elif args['profile_stages']:
+        atexit.register(profiler.output, "-")
     
     #print("command line: " + str(sys.argv))
     #print("command line: " + str(parsed_args.mode))
@@ -492,6 +542,15 @@ def main():
 
     logger = ManifestLogger(args['verbose'])
     utils = ManifestUtils(logger)
+
+    # filter statistics are output when the program exits
+    if args['filter_stats_file'] != None or args['filter_stats']:
+        utils.filter_stats = FilterStats()
+        if args['filter_stats_file'] != None:
+            atexit.register(utils.filter_stats.output, args['filter_stats_file'])
+        else:
+            atexit.register(utils.filter_stats.output, "-")
+
     manifestor = ScancodeManifestor(commands, logger, utils)
     formatter = get_formatter(args, utils)
     manifestor._merge_exclude_files(args)
@@ -534,23 +593,43 @@ def main():
     #
     hiders = utils._hiders(args)
     
-    # Open scancode report
-    with open(args['input_file']) as fp:
-        scancode_report = json.load(fp)
-
-    # Setup files map
-    files = manifestor._setup_files(scancode_report['files'])
+    profiler.begin("load")
+
+    # Open scancode report, the files are streamed into the filter
+    if args['cache_dir'] != None and args['verbose_file'] == None:
+        # the cache only keeps the information needed for the manifest
+        reader = ReportCache(args['cache_dir'], logger).reader(args['input_file'])
+    else:
+        reader = ScancodeReportReader(args['input_file'])
+
+    # Setup files map, only keep the full scancode information about
+    # the files if it is to be printed (see FileRecord)
+    if args['verbose_file'] == None:
+        files = manifestor._setup_files(file_records(reader.files()))
+    else:
+        files = manifestor._setup_files(reader.files())
 
     
     #
     # filter files
     #
     #print("reading file file: " + str(args['excluded_file_file']))
+    # the files are read from the report while filtering
+    profiler.begin("filter")
     files = utils._filter(files, args['included_regexps'], args['excluded_regexps'])
     filtered = files
+    if reader.files_count != None:
+        profiler.items(files=reader.files_count['files'], dirs=reader.files_count['dirs'])
+    profiler.items(included=len(files['included']), excluded=len(files['excluded']))
+
+    # headers are picked up while streaming the files
+    scancode_report = {}
+    scancode_report['headers'] = reader.headers()
+    scancode_report['files_count'] = reader.files_count
         
     if args['mode'] == MODE_INTERACTIVE:
         #print("excluded: " + str(args['excluded_regexps']))
+        profiler.begin("interactive")
         interactor = ManifestorInteractor(commands, utils, logger)
         interactor._interact(filtered, args)
         #print("excluded: " + str(args['excluded_regexps']))
@@ -559,6 +638,7 @@ def main():
         #
         # if filter mode - this is the final step in the pipe
         #
+        profiler.begin("output")
         if args['verbose_file']:
             utils._output_verbose_file(files, args['verbose_file'])
         else:
@@ -581,8 +661,10 @@ def main():
     #
     # transform to intermediate format
     #
+    profiler.begin("transform")
     utils._transform_files(filtered)
     transformed = filtered
+    profiler.items(included=len(transformed['included']), excluded=len(transformed['excluded']))
     if args['verbose']:
         logger.verbose("---- transformed files -----")
         utils._output_filtered(transformed, sys.stderr, hiders)
@@ -592,6 +674,7 @@ def main():
     #
     # add curations
     #
+    profiler.begin("curate")
     curations = utils._curate(transformed, args['file_curations'], args['license_curations'], args['missing_license_curation'])
     curated = transformed
     
@@ -599,6 +682,7 @@ def main():
     # Copyright output mode
     #
     if args['mode'] == MODE_COPYRIGHT:
+        profiler.begin("output")
         copyrights = utils.copyrights(curated)
         copyrights_formatted = formatter.format_copyrights(copyrights)
         print(copyrights_formatted)
@@ -608,6 +692,7 @@ def main():
     # License output mode
     #
     if args['mode'] == MODE_LICENSE:
+        profiler.begin("output")
         licenses = utils.licenses(curated['included'])
         print(licenses)
         exit(0)
@@ -615,8 +700,11 @@ def main():
     #
     # validate
     #
+    profiler.begin("report")
     report = utils._report(args, scancode_report, transformed)
+    profiler.begin("validate")
     validation = utils._validate(curated, report, args['outbound_license'])
+    profiler.items(errors=len(validation['errors']))
     if validation['errors'] != []:
         for err in validation['errors']:
             logger.error(err)
@@ -625,6 +713,7 @@ def main():
     # if validate mode - this is the final step in the pipe
     #
     if args['mode'] == MODE_VALIDATE:
+        profiler.begin("output")
         print("Curated and validated files:")
         utils._output_files(curated)
         print("")
@@ -642,16 +731,29 @@ def main():
         exit(0)
 
     if args['mode'] == MODE_CREATE:
-        format_report = formatter.format(report)
-
-        if args['output'] != None:
-            with open(args['output'], "w") as manifest_file:
-                manifest_file.write(format_report) 
+        profiler.begin("format")
+        profiler.items(included=len(report['files']['included']), excluded=len(report['files']['excluded']))
+        if hasattr(formatter, 'format_stream'):
+            # write the report while formatting it
+            if args['output'] != None:
+                with open(args['output'], "w") as manifest_file:
+                    formatter.format_stream(report, manifest_file)
+            else:
+                formatter.format_stream(report, sys.stdout)
+                print("")
         else:
-            print(format_report)
-        
+            format_report = formatter.format(report)
+
+            if args['output'] != None:
+                with open(args['output'], "w") as manifest_file:
+                    manifest_file.write(format_report) 
+            else:
+                print(format_report)
+        # end the stage while the report is still kept, not when
+        # the profiler is output at exit
+        profiler.end()
+
 
-    
 if __name__ == '__main__':
     main()
     
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+from scancode_manifestor.path_matcher import PathMatcher
+
+#
+# Finds the curation of files, for all curations in one pass over the
+# files. The result is the same as curating with one curation at a
+# time (see ManifestUtils._curate_file_license and _curate_license):
+#
+# * a later curation overrides an earlier one
+# * a license curation overrides a file curation
+# * the missing license curation comes last
+#
+# File curations are, in reverse order, put in a PathMatcher so that
+# the first match is the last curation matching a path. License
+# curations are looked up on the file's license expressions.
+#
+class CurationEngine:
+    def __init__(self, file_curations, license_curations, missing_license_curation=None):
+        # (regexp, license) in the order given
+        self.file_curations = self._flatten(file_curations)
+        regexps = [ regexp for regexp, lic in reversed(self.file_curations) ]
+        self.path_matcher = PathMatcher(regexps)
+
+        # license expression => (position, license)
+        self.license_curations = {}
+        self.missing_license = None
+        for position, (expr, lic) in enumerate(self._flatten(license_curations)):
+            if expr == "[]":
+                self.missing_license = lic
+            else:
+                self.license_curations[expr] = (position, lic)
+        if missing_license_curation:
+            self.missing_license = missing_license_curation
+
+    def _flatten(self, curations):
+        flattened = []
+        for curation in curations:
+            if len(curation) < 2:
+                raise ValueError("Bad curation: " + str(curation))
+            lic = curation[len(curation) - 1]
+            for expr in curation[:len(curation) - 1]:
+                flattened.append((expr, lic))
+        return flattened
+
+    #
+    # For each file in files, the file and its curation as a tuple
+    # (curation_type, curation_expr, curated_license), or None if the
+    # file is not curated
+    #
+    def curations(self, files):
+        file_matches = [ None ] * len(files)
+        if self.file_curations:
+            file_matches = self.path_matcher.first_matches([ f['path'] for f in files ])
+
+        last = len(self.file_curations) - 1
+        for f, index in zip(files, file_matches):
+            curation = self._license_curation(f)
+            if curation is None and index is not None:
+                regexp, lic = self.file_curations[last - index]
+                curation = ('file', regexp, "(" + lic + ")")
+            yield f, curation
+
+    def _license_curation(self, f):
+        expressions = f['license_expressions']
+        if len(expressions) == 0:
+            if self.missing_license is None:
+                return None
+            return ('license', "[]", "(" + self.missing_license + ")")
+
+        # the last curation of any of the file's expressions
+        found = None
+        for expr in expressions:
+            curation = self.license_curations.get(expr)
+            if curation is not None and (found is None or curation[0] > found[1][0]):
+                found = (expr, curation)
+        if found is None:
+            return None
+
+        curated_expr, (position, lic) = found
+        curated_license = ""
+        for expr in expressions:
+            if curated_license != "":
+                curated_license += " AND "
+            if expr == curated_expr:
+                curated_license += lic
+            else:
+                curated_license += expr
+        return ('license', curated_expr, "(" + curated_license + ")")
@@ -0,0 +1,179 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import sys
+
+#
+# A file (or dir) in a scancode report holds a lot of information not
+# used by the manifestor, e.g. every license match with its rule and
+# line numbers. A FileRecord keeps only what the manifestor uses, in
+# slots instead of a dict.
+#
+# Both FileRecord and ManifestorData can be used as the dicts they
+# replace, e.g. f['path'] and f['scancode_manifestor']['license_key'],
+# so the rest of the manifestor works with scancode dicts (as in the
+# tests) as well as with records.
+#
+
+class _SlotMap:
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self.__slots__ and hasattr(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [ key for key in self.__slots__ if hasattr(self, key) ]
+
+    def items(self):
+        return [ (key, getattr(self, key)) for key in self.keys() ]
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+#
+# manifestor information added to a file (see manifestor_utils.py),
+# an unset slot is the same as a missing key
+#
+class ManifestorData(_SlotMap):
+    __slots__ = ('filter_type', 'filter_expr', 'filter_action',
+                 'license_key', 'license_spdx', 'copyright',
+                 'curation_type', 'curation_expr', 'curated_license')
+
+    def to_dict(self):
+        return dict(self.items())
+
+
+class FileRecord(_SlotMap):
+    __slots__ = ('path', 'name', 'type', 'file_type',
+                 'license_expressions', 'spdx_license_keys', 'copyright_values',
+                 'scancode_manifestor')
+
+    def __init__(self, path, name, file_type, scancode_file_type, license_expressions, spdx_license_keys, copyright_values):
+        self.path = path
+        self.name = name
+        self.type = file_type
+        self.file_type = scancode_file_type
+        self.license_expressions = license_expressions
+        self.spdx_license_keys = spdx_license_keys
+        self.copyright_values = copyright_values
+
+    # same as the scancode dict the record was created from, with the
+    # manifestor information
+    def to_dict(self):
+        f = {}
+        f['path'] = self.path
+        f['name'] = self.name
+        f['type'] = self.type
+        f['file_type'] = self.file_type
+        f['license_expressions'] = list(self.license_expressions)
+        f['licenses'] = [ { 'spdx_license_key': key } for key in self.spdx_license_keys ]
+        f['copyrights'] = [ { 'value': c } for c in self.copyright_values ]
+        if 'scancode_manifestor' in self:
+            f['scancode_manifestor'] = self.scancode_manifestor.to_dict()
+        return f
+
+
+#
+# Creates FileRecords. Many files have the same licenses, so equal
+# license tuples (and strings) are shared between the records. The
+# copyrights of a file are seldom the same as another file's, but
+# the copyright strings are, so only the strings are shared.
+#
+class FileRecordFactory:
+    def __init__(self):
+        self.shared = {}
+
+    def _share(self, values):
+        values = tuple(values)
+        return self.shared.setdefault(values, values)
+
+    def _intern(self, value):
+        if value is None:
+            return None
+        return sys.intern(value)
+
+    def record(self, path, name, file_type, scancode_file_type, license_expressions, spdx_license_keys, copyrights):
+        return FileRecord(path,
+                          name,
+                          self._intern(file_type),
+                          self._intern(scancode_file_type),
+                          self._share([ self._intern(lic) for lic in license_expressions ]),
+                          self._share([ self._intern(key) for key in spdx_license_keys ]),
+                          tuple([ self._intern(c) for c in copyrights ]))
+
+    def from_scancode(self, f):
+        return self.record(f['path'],
+                           f['name'],
+                           f['type'],
+                           f['file_type'],
+                           f['license_expressions'],
+                           [ lic['spdx_license_key'] for lic in f['licenses'] ],
+                           [ c['value'] for c in f['copyrights'] ])
+
+#
+# FileRecords for the files (scancode dicts) in files
+#
+def file_records(files):
+    factory = FileRecordFactory()
+    for f in files:
+        if isinstance(f, FileRecord):
+            yield f
+        else:
+            yield factory.from_scancode(f)
+
+def spdx_license_keys(f):
+    if isinstance(f, FileRecord):
+        return f.spdx_license_keys
+    return [ lic['spdx_license_key'] for lic in f['licenses'] ]
+
+def copyright_values(f):
+    if isinstance(f, FileRecord):
+        return f.copyright_values
+    return [ c['value'] for c in f['copyrights'] ]
+
+def manifestor_data(f):
+    if isinstance(f, FileRecord):
+        return ManifestorData()
+    return {}
+
+def to_dict(f):
+    if isinstance(f, (FileRecord, ManifestorData)):
+        return f.to_dict()
+    raise TypeError("Object of type " + type(f).__name__ + " is not JSON serializable")
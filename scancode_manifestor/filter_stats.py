@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import json
+import sys
+import time
+
+from scancode_manifestor.manifestor_utils import FilterAction_to_string
+from scancode_manifestor.manifestor_utils import FilterAttribute_to_string
+
+#
+# Statistics about the filter expressions, collected while filtering
+# (see ManifestUtils._filter and _filter_generic) if
+# ManifestUtils.filter_stats is set. For each expression:
+#
+# * tested  - number of paths (or files) the expression was tried on
+# * matched - number of paths (or files) the expression decided, i.e.
+#             the first expression matching the path
+# * time    - time (seconds) spent trying the expression
+#
+# An include or exclude file expression is not tried on the paths
+# the literal prefilter rules out (see path_matcher.py), and not on
+# the paths below a directory it matched, so tested can be a lot
+# lower than the number of files (and even lower than matched).
+#
+# An expression that never matches can be removed, an expression
+# matching a lot can be moved first and an expression with a high
+# time per tested path is probably backtracking.
+#
+class FilterStats:
+    def __init__(self):
+        # (attribute, action, expression) => stats
+        self.patterns = {}
+
+    def pattern(self, attribute, action, regexp):
+        key = (attribute, action, regexp)
+        stats = self.patterns.get(key)
+        if stats is None:
+            stats = { 'attribute': attribute, 'action': action, 'expression': regexp, 'tested': 0, 'matched': 0, 'time': 0.0 }
+            self.patterns[key] = stats
+        return stats
+
+    # search, also counting the paths tried and the time spent in stats
+    def timed(self, stats, search):
+        def timed_search(path):
+            start = time.perf_counter()
+            found = search(path)
+            stats['time'] += time.perf_counter() - start
+            stats['tested'] += 1
+            return found
+        return timed_search
+
+    # the expressions, most time spent first
+    def to_list(self):
+        patterns = sorted(self.patterns.values(), key=lambda stats: stats['time'], reverse=True)
+        res = []
+        for stats in patterns:
+            stats = dict(stats)
+            stats['attribute'] = FilterAttribute_to_string(stats['attribute'])
+            stats['action'] = FilterAction_to_string(stats['action'])
+            res.append(stats)
+        return res
+
+    def write(self, stream):
+        stream.write("%12s %10s %10s  %-8s %-10s %s\n" % ("time (ms)", "tested", "matched", "action", "attribute", "expression"))
+        for stats in self.to_list():
+            stream.write("%12.3f %10d %10d  %-8s %-10s %s\n" % (stats['time'] * 1000, stats['tested'], stats['matched'], stats['action'], stats['attribute'], stats['expression']))
+
+    #
+    # Write the statistics, to stderr if file_name is "-", otherwise as
+    # JSON to the file
+    #
+    def output(self, file_name):
+        if file_name == "-":
+            self.write(sys.stderr)
+        else:
+            with open(file_name, "w") as fp:
+                json.dump(self.to_list(), fp, indent=4)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+# /usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import html
+import io
+import json
+import re
+
+from scancode_manifestor.format_markdown import MarkdownFormatter
+
+# top level list items in each <details> group
+DETAILS_CHUNK_SIZE = 1000
+
+HEADER_RE = re.compile("^(#+) (.*)$")
+LIST_ITEM_RE = re.compile("^( *)\\* (.*)$")
+# html in the markdown report, e.g. <a name="\.h$">\.h$</a>
+ANCHOR_RE = re.compile("(<a name=\".*?\">|</a>)")
+# [text](url), the url may have (non nested) parentheses
+LINK_RE = re.compile("\\[([^\\]]*)\\]\\(((?:[^()]|\\([^()]*\\))*)\\)")
+BOLD_ITALIC_RE = re.compile("\\*\\*\\*(.+?)\\*\\*\\*")
+
+#
+# A stream converting the Markdown written to it, by MarkdownFormatter,
+# to HTML written to out. Only what MarkdownFormatter writes is
+# converted: headers, (nested) lists, links, emphasis and the html
+# used in the report. The lines are converted as they are written.
+#
+# Long lists in <details> are split in several <details>, with at most
+# DETAILS_CHUNK_SIZE top level items each, so that a browser only has
+# to show one chunk at a time.
+#
+class _MarkdownHtmlStream:
+    def __init__(self, out):
+        self.out = out
+        self.pending = ""
+        # indentation of the open lists
+        self.lists = []
+        self.pre = False
+        self.details = None
+        self.summary = None
+        self.chunk_items = 0
+        self.chunk = 1
+
+    def write(self, s):
+        self.pending += s
+        if "\n" not in s:
+            return
+        lines = self.pending.split("\n")
+        self.pending = lines.pop()
+        for line in lines:
+            self._line(line)
+
+    def close(self):
+        if self.pending != "":
+            self._line(self.pending)
+            self.pending = ""
+        self._close_lists()
+
+    def _inline(self, text):
+        res = ""
+        for part in ANCHOR_RE.split(text):
+            if ANCHOR_RE.fullmatch(part):
+                res += part
+                continue
+            part = html.escape(part, quote=False)
+            part = LINK_RE.sub(lambda m: "<a href=\"" + m.group(2).replace("\"", "&quot;") + "\">" + m.group(1) + "</a>", part)
+            part = BOLD_ITALIC_RE.sub(lambda m: "<strong><em>" + m.group(1) + "</em></strong>", part)
+            res += part
+        return res
+
+    def _close_lists(self, indent=-1):
+        while self.lists and self.lists[-1] > indent:
+            self.out.write("</li>\n</ul>\n")
+            self.lists.pop()
+
+    def _list_item(self, indent, text):
+        if self.details is not None and (not self.lists or indent <= self.lists[0]):
+            if self.chunk_items == DETAILS_CHUNK_SIZE:
+                self._next_chunk()
+            self.chunk_items += 1
+
+        self._close_lists(indent)
+        if self.lists and self.lists[-1] == indent:
+            self.out.write("</li>\n")
+        else:
+            self.out.write("<ul>\n")
+            self.lists.append(indent)
+        self.out.write("<li>" + self._inline(text))
+
+    def _next_chunk(self):
+        self._close_lists()
+        self.chunk += 1
+        self.chunk_items = 0
+        self.out.write("</details>\n")
+        self.out.write(self.details + "\n")
+        self.out.write("<summary>" + self.summary + " (part " + str(self.chunk) + ")</summary>\n")
+
+    def _html(self, line):
+        self._close_lists()
+        if line.startswith("<details"):
+            self.details = line
+            self.summary = ""
+            self.chunk_items = 0
+            self.chunk = 1
+        elif line.startswith("<summary>") and line.endswith("</summary>"):
+            self.summary = line[len("<summary>"):-len("</summary>")]
+        elif line.startswith("</details>"):
+            self.details = None
+        self.out.write(line + "\n")
+
+    def _line(self, line):
+        if self.pre:
+            self.out.write(line + "\n")
+            self.pre = (line != "</pre>")
+            return
+
+        if line.strip() == "":
+            return
+
+        match = LIST_ITEM_RE.match(line)
+        if match:
+            self._list_item(len(match.group(1)), match.group(2))
+            return
+
+        if line.startswith("<"):
+            self.pre = (line == "<pre>")
+            self._html(line)
+            return
+
+        self._close_lists()
+        match = HEADER_RE.match(line)
+        if match:
+            level = str(len(match.group(1)))
+            self.out.write("<h" + level + ">" + self._inline(match.group(2)) + "</h" + level + ">\n")
+        elif line.startswith("*") and line.endswith("*") and len(line) > 2:
+            self.out.write("<p><em>" + self._inline(line[1:-1]) + "</em></p>\n")
+        else:
+            self.out.write("<p>" + self._inline(line.strip()) + "</p>\n")
+
+
+class _HtmlMarkdownFormatter(MarkdownFormatter):
+    def _settings(self, report, out):
+        out.write("<pre>\n" + html.escape(json.dumps(report['meta'], indent=4), quote=False) + "\n</pre>\n")
+
+
+#
+# HTML report with the same sections as the Markdown report. The
+# Markdown report is converted to HTML while it is written, instead of
+# converting a Markdown file afterwards (e.g. with pandoc).
+#
+class HtmlFormatter:
+
+    def __init__(self, args, utils):
+        self.utils = utils
+        self.args = args
+
+    def format(self, report):
+        out = io.StringIO()
+        self.format_stream(report, out)
+        return out.getvalue()
+
+    def format_stream(self, report, out):
+        out.write("<!DOCTYPE html>\n")
+        out.write("<html>\n")
+        out.write("<head>\n")
+        out.write("<meta charset=\"utf-8\">\n")
+        out.write("<title>Scancode manifestor report</title>\n")
+        out.write("</head>\n")
+        out.write("<body>\n")
+        stream = _MarkdownHtmlStream(out)
+        _HtmlMarkdownFormatter(self.args, self.utils).format_stream(report, stream)
+        stream.close()
+        out.write("</body>\n")
+        out.write("</html>\n")
@@ -12,16 +12,81 @@
 #
 ###################################################################
 
+from enum import Enum
+import io
 import json
 
+from scancode_manifestor.file_record import to_dict
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import FilterAction_to_string
+from scancode_manifestor.manifestor_utils import FilterAttribute
+from scancode_manifestor.manifestor_utils import FilterAttribute_to_string
+
+#
+# JSON for the values json can not encode: FileRecords (see
+# file_record.py) and the filter enums in the manifestor information,
+# which are encoded as in the Markdown report (e.g. "file" and
+# "exclude")
+#
+def json_default(o):
+    if isinstance(o, FilterAttribute):
+        return FilterAttribute_to_string(o)
+    if isinstance(o, FilterAction):
+        return FilterAction_to_string(o)
+    if isinstance(o, Enum):
+        return o.name.lower()
+    return to_dict(o)
+
 class JSONFormatter:
 
     def __init__(self, args, utils):
         self.utils = utils
         self.args = args
 
+    def _dumps(self, value):
+        return json.dumps(value, default=json_default)
+
     def format(self, report):
-        return str(json.dumps(report))
+        out = io.StringIO()
+        self.format_stream(report, out)
+        return out.getvalue()
+
+    #
+    # Write the report to out, the same as json.dumps(report) but with
+    # the files encoded and written one at a time, so that the JSON for
+    # all files is never in memory
+    #
+    def format_stream(self, report, out):
+        out.write("{")
+        separator = ""
+        for key, value in report.items():
+            out.write(separator + self._dumps(key) + ": ")
+            if key == 'files':
+                self._write_files(value, out)
+            else:
+                out.write(self._dumps(value))
+            separator = ", "
+        out.write("}")
+
+    def _write_files(self, files, out):
+        out.write("{")
+        separator = ""
+        for key, value in files.items():
+            out.write(separator + self._dumps(key) + ": ")
+            if isinstance(value, list):
+                self._write_list(value, out)
+            else:
+                out.write(self._dumps(value))
+            separator = ", "
+        out.write("}")
+
+    def _write_list(self, values, out):
+        out.write("[")
+        separator = ""
+        for value in values:
+            out.write(separator + self._dumps(value))
+            separator = ", "
+        out.write("]")
 
     def format_copyrights(self, copyrights):
         value = []
@@ -29,3 +94,4 @@ class JSONFormatter:
         for c_line in copyrights:
             value.append(c_line + "\n")
         return json.dumps({ key:"".join(value) })
+    
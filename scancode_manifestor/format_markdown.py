@@ -12,6 +12,7 @@
 
 import datetime
 import getpass
+import io
 import json
 import os
 import sys
@@ -76,54 +77,58 @@ class MarkdownFormatter:
         res += "\n\n"
         return res
     
-    def _excluded_files(self, report):
+    #
+    # The files (in files) filtered on path, per filter expression. Built
+    # once, instead of looking at every file for every expression.
+    #
+    def _filter_expr_files(self, files):
+        expr_files = {}
+        for f in files:
+            if f['type'] == 'file':
+                manifestor_map = f['scancode_manifestor']
+                if 'filter_type' in manifestor_map and manifestor_map['filter_type'] == FilterAttribute.PATH:
+                    expr_files.setdefault(manifestor_map['filter_expr'], []).append(f)
+        return expr_files
+
+    def _excluded_files(self, report, out):
         files = report['files']['excluded']
         
-        res = "<a name=\"" + scancode_manifestor.explanations.EXCLUDED_FILES_HEADER + "\"></a>\n\n"
-        res += "# 5 " + scancode_manifestor.explanations.EXCLUDED_FILES_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.EXCLUDED_FILES_HEADER + "\"></a>\n\n")
+        out.write("# 5 " + scancode_manifestor.explanations.EXCLUDED_FILES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.EXCLUDED_FILES_EXPLANATION + "*"
-            res += "\n\n"
+            out.write("*" + scancode_manifestor.explanations.EXCLUDED_FILES_EXPLANATION + "*")
+            out.write("\n\n")
             
-        res += "<a name=\"" + scancode_manifestor.explanations.EXCLUDED_FILES_FILTERS_HEADER + "\"></a>\n\n"
-        res += "### 5.1 " + scancode_manifestor.explanations.EXCLUDED_FILES_FILTERS_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.EXCLUDED_FILES_FILTERS_HEADER + "\"></a>\n\n")
+        out.write("### 5.1 " + scancode_manifestor.explanations.EXCLUDED_FILES_FILTERS_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.EXCLUDED_FILES_FILTERS_EXPLANATION + "*"
-            res += "\n\n"
-        res += self._collapse_begin()        
+            out.write("*" + scancode_manifestor.explanations.EXCLUDED_FILES_FILTERS_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(self._collapse_begin())
+        filter_expr_files = self._filter_expr_files(files)
         for re_list in report["meta"]["arguments"]["excluded_regexps"]:
             for re in re_list:
-                res += str(" * <a name=\"" + re + "\">" + re + "</a>\n\n" )
-                for f in files:
-                    if f['type'] == "file":
-                        #print("--------")
-                        manifestor_map = f['scancode_manifestor']
-                        #print("f: " + str(f['path']) + " " + str(f['type']) + " " + str(manifestor_map['filter_type']) + " " + str(manifestor_map['filter_expr']) + "== " + str(re) + "<br>")
-                        if f['type'] == 'file':
-                            #res += " file"
-                            if manifestor_map['filter_type'] == FilterAttribute.PATH:
-                                #res+=" filter"
-                                if re == manifestor_map['filter_expr']:
-                                    res += "    * " + self._file_url(f) +  "\n\n"
-                res += "\n\n"
-        res += self._collapse_end()        
+                out.write(str(" * <a name=\"" + re + "\">" + re + "</a>\n\n" ))
+                for f in filter_expr_files.get(re, []):
+                    out.write("    * " + self._file_url(f) +  "\n\n")
+                out.write("\n\n")
+        out.write(self._collapse_end())
                 
-        res += "\n\n"
-        res += "<a name=\"" + scancode_manifestor.explanations.EXCLUDED_FILES_FILES_HEADER + "\"></a>\n\n"
-        res += "### 5.2 " + scancode_manifestor.explanations.EXCLUDED_FILES_FILES_HEADER
-        res += "\n\n"
+        out.write("\n\n")
+        out.write("<a name=\"" + scancode_manifestor.explanations.EXCLUDED_FILES_FILES_HEADER + "\"></a>\n\n")
+        out.write("### 5.2 " + scancode_manifestor.explanations.EXCLUDED_FILES_FILES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.EXCLUDED_FILES_FILES_EXPLANATION + "*"
-            res += "\n\n"
-        res += self._collapse_begin()        
+            out.write("*" + scancode_manifestor.explanations.EXCLUDED_FILES_FILES_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(self._collapse_begin())
         for f in files:
             if f['type'] == 'file':
-                res += self._excluded_file(f) + "\n\n"
-        res += self._collapse_end()        
+                out.write(self._excluded_file(f) + "\n\n")
+        out.write(self._collapse_end())
 
-        return res
 
     def _included_file(self, f, indent=""):
         res = indent + " * " + self._file_url(f)
@@ -182,28 +187,28 @@ class MarkdownFormatter:
             pass
         return res 
 
-    def _curated_files(self, report):
+    def _curated_files(self, report, out):
         files = report['files']['included']
-        res = "<a name=\"" + scancode_manifestor.explanations.CURATED_FILES_HEADER + "\"></a>\n\n"
-        res += "# 7 " + scancode_manifestor.explanations.CURATED_FILES_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.CURATED_FILES_HEADER + "\"></a>\n\n")
+        out.write("# 7 " + scancode_manifestor.explanations.CURATED_FILES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.CURATED_FILES_EXPLANATION + "*"
-            res += "\n\n"
-        res += "<a name=\"" + scancode_manifestor.explanations.CURATED_FILES_FILE_HEADER + "\"></a>\n\n"
-        res += "### 7.1 " + scancode_manifestor.explanations.CURATED_FILES_FILE_HEADER
-        res += "\n\n"
+            out.write("*" + scancode_manifestor.explanations.CURATED_FILES_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write("<a name=\"" + scancode_manifestor.explanations.CURATED_FILES_FILE_HEADER + "\"></a>\n\n")
+        out.write("### 7.1 " + scancode_manifestor.explanations.CURATED_FILES_FILE_HEADER)
+        out.write("\n\n")
         
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.CURATED_FILES_FILE_EXPLANATION + "*"
-            res += "\n\n"
-        res += "\n\n"
-        res += self._collapse_begin()
+            out.write("*" + scancode_manifestor.explanations.CURATED_FILES_FILE_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write("\n\n")
+        out.write(self._collapse_begin())
 
         for curation in report['meta']['arguments']['file_curations']:
             curation_expr = curation[:-1]
             curation_license = curation[-1]
-            res += " * " + str(curation_expr) + "\n\n"
+            out.write(" * " + str(curation_expr) + "\n\n")
             for f in files:
                 if f['type'] == 'file':
                     assert 'scancode_manifestor' in f
@@ -215,19 +220,19 @@ class MarkdownFormatter:
                             c_type = manifestor_map['curation_type']
                             c_expr = manifestor_map['curation_expr']
                             if c_type == 'file':
-                                res += "    * " + self._file_name_url(f['path']) + "\n\n"
-                                res += "        * ***original license:*** " + str(o_license) + "\n\n" 
-                                res += "        * ***curated license:*** \"" +  curation_license + "\n\n" 
+                                out.write("    * " + self._file_name_url(f['path']) + "\n\n")
+                                out.write("        * ***original license:*** " + str(o_license) + "\n\n")
+                                out.write("        * ***curated license:*** \"" +  curation_license + "\n\n")
                     
-        res += self._collapse_end()        
+        out.write(self._collapse_end())
 
-        res += "<a name=\"" + scancode_manifestor.explanations.CURATED_FILES_MISSING_HEADER + "\"></a>\n\n"
-        res += "### 7.2 " + scancode_manifestor.explanations.CURATED_FILES_MISSING_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.CURATED_FILES_MISSING_HEADER + "\"></a>\n\n")
+        out.write("### 7.2 " + scancode_manifestor.explanations.CURATED_FILES_MISSING_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.CURATED_FILES_MISSING_EXPLANATION + "*"
-            res += "\n\n"
-        res += self._collapse_begin()        
+            out.write("*" + scancode_manifestor.explanations.CURATED_FILES_MISSING_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(self._collapse_begin())
         curation_license = report['meta']['arguments']['missing_license_curation']
         for f in files:
             if f['type'] == 'file':
@@ -244,48 +249,40 @@ class MarkdownFormatter:
                         #print("   \"" + c_type + "\"", file=sys.stderr)
                         #print("   \"" + c_expr + "\"", file=sys.stderr)
                         if c_type == 'license' and c_expr == "[]":
-                            res += " * " + self._file_name_url(f['path']) + "\n\n"
-                            res += "     * ***curated license:*** \"" +  curation_license + "\"\n\n" 
-        res += self._collapse_end()        
+                            out.write(" * " + self._file_name_url(f['path']) + "\n\n")
+                            out.write("     * ***curated license:*** \"" +  curation_license + "\"\n\n")
+        out.write(self._collapse_end())
 
-        return res
         
 
-    def _included_files(self, report):
+    def _included_files(self, report, out):
         files = report['files']['included']
 
-        res = "<a name=\"" + scancode_manifestor.explanations.INCLUDED_FILES_HEADER + "\"></a>\n\n"
-        res += "# 6 " + scancode_manifestor.explanations.INCLUDED_FILES_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.INCLUDED_FILES_HEADER + "\"></a>\n\n")
+        out.write("# 6 " + scancode_manifestor.explanations.INCLUDED_FILES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.INCLUDED_FILES_EXPLANATION + "*"
-            res += "\n\n"
+            out.write("*" + scancode_manifestor.explanations.INCLUDED_FILES_EXPLANATION + "*")
+            out.write("\n\n")
             
-        res += "<a name=\"" + scancode_manifestor.explanations.INCLUDED_FILES_FILTERS_HEADER + "\"></a>\n\n"
-        res += "### 6.1 " + scancode_manifestor.explanations.INCLUDED_FILES_FILTERS_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.INCLUDED_FILES_FILTERS_HEADER + "\"></a>\n\n")
+        out.write("### 6.1 " + scancode_manifestor.explanations.INCLUDED_FILES_FILTERS_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.INCLUDED_FILES_FILTERS_EXPLANATION + "*"
-            res += "\n\n"
-        res += self._collapse_begin()
+            out.write("*" + scancode_manifestor.explanations.INCLUDED_FILES_FILTERS_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(self._collapse_begin())
 
         # Iterate through all included regexpes
+        filter_expr_files = self._filter_expr_files(files)
         for re_list in report["meta"]["arguments"]["included_regexps"]:
             for re in re_list:
-                res += str(" * <a name=\"" + re + "\"></a>" + re + "\n\n" )
-                for f in files:
-                    if f['type'] == "file":
-                        #print("--------")
-                        manifestor_map = f['scancode_manifestor']
-                        if f['type'] == 'file':
-                            #res += " file"
-                            if 'filter_type' in manifestor_map and  manifestor_map['filter_type'] == FilterAttribute.PATH:
-                                #res+=" filter"
-                                if re == manifestor_map['filter_expr']:
-                                    res += "    * " + self._file_url(f) +  "\n\n"
-                res += "\n\n"
+                out.write(str(" * <a name=\"" + re + "\"></a>" + re + "\n\n" ))
+                for f in filter_expr_files.get(re, []):
+                    out.write("    * " + self._file_url(f) +  "\n\n")
+                out.write("\n\n")
         # Find all files neither included or excluded
-        res += str(" * Included by default (not excluded)\n\n" )
+        out.write(str(" * Included by default (not excluded)\n\n" ))
         for f in files:
             if f['type'] == "file":
                 #print("--------")
@@ -294,23 +291,22 @@ class MarkdownFormatter:
                     #res += " file"
                     if 'filter_type' not in manifestor_map:
                         #res += "    * " + self._file_url(f) +  "\n\n"
-                        res += self._included_file(f, "    ") +  "\n\n"
+                        out.write(self._included_file(f, "    ") +  "\n\n")
         
-        res += self._collapse_end()        
+        out.write(self._collapse_end())
 
-        res += "<a name=\"" + scancode_manifestor.explanations.INCLUDED_FILES_FILES_HEADER + "\"></a>\n\n"
-        res += "### 6.2 " + scancode_manifestor.explanations.INCLUDED_FILES_FILES_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.INCLUDED_FILES_FILES_HEADER + "\"></a>\n\n")
+        out.write("### 6.2 " + scancode_manifestor.explanations.INCLUDED_FILES_FILES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.INCLUDED_FILES_FILES_EXPLANATION + "*"
-            res += "\n\n"
-        res += self._collapse_begin()        
+            out.write("*" + scancode_manifestor.explanations.INCLUDED_FILES_FILES_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(self._collapse_begin())
         for f in files:
             if f['type'] == 'file':
-                res += self._included_file(f)+ "\n\n"
-        res += self._collapse_end()        
+                out.write(self._included_file(f)+ "\n\n")
+        out.write(self._collapse_end())
 
-        return res
 
     def _add_to_lic_file_map(self, f):
         lic = f['scancode_manifestor']['license_key']
@@ -342,16 +338,16 @@ class MarkdownFormatter:
 
 
         
-    def _license_summary(self, report):
+    def _license_summary(self, report, out):
         # List files per  license (regardless whether included or excluded)
         combined_license_files = {}
         
-        res  = "<a name=\"" + scancode_manifestor.explanations.LICENSES_HEADER + "\"></a>\n\n"
-        res += "# 4 " + scancode_manifestor.explanations.LICENSES_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.LICENSES_HEADER + "\"></a>\n\n")
+        out.write("# 4 " + scancode_manifestor.explanations.LICENSES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.LICENSES_EXPLANATION + "*"
-            res += "\n\n"
+            out.write("*" + scancode_manifestor.explanations.LICENSES_EXPLANATION + "*")
+            out.write("\n\n")
 
         # find included files' license
         for f in report['files']['included']:
@@ -369,89 +365,88 @@ class MarkdownFormatter:
         
             
         # all licenses with and files
-        res += "<a name=\"" + scancode_manifestor.explanations.LICENSES_ALL_FILES_HEADER + "\"></a>\n\n"
-        res += "## 4.1 " + scancode_manifestor.explanations.LICENSES_ALL_FILES_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.LICENSES_ALL_FILES_HEADER + "\"></a>\n\n")
+        out.write("## 4.1 " + scancode_manifestor.explanations.LICENSES_ALL_FILES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.LICENSES_ALL_FILES_EXPLANATION + "*"
-            res += "\n\n"
-        res += self._collapse_begin()
+            out.write("*" + scancode_manifestor.explanations.LICENSES_ALL_FILES_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(self._collapse_begin())
         for k,v in combined_license_files.items():
-            res += " * " + str(k)
-            res += "\n\n"
+            out.write(" * " + str(k))
+            out.write("\n\n")
             for f in v:
-                res += "    * " + self._file_name_url(f)
-                res += "\n\n"
-        res += self._collapse_end()
+                out.write("    * " + self._file_name_url(f))
+                out.write("\n\n")
+        out.write(self._collapse_end())
             
         # included files
-        res += "<a name=\"" + scancode_manifestor.explanations.LICENSES_INCLUDED_FILES_HEADER + "\"></a>\n\n"
-        res += "## 4.2 " + scancode_manifestor.explanations.LICENSES_INCLUDED_FILES_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.LICENSES_INCLUDED_FILES_HEADER + "\"></a>\n\n")
+        out.write("## 4.2 " + scancode_manifestor.explanations.LICENSES_INCLUDED_FILES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.LICENSES_INCLDUED_EXPLANATION + "*"
-            res += "\n\n"
-        res += self._collapse_begin_open()
+            out.write("*" + scancode_manifestor.explanations.LICENSES_INCLDUED_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(self._collapse_begin_open())
         for k,v in self.incl_lic_file.items():
-            res += " * " + str(k)
-            res += "\n\n"
+            out.write(" * " + str(k))
+            out.write("\n\n")
             for f in v:
-                res += "    * " + self._file_url(f)
-                res += "\n\n"
-        res += self._collapse_end()
+                out.write("    * " + self._file_url(f))
+                out.write("\n\n")
+        out.write(self._collapse_end())
         
         # excluded files
-        res += "<a name=\"" + scancode_manifestor.explanations.LICENSES_EXCLUDED_FILES_HEADER + "\"></a>\n\n"
-        res += "## 4.3 " + scancode_manifestor.explanations.LICENSES_EXCLUDED_FILES_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.LICENSES_EXCLUDED_FILES_HEADER + "\"></a>\n\n")
+        out.write("## 4.3 " + scancode_manifestor.explanations.LICENSES_EXCLUDED_FILES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.LICENSES_EXCLDUED_EXPLANATION + "*"
-            res += "\n\n"
-        res += self._collapse_begin()
+            out.write("*" + scancode_manifestor.explanations.LICENSES_EXCLDUED_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(self._collapse_begin())
         for k,v in self.excl_lic_file.items():
-            res += " * " + k
-            res += "\n\n"
+            out.write(" * " + k)
+            out.write("\n\n")
             for f in v:
-                res += "    * " + self._file_url(f)
-                res += "\n\n"
-        res += self._collapse_end()
-        return res
+                out.write("    * " + self._file_url(f))
+                out.write("\n\n")
+        out.write(self._collapse_end())
     
-    def _conclusion_summary(self, report):
+    def _conclusion_summary(self, report, out):
         if self.args['no_conclusion']:
-            return ""
+            return
         
-        res = "<a name=\"" + scancode_manifestor.explanations.CONCLUSION_HEADER + "\"></a>\n\n"
-        res += "# 3 " + scancode_manifestor.explanations.CONCLUSION_HEADER
-        res += "\n\n"
+        out.write("<a name=\"" + scancode_manifestor.explanations.CONCLUSION_HEADER + "\"></a>\n\n")
+        out.write("# 3 " + scancode_manifestor.explanations.CONCLUSION_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.CONCLUSION_EXPLANATION + "*"
-            res += "\n\n"
+            out.write("*" + scancode_manifestor.explanations.CONCLUSION_EXPLANATION + "*")
+            out.write("\n\n")
             
-        res += "<a name=\"" + scancode_manifestor.explanations.CONCLUSION_COPYRIGHTS_HEADER + "\"></a>\n\n"
-        res += "## 3.1 "  + scancode_manifestor.explanations.CONCLUSION_COPYRIGHTS_HEADER
-        res += "\n\n"
-        res += self._collapse_begin(False, "Click to expand list of copyright holders")
+        out.write("<a name=\"" + scancode_manifestor.explanations.CONCLUSION_COPYRIGHTS_HEADER + "\"></a>\n\n")
+        out.write("## 3.1 "  + scancode_manifestor.explanations.CONCLUSION_COPYRIGHTS_HEADER)
+        out.write("\n\n")
+        out.write(self._collapse_begin(False, "Click to expand list of copyright holders"))
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.CONCLUSION_COPYRIGHTS_EXPLANATION + "*"
-            res += "\n\n"
+            out.write("*" + scancode_manifestor.explanations.CONCLUSION_COPYRIGHTS_EXPLANATION + "*")
+            out.write("\n\n")
         for c in report['conclusion']['copyright']:
-            res += " * " + str(c)
-            res += "\n\n"
-        res += self._collapse_end()
-        res += "*Note: the copyright holders listed here may not be complete*"
-        res += "\n\n"
-
-        res += "<a name=\"" + scancode_manifestor.explanations.CONCLUSION_LICENSES_HEADER + "\"></a>\n\n"
-        res += "## 3.2 "  + scancode_manifestor.explanations.CONCLUSION_LICENSES_HEADER
-        res += "\n\n"
+            out.write(" * " + str(c))
+            out.write("\n\n")
+        out.write(self._collapse_end())
+        out.write("*Note: the copyright holders listed here may not be complete*")
+        out.write("\n\n")
+
+        out.write("<a name=\"" + scancode_manifestor.explanations.CONCLUSION_LICENSES_HEADER + "\"></a>\n\n")
+        out.write("## 3.2 "  + scancode_manifestor.explanations.CONCLUSION_LICENSES_HEADER)
+        out.write("\n\n")
         if self.args['add_explanations']:
-            res += "*" + scancode_manifestor.explanations.CONCLUSION_LICENSES_EXPLANATION + "*"
-            res += "\n\n"
-        res += " * ***Original***: " + str(report['conclusion']['license_expression_original'])
-        res += "\n\n"
-        res += " * ***Simplified***: " + str(report['conclusion']['license_expression'])
-        res += "\n\n"
+            out.write("*" + scancode_manifestor.explanations.CONCLUSION_LICENSES_EXPLANATION + "*")
+            out.write("\n\n")
+        out.write(" * ***Original***: " + str(report['conclusion']['license_expression_original']))
+        out.write("\n\n")
+        out.write(" * ***Simplified***: " + str(report['conclusion']['license_expression']))
+        out.write("\n\n")
 
         #res += "## 7.3 "  + scancode_manifestor.explanations.CONCLUSION_INCLUDED_LICENSES_HEADER
         #res += "\n\n"
@@ -462,7 +457,6 @@ class MarkdownFormatter:
         #    res += " * " + str(k)
         #    res += "\n\n"
 
-        return res
 
     def _key_to_str(self, data, key):
         if key in data:
@@ -470,45 +464,57 @@ class MarkdownFormatter:
         else:
             return " missing "
 
+    def _settings(self, report, out):
+        out.write("\n" + str(json.dumps(report['meta'], indent=4)).replace("\n","\n\n") + "\n")
+
     def _header_link(self, header):
         return "[" + header + "](#" + header + ")\n\n"
         
     def format(self, report):
+        out = io.StringIO()
+        self.format_stream(report, out)
+        return out.getvalue()
+
+    #
+    # Write the report to out (e.g. a file), section by section as
+    # they are generated, instead of creating it as one string
+    #
+    def format_stream(self, report, out):
         uname=os.uname()
-        res = "# 1 Scancode manifestor report"
-        res += "\n\n"
-        res += "## 1.1 Table of content"
-        res += "\n\n"
-        res += " 1 Scancode manifestor report"
-        res += "\n\n"
-        res += " 2 " + self._header_link(scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT)
-        res += " 2.1 " + self._header_link(scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SCANCODE)
-        res += " 2.2 " + self._header_link(scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_META)
-        res += " 2.3 " + self._header_link(scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SETTINGS)
-        res += " 3 " +   self._header_link(scancode_manifestor.explanations.CONCLUSION_HEADER)
-        res += " 3.1 " +   self._header_link(scancode_manifestor.explanations.CONCLUSION_COPYRIGHTS_HEADER)
-        res += " 3.2 " +   self._header_link(scancode_manifestor.explanations.CONCLUSION_LICENSES_HEADER)
+        out.write("# 1 Scancode manifestor report")
+        out.write("\n\n")
+        out.write("## 1.1 Table of content")
+        out.write("\n\n")
+        out.write(" 1 Scancode manifestor report")
+        out.write("\n\n")
+        out.write(" 2 " + self._header_link(scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT))
+        out.write(" 2.1 " + self._header_link(scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SCANCODE))
+        out.write(" 2.2 " + self._header_link(scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_META))
+        out.write(" 2.3 " + self._header_link(scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SETTINGS))
+        out.write(" 3 " +   self._header_link(scancode_manifestor.explanations.CONCLUSION_HEADER))
+        out.write(" 3.1 " +   self._header_link(scancode_manifestor.explanations.CONCLUSION_COPYRIGHTS_HEADER))
+        out.write(" 3.2 " +   self._header_link(scancode_manifestor.explanations.CONCLUSION_LICENSES_HEADER))
         #res += " 7.3 " +   self._header_link(scancode_manifestor.explanations.CONCLUSION_INCLUDED_LICENSES_HEADER)
-        res += " 4 " +   self._header_link(scancode_manifestor.explanations.LICENSES_HEADER)
-        res += " 4.1 " + self._header_link(scancode_manifestor.explanations.LICENSES_ALL_FILES_HEADER)
-        res += " 4.2 " + self._header_link(scancode_manifestor.explanations.LICENSES_INCLUDED_FILES_HEADER)
-        res += " 4.3 " + self._header_link(scancode_manifestor.explanations.LICENSES_EXCLUDED_FILES_HEADER)
-        res += " 5 " +   self._header_link(scancode_manifestor.explanations.EXCLUDED_FILES_HEADER)
-        res += " 5.1 " +   self._header_link(scancode_manifestor.explanations.EXCLUDED_FILES_FILTERS_HEADER)
-        res += " 5.2 " +   self._header_link(scancode_manifestor.explanations.EXCLUDED_FILES_FILES_HEADER)
-        res += " 6 " +   self._header_link(scancode_manifestor.explanations.INCLUDED_FILES_HEADER)
-        res += " 6.1 " +   self._header_link(scancode_manifestor.explanations.INCLUDED_FILES_FILTERS_HEADER)
-        res += " 6.2 " +   self._header_link(scancode_manifestor.explanations.INCLUDED_FILES_FILES_HEADER)
-        res += " 7 " +   self._header_link(scancode_manifestor.explanations.CURATED_FILES_HEADER)
-        res += " 7.1 " +   self._header_link(scancode_manifestor.explanations.CURATED_FILES_FILE_HEADER)
-        res += " 7.1 " +   self._header_link(scancode_manifestor.explanations.CURATED_FILES_MISSING_HEADER)
-        res += "\n\n"
-        res += "<a name=\"" + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT + "\"></a>\n\n"
-        res += "# 2 " + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT
-        res += "\n\n"
-        res += "<a name=\"" + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SCANCODE + "\"></a>\n\n"
-        res += "## 2.1 " + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SCANCODE
-        res += "\n\n"
+        out.write(" 4 " +   self._header_link(scancode_manifestor.explanations.LICENSES_HEADER))
+        out.write(" 4.1 " + self._header_link(scancode_manifestor.explanations.LICENSES_ALL_FILES_HEADER))
+        out.write(" 4.2 " + self._header_link(scancode_manifestor.explanations.LICENSES_INCLUDED_FILES_HEADER))
+        out.write(" 4.3 " + self._header_link(scancode_manifestor.explanations.LICENSES_EXCLUDED_FILES_HEADER))
+        out.write(" 5 " +   self._header_link(scancode_manifestor.explanations.EXCLUDED_FILES_HEADER))
+        out.write(" 5.1 " +   self._header_link(scancode_manifestor.explanations.EXCLUDED_FILES_FILTERS_HEADER))
+        out.write(" 5.2 " +   self._header_link(scancode_manifestor.explanations.EXCLUDED_FILES_FILES_HEADER))
+        out.write(" 6 " +   self._header_link(scancode_manifestor.explanations.INCLUDED_FILES_HEADER))
+        out.write(" 6.1 " +   self._header_link(scancode_manifestor.explanations.INCLUDED_FILES_FILTERS_HEADER))
+        out.write(" 6.2 " +   self._header_link(scancode_manifestor.explanations.INCLUDED_FILES_FILES_HEADER))
+        out.write(" 7 " +   self._header_link(scancode_manifestor.explanations.CURATED_FILES_HEADER))
+        out.write(" 7.1 " +   self._header_link(scancode_manifestor.explanations.CURATED_FILES_FILE_HEADER))
+        out.write(" 7.1 " +   self._header_link(scancode_manifestor.explanations.CURATED_FILES_MISSING_HEADER))
+        out.write("\n\n")
+        out.write("<a name=\"" + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT + "\"></a>\n\n")
+        out.write("# 2 " + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT)
+        out.write("\n\n")
+        out.write("<a name=\"" + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SCANCODE + "\"></a>\n\n")
+        out.write("## 2.1 " + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SCANCODE)
+        out.write("\n\n")
         scan_str = None
         if 'meta' in report:
             meta=report['meta']
@@ -522,51 +528,50 @@ class MarkdownFormatter:
             scan_str = "*no header section found in Scancode report*"
             scan_str += "\n\n"
 
-        res += scan_str
+        out.write(scan_str)
         
-        res += "<a name=\"" + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_META + "\"></a>\n\n"
-        res += "## 2.2 " + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_META
-        res += "\n\n"
-        res += " * ***date***: " + str(datetime.datetime.now())
-        res += "\n\n"
-        res += " * ***user***: " + getpass.getuser()
-        res += "\n\n"
-        res += " * ***os***: " + uname.sysname + " / " + uname.release + " / " + uname.version
-        res += "\n\n"
-        res += " * ***machine***: " + uname.machine
-        res += "\n\n"
-        res += " * ***node***: " + uname.nodename
-        res += "\n\n"
-        res += "\n\n"
-
-        res += "<a name=\"" + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SETTINGS + "\"></a>\n\n"
-        res += "## 2.3 " + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SETTINGS
-        res += "\n\n"
-        res += self._collapse_begin()
-        res += "\n" + str(json.dumps(report['meta'], indent=4)).replace("\n","\n\n") + "\n"
-        res += self._collapse_end()        
+        out.write("<a name=\"" + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_META + "\"></a>\n\n")
+        out.write("## 2.2 " + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_META)
+        out.write("\n\n")
+        out.write(" * ***date***: " + str(datetime.datetime.now()))
+        out.write("\n\n")
+        out.write(" * ***user***: " + getpass.getuser())
+        out.write("\n\n")
+        out.write(" * ***os***: " + uname.sysname + " / " + uname.release + " / " + uname.version)
+        out.write("\n\n")
+        out.write(" * ***machine***: " + uname.machine)
+        out.write("\n\n")
+        out.write(" * ***node***: " + uname.nodename)
+        out.write("\n\n")
+        out.write("\n\n")
+
+        out.write("<a name=\"" + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SETTINGS + "\"></a>\n\n")
+        out.write("## 2.3 " + scancode_manifestor.explanations.ABOUT_SCANCODE_REPORT_SETTINGS)
+        out.write("\n\n")
+        out.write(self._collapse_begin())
+        self._settings(report, out)
+        out.write(self._collapse_end())
         
-        res += "\n\n"
+        out.write("\n\n")
 
-        res += self._conclusion_summary(report)
+        self._conclusion_summary(report, out)
         
-        res += "\n\n"
+        out.write("\n\n")
 
-        res += self._license_summary(report)
+        self._license_summary(report, out)
         
-        res += "\n\n"
+        out.write("\n\n")
 
-        res += self._excluded_files(report)
+        self._excluded_files(report, out)
 
-        res += "\n\n"
+        out.write("\n\n")
 
-        res += self._included_files(report)
+        self._included_files(report, out)
 
-        res += "\n\n"
+        out.write("\n\n")
 
-        res += self._curated_files(report)
+        self._curated_files(report, out)
 
-        res += "\n\n"
+        out.write("\n\n")
 
 
-        return res
@@ -12,8 +12,25 @@
 #
 ###################################################################
 
-import json
+import io
 
+from scancode_manifestor.file_record import copyright_values
+
+COLUMNS = [ "path", "license", "curation", "copyrights" ]
+
+# between columns
+COLUMN_SEPARATOR = "  "
+
+# between pages
+PAGE_SEPARATOR = "\f\n"
+
+#
+# Plain text report, with the included and excluded files in tables
+# with fixed width columns. The rows are written to the output one at
+# a time. With text_page_lines set, the tables are split in pages of
+# (at most) that many rows, each page starting with a form feed and
+# the column headers.
+#
 class TextFormatter:
 
     def __init__(self, args, utils):
@@ -21,8 +38,96 @@ class TextFormatter:
         self.args = args
 
     def format(self, report):
-        res = "text report not implemented yet, use markdown instead and use pandoc to create text"
+        out = io.StringIO()
+        self.format_stream(report, out)
+        return out.getvalue()
+
+    def _page_lines(self):
+        page_lines = self.args.get('text_page_lines')
+        if page_lines == None:
+            return 0
+        return int(page_lines)
+
+    def _header(self, title, underline="="):
+        return title + "\n" + underline * len(title) + "\n\n"
+
+    def _field(self, label, value):
+        return (label + ":").ljust(17) + value + "\n"
+
+    def _value(self, value):
+        if value == None:
+            return "-"
+        return str(value).strip()
+
+    def format_stream(self, report, out):
+        out.write(self._header("Scancode manifestor report"))
+
+        project = report.get('project', {})
+        project_name = self._value(project.get('name'))
+        if project.get('sub_package') != None:
+            project_name += " / " + self._value(project.get('sub_package'))
+        out.write(self._field("Project", project_name))
+        out.write(self._field("Version", self._value(project.get('version'))))
+        meta = report.get('meta', {})
+        out.write(self._field("Scancode report", self._value(meta.get('scancode_report_file'))))
+        out.write(self._field("Date", self._value(meta.get('report_date'))))
+        out.write("\n")
+
+        conclusion = report['conclusion']
+        out.write(self._header("Conclusion", "-"))
+        out.write(self._field("License", self._value(conclusion['license_expression'])))
+        out.write("Copyright:\n")
+        for c in conclusion['copyright']:
+            out.write("  " + str(c) + "\n")
+        out.write("\n")
+
+        included = [ f for f in report['files']['included'] if self.utils._isfile(f) ]
+        excluded = [ f for f in report['files']['excluded'] if self.utils._isfile(f) ]
+        out.write(self._field("Included files", str(len(included))))
+        out.write(self._field("Excluded files", str(len(excluded))))
+        out.write("\n")
+
+        self._write_table("Included files", included, out)
+        self._write_table("Excluded files", excluded, out)
+
+    def _row(self, f):
+        manifestor_map = f.get('scancode_manifestor', {})
+        if 'copyright' in manifestor_map:
+            copyrights = manifestor_map['copyright']
+        else:
+            copyrights = copyright_values(f)
+        return [ f['path'],
+                 self._value(manifestor_map.get('license_key')),
+                 self._value(manifestor_map.get('curated_license')),
+                 str(len(copyrights)) ]
+
+    def _line(self, values, widths):
+        # no trailing spaces after the last column
+        line = COLUMN_SEPARATOR.join([ value.ljust(width) for value, width in zip(values[:-1], widths) ])
+        return line + COLUMN_SEPARATOR + values[-1] + "\n"
+
+    def _write_table_header(self, title, widths, out):
+        out.write(self._header(title, "-"))
+        out.write(self._line(COLUMNS, widths))
+        out.write(self._line([ "-" * width for width in widths ], widths))
 
-        return res
+    #
+    # The column widths are found in a first pass over the files, the
+    # rows are created and written in a second
+    #
+    def _write_table(self, title, files, out):
+        widths = [ len(column) for column in COLUMNS ]
+        for f in files:
+            for i, value in enumerate(self._row(f)):
+                widths[i] = max(widths[i], len(value))
 
-    
+        page_lines = self._page_lines()
+        page = 1
+        self._write_table_header(title, widths, out)
+        for row_count, f in enumerate(files):
+            if page_lines > 0 and row_count > 0 and row_count % page_lines == 0:
+                page += 1
+                out.write(PAGE_SEPARATOR)
+                self._write_table_header(title + " (page " + str(page) + ")", widths, out)
+            out.write(self._line(self._row(f), widths))
+        out.write("\n")
@@ -1,11 +1,93 @@
     
+import io
+import json
+import re
+
+from scancode_manifestor.format_json import json_default
+
+# characters not allowed unescaped in YAML, see
+# https://yaml.org/spec/1.2.2/#51-character-set, and line breaks
+# which would be folded in a double quoted scalar
+PLAIN_KEY = re.compile("^[a-zA-Z_][a-zA-Z0-9_]*$")
+YAML_ESCAPE = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]")
+
+# keys plain YAML would read as something else than a string
+RESERVED_KEYS = set([ "y", "n", "yes", "no", "true", "false", "on", "off", "null" ])
+
 class YamlFormatter:
 
     def __init__(self, args, utils):
-        pass
+        self.args = args
+        self.utils = utils
 
     def format(self, report):
-        return "not implemented yet"
+        out = io.StringIO()
+        self.format_stream(report, out)
+        return out.getvalue()
+
+    #
+    # Write the report to out, as YAML with the same structure as the
+    # JSON report. The YAML is written in block style while going
+    # through the report, one file at a time, so the YAML for all
+    # files is never in memory.
+    #
+    def format_stream(self, report, out):
+        out.write("---\n")
+        self._write_mapping(report, 0, out)
+
+    def _scalar(self, value):
+        if value is None:
+            return "null"
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        if isinstance(value, (int, float)):
+            return json.dumps(value)
+        if isinstance(value, dict):
+            return "{}"
+        if isinstance(value, (list, tuple)):
+            return "[]"
+        # JSON strings are YAML double quoted scalars, once the
+        # characters YAML does not allow are escaped
+        quoted = json.dumps(str(value), ensure_ascii=False)
+        return YAML_ESCAPE.sub(lambda m: "\\u%04x" % ord(m.group(0)), quoted)
+
+    def _key(self, key):
+        if isinstance(key, str) and PLAIN_KEY.match(key) and key.lower() not in RESERVED_KEYS:
+            return key
+        return self._scalar(key)
+
+    # FileRecords, enums etc as in the JSON report
+    def _value(self, value):
+        if value is None or isinstance(value, (str, int, float, dict, list, tuple)):
+            return value
+        return json_default(value)
+
+    def _write_mapping(self, mapping, indent, out, prefix=None):
+        if prefix is None:
+            prefix = " " * indent
+        for key, value in mapping.items():
+            self._write_value(prefix + self._key(key) + ":", self._value(value), indent, out)
+            prefix = " " * indent
+
+    def _write_value(self, head, value, indent, out):
+        if isinstance(value, dict) and value:
+            out.write(head + "\n")
+            self._write_mapping(value, indent + 2, out)
+        elif isinstance(value, (list, tuple)) and value:
+            out.write(head + "\n")
+            self._write_sequence(value, indent, out)
+        else:
+            out.write(head + " " + self._scalar(value) + "\n")
+
+    def _write_sequence(self, values, indent, out):
+        for value in values:
+            value = self._value(value)
+            if isinstance(value, dict) and value:
+                self._write_mapping(value, indent + 2, out, " " * indent + "- ")
+            else:
+                self._write_value(" " * indent + "-", value, indent + 2, out)
     
     def format_copyrights(self, copyrights):
         ret = []
@@ -0,0 +1,236 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import FilterAttribute
+from scancode_manifestor.path_matcher import EMPTY_EXPR
+from scancode_manifestor.path_matcher import PathMatcher
+
+#
+# Path filtering in the interactive mode, where include and exclude
+# file expressions are added (and removed) one at a time. Instead of
+# filtering all files with all expressions (see ManifestUtils._filter)
+# after each change, only the files the change can affect are looked
+# at:
+#
+# * a new exclude expression is only tried on the included files
+# * a new include expression is only tried on the files not matching
+#   any include expression
+# * when an expression is removed, only the files it matched are
+#   tried with the remaining expressions
+#
+# For this the first include and exclude expression matching each
+# file is kept, and the other way around the files matched by each
+# expression.
+#
+# A file is included if it matches an include expression (or there are
+# none) and no exclude expression. Excluded files are not tried with
+# new exclude expressions. Instead each file keeps the serial number
+# of the last expression it was tried with, and is tried with the
+# newer expressions if it is about to be included.
+#
+class IncrementalFilter:
+    def __init__(self, utils, files, included_regexps, excluded_regexps):
+        self.utils = utils
+        self.files = files
+        self.serial = 0
+        # (serial, regexp)
+        self.include_patterns = []
+        self.exclude_patterns = []
+        # regexp => files (id => file) matched
+        self.included_by = {}
+        self.excluded_by = {}
+        # id => first include regexp matching
+        self.file_include = {}
+        # id => (first exclude regexp matching or None, serial tried up to)
+        self.file_exclude = {}
+        # files not matching any include regexp
+        self.unincluded = {}
+        self.included_ids = set([ id(f) for f in files['included'] ])
+
+        for regexp_list in included_regexps:
+            for regexp in regexp_list:
+                self.include_patterns.append(self._next_pattern(regexp))
+        for regexp_list in excluded_regexps:
+            for regexp in regexp_list:
+                self.exclude_patterns.append(self._next_pattern(regexp))
+
+        # one pass over all files, with all regexps
+        all_files = [ f for f in files['included'] + files['excluded'] if self.utils._isfile(f) ]
+        include_matches = self._first_matches(self.include_patterns, all_files)
+        exclude_matches = self._first_matches(self.exclude_patterns, all_files)
+        for f, include, exclude in zip(all_files, include_matches, exclude_matches):
+            self._set_include(f, include)
+            self._set_exclude(f, exclude)
+
+        # only files are included
+        self._apply([ f for f in files['included'] if not self.utils._isfile(f) ])
+
+    def _next_pattern(self, regexp):
+        self.serial += 1
+        return (self.serial, regexp)
+
+    def _regexps(self, patterns):
+        return [ regexp for serial, regexp in patterns ]
+
+    # first regexp, in patterns, matching each file
+    def _first_matches(self, patterns, files):
+        if not patterns:
+            return [ None ] * len(files)
+        regexps = self._regexps(patterns)
+        matches = PathMatcher(regexps).first_matches([ f['path'] for f in files ])
+        return [ None if index is None else regexps[index] for index in matches ]
+
+    def _set_include(self, f, regexp):
+        old_regexp = self.file_include.pop(id(f), None)
+        if old_regexp is not None:
+            self._remove_member(self.included_by, old_regexp, f)
+        if regexp is None:
+            self.unincluded[id(f)] = f
+        else:
+            self.file_include[id(f)] = regexp
+            self.included_by.setdefault(regexp, {})[id(f)] = f
+            self.unincluded.pop(id(f), None)
+
+    def _set_exclude(self, f, regexp):
+        old_regexp, serial = self.file_exclude.pop(id(f), (None, 0))
+        if old_regexp is not None:
+            self._remove_member(self.excluded_by, old_regexp, f)
+        self.file_exclude[id(f)] = (regexp, self.serial)
+        if regexp is not None:
+            self.excluded_by.setdefault(regexp, {})[id(f)] = f
+
+    def _remove_member(self, members, regexp, f):
+        files = members.get(regexp)
+        if files is not None:
+            files.pop(id(f), None)
+            if not files:
+                del members[regexp]
+
+    # first exclude regexp matching f, trying the regexps added since f was last tried
+    def _exclude_match(self, f):
+        regexp, tried = self.file_exclude.get(id(f), (None, 0))
+        if regexp is not None or tried == self.serial:
+            return regexp
+        for serial, regexp in self.exclude_patterns:
+            if serial > tried and regexp.strip() != EMPTY_EXPR:
+                if self.utils._compiled_search(regexp)(f['path']):
+                    self._set_exclude(f, regexp)
+                    return regexp
+        self._set_exclude(f, None)
+        return None
+
+    def _include(self, f):
+        if not self.utils._isfile(f):
+            return False
+        if self.include_patterns and id(f) not in self.file_include:
+            return False
+        return self._exclude_match(f) is None
+
+    def _annotate(self, f, included):
+        if not self.utils._isfile(f):
+            return
+        if included and id(f) in self.file_include:
+            self.utils._add_filter_data(f, FilterAttribute.PATH, FilterAction.INCLUDE, self.file_include[id(f)])
+        # as in _filter, a file not matching any include is excluded without an exclude expression
+        elif not included and (not self.include_patterns or id(f) in self.file_include) and self.file_exclude.get(id(f), (None, 0))[0] is not None:
+            self.utils._add_filter_data(f, FilterAttribute.PATH, FilterAction.EXCLUDE, self.file_exclude[id(f)][0])
+        else:
+            self.utils._remove_filter_data(f)
+
+    #
+    # Move the files, among candidates, that should be included (or
+    # excluded) but are not
+    #
+    def _apply(self, candidates):
+        moved_in = []
+        moved_out = []
+        for f in candidates:
+            included = self._include(f)
+            self._annotate(f, included)
+            if included == (id(f) in self.included_ids):
+                continue
+            if included:
+                moved_in.append(f)
+                self.included_ids.add(id(f))
+            else:
+                moved_out.append(f)
+                self.included_ids.discard(id(f))
+
+        if moved_in or moved_out:
+            moved_in_ids = set([ id(f) for f in moved_in ])
+            moved_out_ids = set([ id(f) for f in moved_out ])
+            self.files['included'] = [ f for f in self.files['included'] if id(f) not in moved_out_ids ] + moved_in
+            self.files['excluded'] = [ f for f in self.files['excluded'] if id(f) not in moved_in_ids ] + moved_out
+            index = self.utils._indexed(self.files)
+            if index is not None:
+                self.utils._move_in_index(index, moved_in, moved_out)
+        return moved_in, moved_out
+
+    def add_excludes(self, regexps):
+        patterns = [ self._next_pattern(regexp) for regexp in regexps ]
+        self.exclude_patterns += patterns
+        included = self.files['included']
+        matched = []
+        for f, regexp in zip(included, self._first_matches(patterns, included)):
+            self._set_exclude(f, regexp)
+            if regexp is not None:
+                matched.append(f)
+        return self._apply(matched)
+
+    def add_includes(self, regexps):
+        first = not self.include_patterns
+        patterns = [ self._next_pattern(regexp) for regexp in regexps ]
+        self.include_patterns += patterns
+        candidates = list(self.unincluded.values())
+        changed = []
+        for f, regexp in zip(candidates, self._first_matches(patterns, candidates)):
+            if regexp is not None:
+                self._set_include(f, regexp)
+                changed.append(f)
+            elif first:
+                # no longer included by default
+                changed.append(f)
+        return self._apply(changed)
+
+    def _remove_pattern(self, patterns, regexp):
+        for pattern in patterns:
+            if pattern[1] == regexp:
+                patterns.remove(pattern)
+                return True
+        raise ValueError("No such file expression: " + regexp)
+
+    def remove_include(self, regexp):
+        self._remove_pattern(self.include_patterns, regexp)
+        if regexp in self._regexps(self.include_patterns):
+            # added more than once
+            return [], []
+        members = list(self.included_by.pop(regexp, {}).values())
+        for f in members:
+            self.file_include.pop(id(f))
+        for f, new_regexp in zip(members, self._first_matches(self.include_patterns, members)):
+            self._set_include(f, new_regexp)
+        if not self.include_patterns:
+            # everything is included by default
+            return self._apply(list(self.unincluded.values()))
+        return self._apply(members)
+
+    def remove_exclude(self, regexp):
+        self._remove_pattern(self.exclude_patterns, regexp)
+        if regexp in self._regexps(self.exclude_patterns):
+            # added more than once
+            return [], []
+        members = list(self.excluded_by.pop(regexp, {}).values())
+        for f in members:
+            # try again with the remaining regexps
+            del self.file_exclude[id(f)]
+        return self._apply(members)
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+#
+# License of a transformed file: the curated license if curated,
+# otherwise the license found by scancode (None if no license was
+# found)
+#
+def effective_license(f):
+    if 'scancode_manifestor' in f:
+        manifestor_map = f['scancode_manifestor']
+        if 'curated_license' in manifestor_map:
+            return manifestor_map['curated_license']
+        return manifestor_map.get('license_key')
+    # transformed file (see test/sample_data.py)
+    return f.get('license_key')
+
+#
+# Inverted index of (included) files:
+#
+# * license expression, as found by scancode => files
+# * license (see effective_license) => files
+#
+# so that the files with a license can be found without looking at
+# every file. Files without any license expression are found with the
+# expression None. The files are kept in dicts, on id, to be removed
+# and moved (e.g. when curated) without searching.
+#
+class LicenseIndex:
+    def __init__(self, files=()):
+        self.expression_files = {}
+        self.license_files = {}
+        # id => license, for the files in the index
+        self.file_licenses = {}
+        for f in files:
+            self.add(f)
+
+    # the expressions of f, once each (scancode may repeat an expression)
+    def _expressions(self, f):
+        expressions = f.get('license_expressions')
+        if not expressions:
+            return [ None ]
+        return list(dict.fromkeys(expressions))
+
+    def __contains__(self, f):
+        return id(f) in self.file_licenses
+
+    def __len__(self):
+        return len(self.file_licenses)
+
+    def add(self, f):
+        if f in self:
+            return
+        for expression in self._expressions(f):
+            self.expression_files.setdefault(expression, {})[id(f)] = f
+        lic = effective_license(f)
+        self.license_files.setdefault(lic, {})[id(f)] = f
+        self.file_licenses[id(f)] = lic
+
+    def remove(self, f):
+        if f not in self:
+            return
+        for expression in self._expressions(f):
+            self._remove(self.expression_files, expression, f)
+        self._remove(self.license_files, self.file_licenses.pop(id(f)), f)
+
+    def _remove(self, index, key, f):
+        files = index[key]
+        del files[id(f)]
+        if not files:
+            del index[key]
+
+    # move f to its current license, e.g. after a curation
+    def update(self, f):
+        if f not in self:
+            return
+        lic = effective_license(f)
+        old_lic = self.file_licenses[id(f)]
+        if lic == old_lic:
+            return
+        self._remove(self.license_files, old_lic, f)
+        self.license_files.setdefault(lic, {})[id(f)] = f
+        self.file_licenses[id(f)] = lic
+
+    def files_with_expression(self, expression):
+        return list(self.expression_files.get(expression, {}).values())
+
+    def files_with_license(self, lic):
+        return list(self.license_files.get(lic, {}).values())
+
+    def license_count(self, lic):
+        return len(self.license_files.get(lic, {}))
+
+    def licenses(self):
+        return set(self.license_files.keys())
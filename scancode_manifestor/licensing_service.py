@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+from license_expression import Licensing
+
+#
+# Parses and simplifies license expressions with one Licensing
+# instance. A project has a lot of files but few distinct license
+# expressions, so each distinct expression is only parsed once. The
+# conclusion (all expressions and:ed) is made from the parsed
+# expressions, instead of parsing one string with all of them.
+#
+class LicensingService:
+    def __init__(self):
+        self.licensing = Licensing()
+        self.parsed = {}
+
+    # parsed and simplified expression, None if expression is empty
+    def parse(self, expression):
+        parsed = self.parsed.get(expression)
+        if parsed is None and expression not in self.parsed:
+            parsed = self.licensing._parse_and_simplify(expression)
+            self.parsed[expression] = parsed
+        return parsed
+
+    # the expressions and:ed, parsed and simplified
+    def conclusion(self, expressions):
+        parsed = []
+        for expression in expressions:
+            parsed_expression = self.parse(expression)
+            if parsed_expression is not None:
+                parsed.append(parsed_expression)
+
+        if len(parsed) == 0:
+            return None
+        if len(parsed) == 1:
+            return parsed[0]
+        return self.licensing.AND(*parsed).simplify()
@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:
+    # python < 3.11
+    import sre_parse
+    import sre_constants
+
+#
+# Most include/exclude expressions are (more or less) plain strings,
+# e.g. "Makefile\.am$" or "autom4te\.cache/". Such an expression can
+# only match a path containing the string "Makefile.am" (or
+# "autom4te.cache/"). The literal strings are put in an Aho-Corasick
+# automaton, which finds all of them in a path in one scan. Only the
+# expressions whose literal was found (and the ones without any
+# literal) need to be tried with the regular expression.
+#
+
+#
+# Returns the longest string that must be present in a string matched
+# by regexp, or None if no such string can be found.
+#
+def required_literal(regexp):
+    try:
+        parsed = sre_parse.parse(regexp)
+    except Exception:
+        return None
+
+    if parsed.state.flags & sre_constants.SRE_FLAG_IGNORECASE:
+        return None
+
+    longest = None
+    for literal in _literal_runs(parsed):
+        if longest is None or len(literal) > len(longest):
+            longest = literal
+    return longest
+
+def _literal_runs(parsed):
+    runs = []
+    run = ""
+    for op, av in parsed:
+        if op == sre_constants.LITERAL:
+            run += chr(av)
+            continue
+        if op == sre_constants.IN and len(av) == 1 and av[0][0] == sre_constants.LITERAL:
+            # e.g. "[.]"
+            run += chr(av[0][1])
+            continue
+        if op == sre_constants.AT:
+            # anchors do not consume any characters
+            continue
+
+        # the current run of literals ends here
+        if run != "":
+            runs.append(run)
+            run = ""
+
+        if op == sre_constants.SUBPATTERN:
+            add_flags = av[1]
+            if not add_flags & sre_constants.SRE_FLAG_IGNORECASE:
+                runs += _literal_runs(av[3])
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            # present at least once
+            if av[0] >= 1:
+                runs += _literal_runs(av[2])
+
+    if run != "":
+        runs.append(run)
+    return runs
+
+
+class AhoCorasick:
+    def __init__(self):
+        # goto[state] maps a character to the next state
+        self.goto = [ {} ]
+        self.fail = [ 0 ]
+        self.output = [ () ]
+        self.built = False
+
+    def add(self, word, value):
+        if self.built:
+            raise ValueError("Can't add words to an already built automaton")
+        state = 0
+        for c in word:
+            next_state = self.goto[state].get(c)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+                self.goto[state][c] = next_state
+            state = next_state
+        self.output[state] = self.output[state] + (value,)
+
+    #
+    # Add failure transitions, turning the trie into a automaton where
+    # each state has a transition for every character in the words
+    # added (missing characters lead back to the root)
+    #
+    def build(self):
+        alphabet = set()
+        for transitions in self.goto:
+            alphabet.update(transitions.keys())
+
+        queue = []
+        root = self.goto[0]
+        for c, state in root.items():
+            self.fail[state] = 0
+            queue.append(state)
+
+        position = 0
+        while position < len(queue):
+            state = queue[position]
+            position += 1
+            fail_state = self.fail[state]
+            self.output[state] = self.output[state] + self.output[fail_state]
+            transitions = self.goto[state]
+            for c in alphabet:
+                if c in transitions:
+                    next_state = transitions[c]
+                    self.fail[next_state] = self.goto[fail_state].get(c, 0)
+                    queue.append(next_state)
+                else:
+                    transitions[c] = self.goto[fail_state].get(c, 0)
+
+        # the root also needs a complete set of transitions
+        for c in alphabet:
+            if c not in root:
+                root[c] = 0
+        self.built = True
+
+    # set of values for all words present in text
+    def search(self, text):
+        state, found = self.scan(text)
+        return set(found)
+
+    #
+    # Continue a search, from a state and the values found so far, with
+    # more text. Returns the new state and values (a frozenset).
+    #
+    def scan(self, text, state=0, found=frozenset()):
+        if not self.built:
+            self.build()
+        goto = self.goto
+        output = self.output
+        for c in text:
+            state = goto[state].get(c, 0)
+            if output[state]:
+                found = found.union(output[state])
+        return state, found
+
+
+class LiteralPrefilter:
+    def __init__(self, regexps):
+        self.automaton = AhoCorasick()
+        # indexes of regexps without a literal, always to be tried
+        self.always = set()
+        self.candidates_cache = {}
+        for index, regexp in enumerate(regexps):
+            literal = required_literal(regexp)
+            if literal is None:
+                self.always.add(index)
+            else:
+                self.automaton.add(literal, index)
+        self.automaton.build()
+
+    # sorted indexes of the regexps that may match text
+    def candidates(self, text):
+        state, found = self.automaton.scan(text)
+        return self.found_candidates(found)
+
+    # sorted indexes of the regexps that may match, given the found values
+    def found_candidates(self, found):
+        # few distinct combinations of literals are found in practice
+        candidates = self.candidates_cache.get(found)
+        if candidates is None:
+            candidates = sorted(found.union(self.always))
+            self.candidates_cache[found] = candidates
+        return candidates
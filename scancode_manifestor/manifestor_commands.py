@@ -17,6 +17,10 @@ class ManifestorCommands:
         self.COMMAND_SHORT_EXCLUDE_FILE="ef"
         self.COMMAND_INCLUDE_FILE="include-files"
         self.COMMAND_SHORT_INCLUDE_FILE="if"
+        self.COMMAND_REMOVE_EXCLUDE_FILE="remove-exclude-files"
+        self.COMMAND_SHORT_REMOVE_EXCLUDE_FILE="ref"
+        self.COMMAND_REMOVE_INCLUDE_FILE="remove-include-files"
+        self.COMMAND_SHORT_REMOVE_INCLUDE_FILE="rif"
         self.COMMAND_LIST_INCLUDED="list-included"
         self.COMMAND_LIST_EXCLUDED="list-excluded"
         self.COMMAND_CURATE_FILE="curate-file"
@@ -36,5 +40,5 @@ class ManifestorCommands:
         self.COMMAND_SHOW_COMMANDS="commands"
         self.COMMAND_OPEN_FILE="open-file"
 
-        self.INTERACTIVE_COMMANDS = [ self.COMMAND_EXCLUDE_FILE, self.COMMAND_SHORT_EXCLUDE_FILE, self.COMMAND_INCLUDE_FILE, self.COMMAND_SHORT_INCLUDE_FILE, self.COMMAND_LIST_INCLUDED, self.COMMAND_LIST_EXCLUDED, self.COMMAND_CURATE_FILE, self.COMMAND_SHORT_CURATE_FILE, self.COMMAND_CURATE_LICENSE, self.COMMAND_SHORT_CURATE_LICENSE, self.COMMAND_CURATE_MISSING_LICENSE, self.COMMAND_SHORT_CURATE_MISSING_LICENSE, self.COMMAND_HIDE_LICENSES, self.COMMAND_SHORT_HIDE_LICENSES, self.COMMAND_UNHIDE_LICENSES, self.COMMAND_SHORT_UNHIDE_LICENSES, self.COMMAND_SHOW_LICENSES, self.COMMAND_SHORT_SHOW_LICENSES, self.COMMAND_HIDE_ONLY_LICENSES, self.COMMAND_SHORT_HIDE_ONLY_LICENSES, self.COMMAND_SHOW_COMMANDS , self.COMMAND_OPEN_FILE ]
+        self.INTERACTIVE_COMMANDS = [ self.COMMAND_EXCLUDE_FILE, self.COMMAND_SHORT_EXCLUDE_FILE, self.COMMAND_INCLUDE_FILE, self.COMMAND_SHORT_INCLUDE_FILE, self.COMMAND_REMOVE_EXCLUDE_FILE, self.COMMAND_SHORT_REMOVE_EXCLUDE_FILE, self.COMMAND_REMOVE_INCLUDE_FILE, self.COMMAND_SHORT_REMOVE_INCLUDE_FILE, self.COMMAND_LIST_INCLUDED, self.COMMAND_LIST_EXCLUDED, self.COMMAND_CURATE_FILE, self.COMMAND_SHORT_CURATE_FILE, self.COMMAND_CURATE_LICENSE, self.COMMAND_SHORT_CURATE_LICENSE, self.COMMAND_CURATE_MISSING_LICENSE, self.COMMAND_SHORT_CURATE_MISSING_LICENSE, self.COMMAND_HIDE_LICENSES, self.COMMAND_SHORT_HIDE_LICENSES, self.COMMAND_UNHIDE_LICENSES, self.COMMAND_SHORT_UNHIDE_LICENSES, self.COMMAND_SHOW_LICENSES, self.COMMAND_SHORT_SHOW_LICENSES, self.COMMAND_HIDE_ONLY_LICENSES, self.COMMAND_SHORT_HIDE_ONLY_LICENSES, self.COMMAND_SHOW_COMMANDS , self.COMMAND_OPEN_FILE ]
 
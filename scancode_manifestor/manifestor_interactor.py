@@ -15,6 +15,7 @@ import subprocess
 import sys
 
 import scancode_manifestor.manifestor_utils
+from scancode_manifestor.incremental_filter import IncrementalFilter
 
 class ManifestorCompleter:
     def __init__(self,manifestor):
@@ -30,6 +31,9 @@ class ManifestorInteractor:
         self.commands = commands
         self.utils = utils
         self.logger = logger
+        self.filter = None
+        # files transformed and curated, kept up to date when filtered and curated
+        self.curated_files = None
 
     def _curate_missing_license(self, action, files, args):
         self.logger.verbose("--------- CURATE LICENSE -----")
@@ -46,23 +50,50 @@ class ManifestorInteractor:
                 lic += " and " + curation
         args['missing_license_curation']=lic
 
+        if self.curated_files is files:
+            # only files without license are affected
+            index = self.utils._indexed(files)
+            missing = { 'included': index.files_with_expression(None), 'excluded': [] }
+            self.utils._curate(missing, [], [], lic)
+
     def _curated_info(self, files, args):
         self.utils._transform_files(files)
         transformed = files
 
         self.utils._curate(transformed, args['file_curations'], args['license_curations'], args['missing_license_curation'])
         
+        self.curated_files = transformed
+        return self._info(transformed)
+
+    #
+    # Information about the transformed and curated files. The license
+    # information is looked up in the license index (see
+    # license_index.py), which is kept up to date when files are
+    # filtered and curated.
+    #
+    def _info(self, files):
         curated = {}
-        curated['files'] = transformed
-        print("kjaskashdakhds: " + str())
-        curated['included_count'] = self.utils._count_files_transformed(transformed['included'])
-        curated['excluded_count'] = self.utils._count_files_transformed(transformed['excluded'])
-        curated['unknown_count'] = self.utils._unknown_license_count_transformed(transformed['included'])
-        curated['licenses'] = self.utils._licenses_in_transformed(transformed['included'])
+        curated['files'] = files
+        curated['included_count'] = len(files['included'])
+        curated['excluded_count'] = len(files['excluded'])
+        curated['unknown_count'] = self.utils._unknown_license_count_transformed(files['included'])
+        curated['licenses'] = self.utils._licenses_in_transformed(files['included'])
         return curated
-        
+
+    # information about the files, only transformed and curated once
+    def _live_info(self, files, args):
+        if self.curated_files is not files:
+            return self._curated_info(files, args)
+        return self._info(files)
+
+    # curate the files included by a filter action
+    def _curate_moved(self, files, args, moved):
+        moved_in, moved_out = moved
+        if self.curated_files is files and moved_in != []:
+            self.utils._curate({ 'included': moved_in, 'excluded': [] }, args['file_curations'], args['license_curations'], args['missing_license_curation'])
+
     def _prompt(self, files, args):
-        curated = self._curated_info(files, args)
+        curated = self._live_info(files, args)
         
         inc_file_info    = str(curated['included_count']) + " files included" 
         exc_file_info    = " (" + str(curated['excluded_count']) + " excluded)" 
@@ -80,22 +111,56 @@ class ManifestorInteractor:
         tokens.pop(0)
         #for t in tokens:
         #    print("  expr  : " + t)
+        # only filter on the new reg_exp
+        incremental_filter = self._incremental_filter(files, args)
         if command == self.commands.COMMAND_EXCLUDE_FILE:
             args['excluded_regexps'].append(tokens)
+            self._curate_moved(files, args, incremental_filter.add_excludes(tokens))
         elif command == self.commands.COMMAND_INCLUDE_FILE:
             args['included_regexps'].append(tokens)
-
-        # TODO: filter on new reg_exp, not all
-        self.utils._filter(files, args['included_regexps'], args['excluded_regexps'])
+            self._curate_moved(files, args, incremental_filter.add_includes(tokens))
 
         #print("inc: " + str(len(files['included'])))
         #print("exc: " + str(len(files['excluded'])))
         return 0
 
+    def _handle_remove_filter_action(self, action, files, args):
+        command = self._action_command(action)
+        incremental_filter = self._incremental_filter(files, args)
+        for regexp in self._action_arguments(action):
+            try:
+                if command == self.commands.COMMAND_REMOVE_EXCLUDE_FILE or \
+                   command == self.commands.COMMAND_SHORT_REMOVE_EXCLUDE_FILE:
+                    self._curate_moved(files, args, incremental_filter.remove_exclude(regexp))
+                    self._remove_regexp(args['excluded_regexps'], regexp)
+                else:
+                    self._curate_moved(files, args, incremental_filter.remove_include(regexp))
+                    self._remove_regexp(args['included_regexps'], regexp)
+                    if args['included_regexps'] == []:
+                        # no include expressions (see ManifestUtils._filter)
+                        args['included_regexps'].append([])
+            except ValueError as e:
+                self.logger.error(str(e))
+                return 2
+        return 0
+
+    def _remove_regexp(self, regexp_lists, regexp):
+        for regexp_list in regexp_lists:
+            if regexp in regexp_list:
+                regexp_list.remove(regexp)
+                break
+        regexp_lists[:] = [ regexp_list for regexp_list in regexp_lists if regexp_list != [] ]
+
+    # filter, kept for the files, applying one reg_exp at a time
+    def _incremental_filter(self, files, args):
+        if self.filter is None or self.filter.files is not files:
+            self.filter = IncrementalFilter(self.utils, files, args['included_regexps'], args['excluded_regexps'])
+        return self.filter
+
     def _parse_action(self, action, files, args):
         self.logger.verbose("parse: \"" + action + "\"")
         if action.startswith("bye"):
-            curated = self._curated_info(files, args)
+            curated = self._live_info(files, args)
             unknown_count = curated['unknown_count']
             if unknown_count == 0:
                 return 1
@@ -120,6 +185,11 @@ class ManifestorInteractor:
         elif action.startswith(self.commands.COMMAND_EXCLUDE_FILE) or \
              action.startswith(self.commands.COMMAND_INCLUDE_FILE):
             return self._handle_filter_action(action, files, args)
+        elif self._action_command(action) in [ self.commands.COMMAND_REMOVE_EXCLUDE_FILE,
+                                               self.commands.COMMAND_SHORT_REMOVE_EXCLUDE_FILE,
+                                               self.commands.COMMAND_REMOVE_INCLUDE_FILE,
+                                               self.commands.COMMAND_SHORT_REMOVE_INCLUDE_FILE ]:
+            return self._handle_remove_filter_action(action, files, args)
         elif action.startswith(self.commands.COMMAND_CURATE_MISSING_LICENSE) or \
              action.startswith(self.commands.COMMAND_SHORT_CURATE_MISSING_LICENSE):
             return self._curate_missing_license(action, files, args)
@@ -193,6 +263,7 @@ class ManifestorInteractor:
         readline.set_completer_delims(' ')
         readline.set_completer(completer.complete)
         #print("words: " + str(words))
+        self._incremental_filter(files, args)
 
         while True:
             prompt = self._prompt(files, args)
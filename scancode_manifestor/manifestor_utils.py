@@ -15,7 +15,16 @@ import datetime
 import json
 import re
 import sys
-from license_expression import Licensing
+
+from scancode_manifestor.curation_engine import CurationEngine
+from scancode_manifestor.file_record import copyright_values
+from scancode_manifestor.file_record import manifestor_data
+from scancode_manifestor.file_record import spdx_license_keys
+from scancode_manifestor.license_index import LicenseIndex
+from scancode_manifestor.license_index import effective_license
+from scancode_manifestor.licensing_service import LicensingService
+from scancode_manifestor.path_matcher import PathMatcher
+from scancode_manifestor.path_tree import PathTree
 
 OBSOLETE = True
 
@@ -48,6 +57,15 @@ class FilterModifier(Enum):
     ANY   = 1
     ONLY  = 2
 
+#
+# Verbose messages are only written if debug is set. In loops over
+# files (or regexps) check debug before creating the message, e.g.
+#
+#   if self.logger.debug:
+#       self.logger.verbose("file: " + str(f['path']))
+#
+# so that no time is spent on messages that are not written.
+#
 class ManifestLogger:
     def __init__(self,debug):
         self.debug = debug
@@ -70,19 +88,22 @@ class ManifestLogger:
 class ManifestUtils:
     def __init__(self,logger):
         self.logger = logger
+        self.compiled_regexps = {}
+        self.licensing = LicensingService()
+        # license index of the included files in indexed_files (a
+        # files map), see _index_licenses
+        self.license_index = None
+        self.indexed_files = None
+        # statistics about the filter expressions, if set (see
+        # filter_stats.py)
+        self.filter_stats = None
 
     def _fetch_license(self, single_file):
         return self._extract_license(single_file)
     #    return single_file['license_expressions']
 
     def _fetch_copyright(self, single_file):
-        copyright_list = single_file['copyrights']
-        #print("single_file:    " + str(single_file['path']))
-        c_list = []
-        for c in copyright_list:
-            c_list.append(c['value'])
-            #print(" (c)  " + str(c['value']))
-        return c_list
+        return list(copyright_values(single_file))
 
     def _match_generic(self, single_file, filter, regexpr, only):
         # fetch list of items to search in
@@ -114,13 +135,15 @@ class ManifestUtils:
         # for each item, search for regexpr
         all_match = None
         one_match = False
+        search = self._compiled_search(regexpr)
         for i in items:
             needle = regexpr.strip()
-            found = re.search(needle, i)
-            self.logger.verbose("re.search('" + needle + "', '" + i + "')")
-            #print(single_file['path'] + " regexpr " + str(regexpr))
-            self.logger.verbose(single_file['path'] + " i       " + str(i))
-            self.logger.verbose(" found   " + str(type(found)))
+            found = search(i)
+            if self.logger.debug:
+                self.logger.verbose("re.search('" + needle + "', '" + i + "')")
+                #print(single_file['path'] + " regexpr " + str(regexpr))
+                self.logger.verbose(single_file['path'] + " i       " + str(i))
+                self.logger.verbose(" found   " + str(type(found)))
             #print(" found   " + str(found))
             #print(" found   " + str(found==True))
             if all_match == None:
@@ -140,6 +163,14 @@ class ManifestUtils:
             #print("return ONE")
             return one_match
 
+    # compiled (once) regexpr, instead of relying on re's cache
+    def _compiled_search(self, regexpr):
+        search = self.compiled_regexps.get(regexpr)
+        if search is None:
+            search = re.compile(regexpr.strip()).search
+            self.compiled_regexps[regexpr] = search
+        return search
+
     def _files_map(self, included_files, excluded_files):
         files_map = {}
         files_map['included'] = included_files
@@ -165,6 +196,10 @@ class ManifestUtils:
 
     # return count of license from a transformed file list
     def _licenses_in_transformed(self, files):
+        index = self._indexed(files)
+        if index is not None:
+            return index.licenses()
+
         licenses = set() 
         for f in files:
             assert 'scancode_manifestor' in f
@@ -185,18 +220,27 @@ class ManifestUtils:
     
     # return count of license from a transformed file list
     def _license_count_transformed(self, lic, files):
+        index = self._indexed(files)
+        if index is not None:
+            return index.license_count(lic)
+
         count = 0 
         for f in files:
-            if 'license_key' in f and f['license_key'] == lic:
+            if effective_license(f) == lic:
                 count += 1
             
         return count
     
     # return count of unknown licenses from a transformed file list
     def _unknown_license_count_transformed(self, files):
+        index = self._indexed(files)
+        if index is not None:
+            return index.license_count(None)
+
         count = 0 
         for f in files:
-            if 'license_key' not in f or f['license_key'] == None or f['license_key'] == []:
+            lic = effective_license(f)
+            if lic == None or lic == []:
                 count += 1
             
         return count
@@ -214,12 +258,15 @@ class ManifestUtils:
             raise ValueError("No filter modifier, or incorrect type, argument supplied")
 
         if isinstance(regexpr, list):
-            self.logger.self.logger.verbose("Woops, many items... filter: " + str(f['path']) + str(f['license_expressions']) )
+            if self.logger.debug:
+                self.logger.verbose("Woops, many items... filter: " + str(f['path']) + str(f['license_expressions']) )
             match = True
             for re in regexpr:
                 match = match and self._match_generic(f, filter, re, only)
-                self.logger.verbose("   re:" + str(re) + "  ==> " + str(match))
-            self.logger.verbose("   ===================> " + str(match))
+                if self.logger.debug:
+                    self.logger.verbose("   re:" + str(re) + "  ==> " + str(match))
+            if self.logger.debug:
+                self.logger.verbose("   ===================> " + str(match))
         else:
             #print(" match single : " + str(f['name']) + " " + str(f['license_expressions']) + " " + str(filter) + " " + str(regexpr))
             match = self._match_generic(f, filter, regexpr, only)
@@ -248,48 +295,81 @@ class ManifestUtils:
         except:
             raise ValueError("Incorrect list of files")
             
-        from_list = included
-        to_list = excluded
-
-        for f in from_list:
-            file_path = f['path']
-            match = self._match_file(f, filter, regexpr, include, only)
+        # partition the files in one pass, instead of removing each
+        # excluded file from the list of included files
+        kept = []
+        removed = []
+        stats = None
+        if self.filter_stats is not None:
+            stats = self.filter_stats.pattern(filter, include, regexpr)
+            match_file = self.filter_stats.timed(stats, lambda f: self._match_file(f, filter, regexpr, include, only))
+        for f in included:
+            if stats is None:
+                match = self._match_file(f, filter, regexpr, include, only)
+            else:
+                match = match_file(f)
+                if match:
+                    stats['matched'] += 1
             #print("-- match file: " + str(f['path'] + "  match: \"" + str(regexpr) + "\" ===> " + str(match)), file=sys.stderr)
             if match == None:
-                warn("Can't match: " + regexpr)
-            else:
-
-                
-                keep = self._keep_file(match, include)
-
-                #print("-- match file: " + str(f['path'] + "  match: \"" + str(regexpr) + "\" ===> " + str(match)) + "  ==> " + str(keep), file=sys.stderr)
-                if not keep:
-                    #print("remove   i:" + str(len(files['included'])) + "   e:" + str(len(excluded)) + " " + str(f) )
-
-                    self._add_scancode_manifestor_data(f, 'filter_type', filter)
-                    self._add_scancode_manifestor_data(f, 'filter_action', include)
-                    self._add_scancode_manifestor_data(f, 'filter_expr', str(regexpr))
-#                    excluded.append(f)
-
-#                    files['included'] = [x for x in files['included'].copy() if x['path'] != file_path ]
-                    #files['excluded'].append( files['included'].pop( files['included'].index( f ) ) )
+                self.logger.warn("Can't match: " + regexpr)
+                kept.append(f)
+                continue
 
-                    #print("remove   i:" + str(len(files['included'])) + "   e:" + str(len(excluded)))
-                    to_list.append(f)
-                    from_list = [x for x in from_list.copy() if x['path'] != file_path ]
+            keep = self._keep_file(match, include)
+            if not keep:
+                self._add_filter_data(f, filter, include, regexpr)
+                removed.append(f)
+            else:
+                # OK, we should keep it
 
-                else:
-                    # OK, we should keep it
+                # if we explcitly included it, mark it as such
+                if include == FilterAction.INCLUDE:
+                    self._add_filter_data(f, filter, include, regexpr)
+                kept.append(f)
 
-                    # if we explcitly included it, mark it as such
-                    if include == FilterAction.INCLUDE:
-                        self._add_scancode_manifestor_data(f, 'filter_type', filter)
-                        self._add_scancode_manifestor_data(f, 'filter_action', include)
-                        self._add_scancode_manifestor_data(f, 'filter_expr', str(regexpr))
+        excluded.extend(removed)
+        files['included'] = kept
+        files['excluded'] = excluded
+        return files
 
+    def _add_filter_data(self, f, filter, action, regexpr):
+        self._add_scancode_manifestor_data(f, 'filter_type', filter)
+        self._add_scancode_manifestor_data(f, 'filter_action', action)
+        self._add_scancode_manifestor_data(f, 'filter_expr', str(regexpr))
 
-        files = self._files_map(from_list, to_list)
-        return files
+    def _remove_filter_data(self, f):
+        if 'scancode_manifestor' not in f:
+            return
+        manifestor_map = f['scancode_manifestor']
+        for key in [ 'filter_type', 'filter_action', 'filter_expr' ]:
+            if key in manifestor_map:
+                del manifestor_map[key]
+
+    #
+    # Split files on the first path regexp (in the order given) they
+    # match. Returns the files not matching any regexp and, for each
+    # regexp, the files it matched. All in one pass over the files.
+    # action is only used for the filter statistics.
+    #
+    def _partition_path(self, files, regexps, action=FilterAction.EXCLUDE):
+        timed = None
+        if self.filter_stats is not None:
+            stats = [ self.filter_stats.pattern(FilterAttribute.PATH, action, regexp) for regexp in regexps ]
+            timed = lambda index, search: self.filter_stats.timed(stats[index], search)
+        matcher = PathMatcher(regexps, timed)
+        unmatched = []
+        matched = [ [] for regexp in regexps ]
+        first_matches = matcher.first_matches([ f['path'] for f in files ])
+        for f, index in zip(files, first_matches):
+            if index is None:
+                unmatched.append(f)
+            else:
+                matched[index].append(f)
+        if self.filter_stats is not None:
+            for index, matched_files in enumerate(matched):
+                stats[index]['matched'] += len(matched_files)
+        return unmatched, matched
 
     def _isfile(self, f):
         return f['type'] == "file"
@@ -306,9 +386,8 @@ class ManifestUtils:
 
     def _extract_license_spdx(self, f):
         licenses = set()
-        for lic in f['licenses']:
-            #print("Add license key: " + f['path'] + " " + lic['key'])
-            licenses.add(lic['spdx_license_key'])
+        for key in spdx_license_keys(f):
+            licenses.add(key)
         return licenses
 
 
@@ -316,49 +395,93 @@ class ManifestUtils:
         licenses = set()
         dir_name = dir['path']
         files = _files[key]
-        self.logger.verbose("_dir_licenses: " + dir_name)
+        if self.logger.debug:
+            self.logger.verbose("_dir_licenses: " + dir_name)
         for f in files:
             file_name = f['path']
             if file_name.startswith(dir_name):
                 licenses.update(self._extract_license(f))
-                self.logger.verbose(" * include: " + file_name + "   " + str(licenses) + " " + str(self._extract_license(f)))
-            else:
+                if self.logger.debug:
+                    self.logger.verbose(" * include: " + file_name + "   " + str(licenses) + " " + str(self._extract_license(f)))
+            elif self.logger.debug:
                 self.logger.verbose(" * ignore:  " + file_name)
         return licenses
 
+    #
+    # Licenses (path => set of licenses) of all dirs in files[key], as
+    # found by _dir_licenses but for the files in the dir (not the files
+    # with a path starting with the dir's path). The licenses are
+    # collected bottom-up, in one post-order pass over a path tree.
+    #
+    def _dirs_licenses(self, files, key):
+        tree = PathTree()
+        for f in files[key]:
+            tree.add(f['path'], f)
+
+        node_licenses = {}
+        dirs_licenses = {}
+        for path, node in tree.walk_post_order():
+            licenses = set()
+            for f in node.values:
+                licenses.update(self._extract_license(f))
+            for child in node.children.values():
+                licenses.update(node_licenses.pop(id(child)))
+            node_licenses[id(node)] = licenses
+            for f in node.values:
+                if self._isdir(f):
+                    dirs_licenses[f['path']] = licenses
+        return dirs_licenses
 
     def _filter(self, _files, included_regexps, excluded_regexps):
         files = _files
+        index = self._indexed(files)
 
         exc = _files['excluded']
         inc = _files['included']
 
+        # files may be streamed from the scancode report, collect them
+        # as they pass through the filter
+        if not isinstance(inc, list):
+            inc = list(inc)
+            files['included'] = inc
+
         if not (len(included_regexps) == 1 and included_regexps[0] == []):
             #print("SWAPPIE: " + str(len(included_regexps)))
-            files['excluded'] = inc
-            files['included'] = exc
-                
-            #print("files 1 #: " + str(len(_files['included'])))
+            regexps = []
             for regexp_list in included_regexps:
                 self.logger.verbose("Include file:    " + str(regexp_list))
                 for regexp in regexp_list:
-                    #print("Include file:    " + str(regexp))
                     self.logger.verbose(" * include file:    " + regexp)
-                    for f in files['excluded']:
-                        #print("compare: " + str(f['path']) + " == " + regexp)
-                        if self._match_file(f, FilterAttribute.PATH, regexp):
-                            self._add_scancode_manifestor_data(f, 'filter_type', FilterAttribute.PATH)
-                            self._add_scancode_manifestor_data(f, 'filter_action', True)
-                            self._add_scancode_manifestor_data(f, 'filter_expr', str(regexp))
-                            file_path = f['path']
-                            files['included'].append(f)
-                            files['excluded'] = [x for x in files['excluded'].copy() if x['path'] != file_path ]
-        
+                    regexps.append(regexp)
+
+            # everything is excluded, except files matching an include regexp
+            unmatched, matched = self._partition_path(inc, regexps, FilterAction.INCLUDE)
+            if index is not None:
+                self._move_in_index(index, exc, unmatched)
+            included = exc
+            for regexp, matched_files in zip(regexps, matched):
+                for f in matched_files:
+                    self._add_filter_data(f, FilterAttribute.PATH, FilterAction.INCLUDE, regexp)
+                included.extend(matched_files)
+            files['included'] = included
+            files['excluded'] = unmatched
+
+        regexps = []
         for regexp_list in excluded_regexps:
             self.logger.verbose("Exclude file:    " + str(regexp_list))
             for regexp in regexp_list:
                 self.logger.verbose(" * exclude file:    " + regexp)
-                files = self._filter_generic(files, FilterAttribute.PATH, regexp, FilterAction.EXCLUDE)
+                regexps.append(regexp)
+
+        if regexps != []:
+            unmatched, matched = self._partition_path(files['included'], regexps, FilterAction.EXCLUDE)
+            for regexp, matched_files in zip(regexps, matched):
+                for f in matched_files:
+                    self._add_filter_data(f, FilterAttribute.PATH, FilterAction.EXCLUDE, regexp)
+                if index is not None:
+                    self._move_in_index(index, [], matched_files)
+                files['excluded'].extend(matched_files)
+            files['included'] = unmatched
 
         if OBSOLETE == False:
             for regexp_list in show_licenses:
@@ -381,8 +504,36 @@ class ManifestUtils:
 
     def _add_scancode_manifestor_data(self, f, key, data):
         if 'scancode_manifestor' not in f:
-            f['scancode_manifestor'] = {}
+            f['scancode_manifestor'] = manifestor_data(f)
         f['scancode_manifestor'][key] = data
+        if self.license_index is not None and key in ('license_key', 'curated_license'):
+            self.license_index.update(f)
+
+    #
+    # Index (see license_index.py) the included files in files, if not
+    # already indexed. The index is then kept up to date when files
+    # are filtered and curated.
+    #
+    def _index_licenses(self, files):
+        if self.indexed_files is not files:
+            self.license_index = LicenseIndex(files['included'])
+            self.indexed_files = files
+        return self.license_index
+
+    # the license index, if files (a files map or its included files) is indexed
+    def _indexed(self, files):
+        if self.indexed_files is None:
+            return None
+        if files is self.indexed_files or files is self.indexed_files['included']:
+            return self.license_index
+        return None
+
+    def _move_in_index(self, index, added, removed):
+        for f in removed:
+            index.remove(f)
+        for f in added:
+            if self._isfile(f):
+                index.add(f)
 
 
         
@@ -419,8 +570,8 @@ class ManifestUtils:
             self._add_scancode_manifestor_data(f, 'license_spdx', spdx_expr)
 
             copyrights = set()
-            for c in f['copyrights']:
-                copyrights.add(c['value'])
+            for c in copyright_values(f):
+                copyrights.add(c)
             self._add_scancode_manifestor_data(f, 'copyright', list(copyrights))
             #file_list.append(file_map)
         #return file_list
@@ -437,19 +588,29 @@ class ManifestUtils:
         self._transform_files_helper(files['included'])
         self._transform_files_helper(files['excluded'])
         #print("sizes=" + str(len(files['included'])) + " " + str(len(files['excluded'])))
+        # move everything but files to excluded, in one pass
+        included = []
+        excluded_ids = None
         for f in files['included']:
-            if f['type'] != "file":
-                if f not in files['excluded']:
-                    files['excluded'].append(f)
-                    #print("Adding " + str(f['path']) + " " + str(f['type']))
-        files['included'] = [x for x in files['included'].copy() if x['type'] == "file" ]
+            if f['type'] == "file":
+                included.append(f)
+                continue
+            if excluded_ids is None:
+                excluded_ids = set([ id(x) for x in files['excluded'] ])
+            if id(f) not in excluded_ids:
+                files['excluded'].append(f)
+                excluded_ids.add(id(f))
+                #print("Adding " + str(f['path']) + " " + str(f['type']))
+        files['included'] = included
         #print("sizes=" + str(len(files['included'])) + " " + str(len(files['excluded'])))
+        self._index_licenses(files)
         
 
     def _curate_file_license(self, files, regexpr, lic):
         for f in files['included']:
             if re.search(regexpr, f['path']):
-                self.logger.verbose(f['name'] + " => " + lic)
+                if self.logger.debug:
+                    self.logger.verbose(f['name'] + " => " + lic)
                 self._add_scancode_manifestor_data(f, 'curation_type', 'file')
                 self._add_scancode_manifestor_data(f, 'curation_expr', regexpr)
                 self._add_scancode_manifestor_data(f, 'curated_license', "(" + lic + ")" )
@@ -457,7 +618,8 @@ class ManifestUtils:
     def _do_curate_license(self, f, lic, reg_expr=None):
         if reg_expr is None:
             # Just change it
-            self.logger.verbose(f['name'] + " missing license_key => " + lic)
+            if self.logger.debug:
+                self.logger.verbose(f['name'] + " missing license_key => " + lic)
             self._add_scancode_manifestor_data(f, 'curation_type', 'license')
             self._add_scancode_manifestor_data(f, 'curated_license', "(" + lic + ")")
             self._add_scancode_manifestor_data(f, 'curation_expr', "[]")
@@ -477,7 +639,8 @@ class ManifestUtils:
                     curated_license += le
 
             if curations > 0:
-                self.logger.verbose(f['name'] + " license curation => " + lic)
+                if self.logger.debug:
+                    self.logger.verbose(f['name'] + " license curation => " + lic)
                 self._add_scancode_manifestor_data(f, 'curation_type', 'license')
                 self._add_scancode_manifestor_data(f, 'curated_license', "(" + curated_license + ")")
                 self._add_scancode_manifestor_data(f, 'curation_expr', reg_expr)
@@ -489,6 +652,13 @@ class ManifestUtils:
         curations = 0 
         new_list = []
         included_files = files['included']
+        index = self._indexed(files)
+        if index is not None:
+            # only the files with the license
+            if regexpr == "[]":
+                included_files = index.files_with_expression(None)
+            else:
+                included_files = index.files_with_expression(regexpr)
         #print("files: " + str(len(files['included'])))
         for f in included_files:
             #print("file: " + str(f['path']))
@@ -497,7 +667,7 @@ class ManifestUtils:
             if regexpr == "[]":
                 #if "dumps" in f['path']:
                     #print("----HERE I AM " + str(f['path'] + " " + str(f)))
-                if f['license_expressions'] == []:
+                if len(f['license_expressions']) == 0:
                     curation_cnt = self._do_curate_license(f, lic)
                     curations += curation_cnt
                             
@@ -510,37 +680,26 @@ class ManifestUtils:
     def _curate(self, files, file_curations, license_curations, missing_license_curation):
         #print("curate cml: " + str(missing_license_curation))
         self.logger.verbose("curations: " + str(file_curations))
-                
-        for curation in file_curations:
-            self.logger.verbose("  * " + str(curation))
-            length = len(curation)
-            if length < 2:
-                error("Bad curation: " + str(curation))
-                # TODO: throw exception instead of exit
-                exit(2)
-            else:
-                lic = curation[length-1]
-                # TODO: make sure lic is a valid license
-                for i in range(0,length-1):
-                    self.logger.verbose("      * " + curation[i] + " => " + lic)
-                    self._curate_file_license(files, curation[i], lic)
-
-        for curation in license_curations:
+        for curation in file_curations + license_curations:
             self.logger.verbose("  * " + str(curation))
-            length = len(curation)
-            if length < 2:
-                self.logger.error("Bad curation: " + str(curation))
-                # TODO: throw exception instead of exit
-                exit(2)
-            else:
-                lic = curation[length-1]
-                # TODO: make sure lic is a valid license
-                for i in range(0,length-1):
-                    self.logger.verbose("      * " + curation[i] + " => " + lic)
-                    self._curate_license(files, curation[i], lic)
 
-        if missing_license_curation:
-            self._curate_license(files, "[]", missing_license_curation)
+        try:
+            # all curations in one pass over the files
+            engine = CurationEngine(file_curations, license_curations, missing_license_curation)
+        except ValueError as e:
+            self.logger.error(str(e))
+            # TODO: throw exception instead of exit
+            exit(2)
+
+        for f, curation in engine.curations(files['included']):
+            if curation is None:
+                continue
+            curation_type, curation_expr, curated_license = curation
+            if self.logger.debug:
+                self.logger.verbose(f['name'] + " " + curation_type + " curation => " + curated_license)
+            self._add_scancode_manifestor_data(f, 'curation_type', curation_type)
+            self._add_scancode_manifestor_data(f, 'curation_expr', curation_expr)
+            self._add_scancode_manifestor_data(f, 'curated_license', curated_license)
 
         return files
 
@@ -585,15 +744,7 @@ class ManifestUtils:
                 #print(" ADD " + l)
                 license_set.add(l)
 
-        license_string = ""
-        for l in license_set:
-            #print ("l:  " + str(l))
-            if license_string != "":
-                license_string += " AND "
-            license_string += " ( " + l + " ) "
-        licensing = Licensing()
-        parsed = licensing._parse_and_simplify(license_string)
-        return parsed
+        return self.licensing.conclusion(license_set)
     
     def license_summary(self, files):
         return self._license_summary(files)
@@ -602,14 +753,17 @@ class ManifestUtils:
         licenses={}
         for f in files:
             print(" path " + str(f['path']))
-            self.logger.verbose(" lice " + str(f['license_expressions']))
+            if self.logger.debug:
+                self.logger.verbose(" lice " + str(f['license_expressions']))
             if self._isfile(f):
                 lic = None
                 lic_list = list(self._extract_license(f))
-                self.logger.verbose(" list " + str(lic_list))
+                if self.logger.debug:
+                    self.logger.verbose(" list " + str(lic_list))
                 lic_list.sort()
                 for l in lic_list:
-                    self.logger.verbose(" l    " + str(l))
+                    if self.logger.debug:
+                        self.logger.verbose(" l    " + str(l))
                     if lic == None:
                         lic = l
                     else:
@@ -619,12 +773,14 @@ class ManifestUtils:
                             lic += " and " + l
                             
 
-                self.logger.verbose(" lic  " + str(lic))
+                if self.logger.debug:
+                    self.logger.verbose(" lic  " + str(lic))
                 if lic in licenses:
                     licenses[lic] += 1
                 else:
                     licenses[lic] = 1
-                self.logger.verbose (" === " + str(lic) + " ==> " + str(licenses[lic]))
+                if self.logger.debug:
+                    self.logger.verbose (" === " + str(lic) + " ==> " + str(licenses[lic]))
 
                 #licenses.add(self._extract_license(f))
         self.logger.verbose(" ===> " + str(licenses))
@@ -646,7 +802,8 @@ class ManifestUtils:
             #print("----> " + json.dumps(f, indent=6))
             #print("----> " + str(f['type']))
             manifest_map = f['scancode_manifestor']
-            self.logger.verbose("validating " + str(f['name']))
+            if self.logger.debug:
+                self.logger.verbose("validating " + str(f['name']))
             if f['name'] == None or f['name'] == "":
                 errors.append("File name can't be None or \"\"")
             if manifest_map['license_key'] == None or manifest_map['license_key'] == []:
@@ -674,6 +831,10 @@ class ManifestUtils:
         return ret
 
     def _scancode_report_files_count(self, scancode_report):
+        # counted while streaming the report (see ScancodeReportReader)
+        if 'files_count' in scancode_report:
+            return scancode_report['files_count']
+
         dirs = 0
         files = 0 
         for f in scancode_report['files']:
@@ -695,7 +856,8 @@ class ManifestUtils:
                 continue
             manifest_map = f['scancode_manifestor']
             #print("collecting info " + str(f))
-            self.logger.verbose("collecting info " + str(f['name']) + " " + str(manifest_map['license_key']))
+            if self.logger.debug:
+                self.logger.verbose("collecting info " + str(f['name']) + " " + str(manifest_map['license_key']))
             for c in manifest_map['copyright']:
                 copyrights.add(c)
 
@@ -751,8 +913,7 @@ class ManifestUtils:
         c_list.sort()
 
         #print("\nlicenses: " + str(lic_expr))
-        licensing = Licensing()
-        parsed = licensing._parse_and_simplify(lic_expr)
+        parsed = self.licensing.conclusion([ str(lic) for lic in licenses ])
         json_compat_lic = str(parsed).replace("AND", " & ")
         #print("\nlicenses: " + str(parsed))
         #exit(0)
@@ -877,46 +1038,59 @@ class ManifestUtils:
         #print("show_file: " + str(show_file))
 
         for regexp_list in show_licenses:
-            self.logger.verbose(" * Show licenses:    " + str(regexp_list))
+            if self.logger.debug:
+                self.logger.verbose(" * Show licenses:    " + str(regexp_list))
             for regexp in regexp_list:
                 match = self._match_file(f, FilterAttribute.LICENSE, regexp)
                 # any match => show_file becomes True
                 show_file = show_file or match
-                self.logger.verbose("    * show license: " + regexp + " ==> " + str(match))
+                if self.logger.debug:
+                    self.logger.verbose("    * show license: " + regexp + " ==> " + str(match))
 
         for regexp_list in hide_licenses:
-            self.logger.verbose(" * Hide licenses:    " + str(regexp_list))
+            if self.logger.debug:
+                self.logger.verbose(" * Hide licenses:    " + str(regexp_list))
             for regexp in regexp_list:
                 match = self._match_file(f, FilterAttribute.LICENSE, regexp)
                 if match:
                     show_file = False
-                self.logger.verbose("    * hide license: " + regexp + " ==> " + str(match))
+                if self.logger.debug:
+                    self.logger.verbose("    * hide license: " + regexp + " ==> " + str(match))
 
         for regexp_list in hide_only_licenses:
-            self.logger.verbose(" * Hide only licenses:    " + str(regexp_list))
+            if self.logger.debug:
+                self.logger.verbose(" * Hide only licenses:    " + str(regexp_list))
             for regexp in regexp_list:
                 match = self._match_file(f, FilterAttribute.LICENSE, regexp, FilterAction.INCLUDE, FilterModifier.ONLY)
                 if match:
                     show_file = False
-                self.logger.verbose("    * hide license: " + regexp + " ==> " + str(match))
+                if self.logger.debug:
+                    self.logger.verbose("    * hide license: " + regexp + " ==> " + str(match))
 
 
         if show_file:
             print(" f " + f['path'] + " " + str(licenses), file=stream)
-        else:
+        elif self.logger.debug:
             self.logger.verbose("                     hide " + f['path'] + " " + str(licenses))
 
-    def _output_single(self, files, f, show_files=True, show_dirs=False, file_key='included', stream=sys.stdout, hiders=None):
+    def _output_single(self, files, f, show_files=True, show_dirs=False, file_key='included', stream=sys.stdout, hiders=None, dirs_licenses=None):
 
         if show_files and self._isfile(f):
             self._output_single_file(f, stream, hiders)
         elif show_dirs and self._isdir(f):
-            licenses = list(self._dir_licenses(files, f, file_key))
-            print(" d " + f['path'] + " " + str(licenses), file=stream)
+            if dirs_licenses is None:
+                licenses = self._dir_licenses(files, f, file_key)
+            else:
+                licenses = dirs_licenses[f['path']]
+            print(" d " + f['path'] + " " + str(sorted(licenses)), file=stream)
 
     def _output_filtered_helper(self, files, show_files=True, show_dirs=False, file_key='included', stream=sys.stdout, hiders=None):
+        dirs_licenses = None
+        if show_dirs:
+            # licenses of all dirs, at once
+            dirs_licenses = self._dirs_licenses(files, file_key)
         for f in files[file_key]:
-            self._output_single(files, f, show_files, show_dirs, file_key, stream, hiders)
+            self._output_single(files, f, show_files, show_dirs, file_key, stream, hiders, dirs_licenses)
 
 
     def _output_filtered(self, files, show_files=True, show_dirs=False, stream=sys.stdout, show_excluded=False, hiders=None):
@@ -0,0 +1,173 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import re
+
+from scancode_manifestor.literal_prefilter import LiteralPrefilter
+from scancode_manifestor.path_tree import PathTree
+from scancode_manifestor.path_tree import SEPARATOR
+
+#
+# Matches paths against a list of regular expressions (as used with
+# include/exclude files) and tells which expression, in the order
+# given, is the first one to match.
+#
+# The expressions are compiled once, when the matcher is created. A
+# combined expression (all expressions as alternatives) is not used
+# since Python's re module tries every alternative at every position
+# in the path, which makes it a lot slower than searching with the
+# expressions one by one. Instead a literal prefilter (see
+# literal_prefilter.py) picks the few expressions that can match a
+# path, and only those are searched with.
+#
+
+# Never matches a path (see ManifestUtils._match_generic)
+EMPTY_EXPR = "[]"
+
+#
+# An expression ending with "/" (e.g. "autom4te\.cache/") is a directory
+# expression. If it matches "dir/", it matches every path below dir as
+# well, unless it looks at how the path ends or at what follows.
+#
+DIRECTORY_EXPR_BLOCKERS = [ "$", "\\Z", "\\b", "\\B", "(?=", "(?!", "(?<", "(?(" ]
+
+def is_directory_expr(needle):
+    if not needle.endswith(SEPARATOR):
+        return False
+    for blocker in DIRECTORY_EXPR_BLOCKERS:
+        if blocker in needle:
+            return False
+    return True
+
+#
+# If timed is given, timed(index, search) is used instead of the
+# search function of the expression with that index, e.g. to collect
+# statistics (see filter_stats.py).
+#
+class PathMatcher:
+    def __init__(self, regexps, timed=None):
+        self.regexps = list(regexps)
+        self.searchers = {}
+        needles = []
+        # index (in regexps) of each directory expression
+        self.dir_indexes = []
+        for index, regexp in enumerate(self.regexps):
+            needle = regexp.strip()
+            if needle != EMPTY_EXPR:
+                search = re.compile(needle).search
+                if timed is not None:
+                    search = timed(index, search)
+                self.searchers[index] = search
+                if is_directory_expr(needle):
+                    self.dir_indexes.append(index)
+            needles.append(needle)
+        self.prefilter = LiteralPrefilter(needles)
+        # "[]" is never tried
+        self.prefilter.always.intersection_update(self.searchers.keys())
+
+        self.dir_indexes = frozenset(self.dir_indexes)
+
+    #
+    # index of the first expression matching path, None if none
+    # matches. Only expressions with an index lower than limit are
+    # tried.
+    #
+    def first_match(self, path, limit=None):
+        return self._first_match(path, self.prefilter.candidates(path), limit)
+
+    def _first_match(self, path, candidates, limit):
+        for index in candidates:
+            if limit is not None and index >= limit:
+                return None
+            if self.searchers[index](path):
+                return index
+        return None
+
+    # first expression matching path, None if none matches
+    def first_match_expr(self, path):
+        index = self.first_match(path)
+        if index is None:
+            return None
+        return self.regexps[index]
+
+    #
+    # first_match for each path in paths. The paths are grouped per
+    # directory in a tree (see path_tree.py), so that the literal
+    # prefilter scans a directory shared by many paths only once. When
+    # a directory expression matches a directory, the paths below it
+    # are known to match that expression. They are only tried with the
+    # expressions before it.
+    #
+    def first_matches(self, paths):
+        matches = [ None ] * len(paths)
+        if not self.searchers:
+            return matches
+
+        tree = PathTree()
+        dir_nodes = {}
+        # paths without a directory
+        top = []
+        for position, path in enumerate(paths):
+            dir_path, separator, name = path.rpartition(SEPARATOR)
+            if separator == "":
+                top.append((name, position))
+                continue
+            node = dir_nodes.get(dir_path)
+            if node is None:
+                node = tree.node(dir_path, create=True)
+                dir_nodes[dir_path] = node
+            node.values.append((name, position))
+        dir_nodes = None
+
+        scan = self.prefilter.automaton.scan
+        limit = len(self.regexps)
+        self._entry_matches(top, 0, frozenset(), limit, None, paths, matches)
+
+        # (path, name, node, prefilter state and found literals before
+        # name, limit, default)
+        stack = [ (name, name, child, 0, frozenset(), limit, None) for name, child in tree.root.children.items() ]
+        while stack:
+            path, name, node, state, found, limit, default = stack.pop()
+            state, found = scan(name + SEPARATOR, state, found)
+
+            # paths below a directory matching a directory expression
+            if self.dir_indexes and limit > 0:
+                dir_index = self._first_dir_match(path + SEPARATOR, found, limit)
+                if dir_index is not None:
+                    limit = dir_index
+                    default = dir_index
+
+            self._entry_matches(node.values, state, found, limit, default, paths, matches)
+
+            for name, child in node.children.items():
+                stack.append((path + SEPARATOR + name, name, child, state, found, limit, default))
+        return matches
+
+    def _entry_matches(self, entries, state, found, limit, default, paths, matches):
+        scan = self.prefilter.automaton.scan
+        for name, position in entries:
+            index = None
+            if limit > 0:
+                name_state, name_found = scan(name, state, found)
+                candidates = self.prefilter.found_candidates(name_found)
+                index = self._first_match(paths[position], candidates, limit)
+            if index is None:
+                index = default
+            matches[position] = index
+
+    def _first_dir_match(self, dir_path, found, limit):
+        for index in self.prefilter.found_candidates(found):
+            if index >= limit:
+                return None
+            if index in self.dir_indexes and self.searchers[index](dir_path):
+                return index
+        return None
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+#
+# Tree (trie) of paths, split on "/". Each node may hold values, e.g.
+# the position of the file with that path in a list of files.
+#
+
+SEPARATOR = "/"
+
+class PathNode:
+    __slots__ = ('children', 'values')
+
+    def __init__(self):
+        self.children = {}
+        self.values = []
+
+
+class PathTree:
+    def __init__(self):
+        self.root = PathNode()
+
+    def add(self, path, value):
+        node = self.node(path, create=True)
+        node.values.append(value)
+        return node
+
+    def node(self, path, create=False):
+        node = self.root
+        for name in path.split(SEPARATOR):
+            child = node.children.get(name)
+            if child is None:
+                if not create:
+                    return None
+                child = PathNode()
+                node.children[name] = child
+            node = child
+        return node
+
+    #
+    # (path, node) for all nodes, with the children of a node before
+    # the node itself
+    #
+    def walk_post_order(self):
+        stack = [ (name, child, False) for name, child in self.root.children.items() ]
+        while stack:
+            path, node, visited = stack.pop()
+            if visited:
+                yield path, node
+                continue
+            stack.append((path, node, True))
+            for name, child in node.children.items():
+                stack.append((path + SEPARATOR + name, child, False))
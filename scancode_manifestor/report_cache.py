@@ -0,0 +1,148 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import hashlib
+import json
+import os
+
+from scancode_manifestor.file_record import FileRecordFactory
+from scancode_manifestor.scancode_report import ScancodeReportReader
+
+#
+# Cache of parsed scancode reports.
+#
+# The first time a report is read, the information used by the
+# manifestor is written to a snapshot in the cache directory. The
+# snapshot is a JSON document per line: the format and version, a
+# record per file:
+#
+#   [path, name, type, file_type, license_expressions, spdx license keys, copyrights]
+#
+# null, the headers and file count and last the offset (zero padded)
+# of the headers. Later runs on the same report (same size,
+# modification time and content) read the snapshot instead of parsing
+# the whole JSON report, and create FileRecords (see file_record.py)
+# directly from the records.
+#
+# The snapshot only holds data (no pickle), so a snapshot written by
+# someone else, e.g. in a shared cache directory, can not run code.
+#
+
+SNAPSHOT_FORMAT = "scancode-manifestor-snapshot"
+SNAPSHOT_VERSION = 3
+SNAPSHOT_SUFFIX = ".snapshot"
+
+TRAILER_FORMAT = "%020d\n"
+TRAILER_SIZE = len(TRAILER_FORMAT % 0)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def _line(value):
+    return (json.dumps(value) + "\n").encode()
+
+class ReportCache:
+    def __init__(self, cache_dir, logger):
+        self.cache_dir = cache_dir
+        self.logger = logger
+
+    def _content_hash(self, file_name):
+        sha = hashlib.sha256()
+        with open(file_name, "rb") as fp:
+            while True:
+                data = fp.read(HASH_CHUNK_SIZE)
+                if not data:
+                    break
+                sha.update(data)
+        return sha.hexdigest()
+
+    def snapshot_name(self, file_name):
+        stat = os.stat(file_name)
+        key = self._content_hash(file_name) + "-" + str(stat.st_size) + "-" + str(stat.st_mtime_ns)
+        return os.path.join(self.cache_dir, key + "-v" + str(SNAPSHOT_VERSION) + SNAPSHOT_SUFFIX)
+
+    # reader for file_name, from the cache if possible
+    def reader(self, file_name):
+        snapshot = self.snapshot_name(file_name)
+        if os.path.isfile(snapshot):
+            self.logger.verbose("Reading cached scancode report: " + snapshot)
+            return SnapshotReader(snapshot)
+        self.logger.verbose("Caching scancode report to: " + snapshot)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return CachingReader(ScancodeReportReader(file_name), snapshot, self.logger)
+
+
+def _snapshot_record(f):
+    spdx_keys = [ lic['spdx_license_key'] for lic in f['licenses'] ]
+    copyrights = [ c['value'] for c in f['copyrights'] ]
+    return [ f['path'], f['name'], f['type'], f['file_type'], list(f['license_expressions']), spdx_keys, copyrights ]
+
+#
+# Reads a scancode report and writes a snapshot of it while the files
+# are streamed. The snapshot is only kept if all files were read.
+#
+class CachingReader:
+    def __init__(self, reader, snapshot, logger):
+        self.reader = reader
+        self.snapshot = snapshot
+        self.logger = logger
+        self.files_count = None
+
+    def headers(self):
+        return self.reader.headers()
+
+    def files(self):
+        tmp_snapshot = self.snapshot + "." + str(os.getpid()) + ".tmp"
+        completed = False
+        try:
+            with open(tmp_snapshot, "wb") as fp:
+                fp.write(_line([ SNAPSHOT_FORMAT, SNAPSHOT_VERSION ]))
+                for f in self.reader.files():
+                    fp.write(_line(_snapshot_record(f)))
+                    yield f
+                fp.write(_line(None))
+                self.files_count = self.reader.files_count
+                offset = fp.tell()
+                fp.write(_line([ self.reader.headers(), self.files_count ]))
+                fp.write((TRAILER_FORMAT % offset).encode())
+            os.replace(tmp_snapshot, self.snapshot)
+            completed = True
+        finally:
+            if not completed and os.path.exists(tmp_snapshot):
+                os.remove(tmp_snapshot)
+
+
+class SnapshotReader:
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.files_count = None
+        self._headers = None
+
+    def headers(self):
+        if self._headers is None:
+            with open(self.snapshot, "rb") as fp:
+                fp.seek(-TRAILER_SIZE, os.SEEK_END)
+                offset = int(fp.read())
+                fp.seek(offset)
+                self._headers, self.files_count = json.loads(fp.readline())
+        return self._headers
+
+    def files(self):
+        with open(self.snapshot, "rb") as fp:
+            if json.loads(fp.readline()) != [ SNAPSHOT_FORMAT, SNAPSHOT_VERSION ]:
+                raise ValueError("Unsupported scancode report snapshot: " + self.snapshot)
+            factory = FileRecordFactory()
+            for line in fp:
+                record = json.loads(line)
+                if record is None:
+                    break
+                yield factory.record(*record)
+            self._headers, self.files_count = json.loads(fp.readline())
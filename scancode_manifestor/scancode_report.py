@@ -0,0 +1,170 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import json
+
+#
+# Reads a scancode report (JSON) without loading the whole document
+# into memory. The top level object is walked key by key and the
+# entries in the "files" list are decoded and handed out one at a
+# time. Everything else (e.g. "headers") is small and decoded as a
+# whole.
+#
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+WHITESPACE = " \t\n\r"
+
+class ScancodeReportReader:
+    def __init__(self, file_name, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.file_name = file_name
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.files_count = None
+        self._headers = None
+
+    def headers(self):
+        if self._headers is None:
+            self._headers = []
+            for key, value in self._top_level(skip_files=True):
+                if key == 'headers':
+                    self._headers = value
+                    break
+        return self._headers
+
+    def files(self):
+        dirs = 0
+        files = 0
+        self.files_count = None
+        for key, value in self._top_level(skip_files=False):
+            if key == 'headers' and self._headers is None:
+                self._headers = value
+            elif key == 'files':
+                for f in value:
+                    if f['type'] == "directory":
+                        dirs += 1
+                    elif f['type'] == "file":
+                        files += 1
+                    yield f
+        self.files_count = { 'dirs': dirs, 'files': files}
+        if self._headers is None:
+            # the whole report is read, there are no headers
+            self._headers = []
+
+    #
+    # (key, value) for each top level item in the report. The value
+    # for "files" is a generator over the entries, which must be
+    # consumed before the next item is read. With skip_files the
+    # entries are decoded and thrown away.
+    #
+    def _top_level(self, skip_files):
+        with open(self.file_name) as fp:
+            stream = _JSONStream(fp, self.decoder, self.chunk_size)
+            stream.expect("{")
+            if stream.peek() == "}":
+                return
+            while True:
+                key = stream.value()
+                stream.expect(":")
+                if key == 'files':
+                    entries = stream.array()
+                    if skip_files:
+                        for entry in entries:
+                            pass
+                    else:
+                        yield key, entries
+                        # drain whatever the caller did not read
+                        for entry in entries:
+                            pass
+                else:
+                    yield key, stream.value()
+                if stream.next_char() == "}":
+                    return
+                stream.back()
+                stream.expect(",")
+
+
+class _JSONStream:
+    def __init__(self, fp, decoder, chunk_size):
+        self.fp = fp
+        self.decoder = decoder
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, wanted):
+        # drop already consumed data before reading more
+        if self.pos > 0:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        while not self.eof and len(self.buf) < wanted:
+            data = self.fp.read(max(self.chunk_size, wanted - len(self.buf)))
+            if data == "":
+                self.eof = True
+            self.buf += data
+
+    def _skip_whitespace(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or self.eof:
+                return
+            self._fill(self.chunk_size)
+
+    def peek(self):
+        self._skip_whitespace()
+        if self.pos >= len(self.buf):
+            raise ValueError("Unexpected end of scancode report")
+        return self.buf[self.pos]
+
+    def next_char(self):
+        c = self.peek()
+        self.pos += 1
+        return c
+
+    def back(self):
+        self.pos -= 1
+
+    def expect(self, c):
+        found = self.next_char()
+        if found != c:
+            raise ValueError("Malformed scancode report, expected '" + c + "' but found '" + found + "'")
+
+    def value(self):
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # a value ending at the end of the buffer (e.g. a
+                # number) may continue in the next chunk
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # value not complete, read more data and retry
+            self._fill(2 * (len(self.buf) - self.pos) + self.chunk_size)
+
+    def array(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            c = self.next_char()
+            if c == "]":
+                return
+            if c != ",":
+                raise ValueError("Malformed scancode report, expected ',' or ']' but found '" + c + "'")
@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import json
+import resource
+import sys
+import time
+import tracemalloc
+
+#
+# Measures the stages of the pipe (load, filter, transform ...), one
+# stage at a time:
+#
+#   profiler.begin("filter")
+#   files = utils._filter(...)
+#   profiler.items(included=len(files['included']))
+#   profiler.begin("transform")
+#   ...
+#
+# Beginning a stage ends the current one. For each stage the wall
+# time, cpu time and max resident set size (kB on Linux) is kept, and
+# the item counts given. If tracemalloc is tracing (e.g. with
+# PYTHONTRACEMALLOC=1 set) the memory allocated in the stage, and the
+# peak, is kept as well.
+#
+class StageProfiler:
+    def __init__(self):
+        self.stages = []
+        self.current = None
+
+    def _measure(self):
+        measure = {}
+        measure['wall'] = time.perf_counter()
+        measure['cpu'] = time.process_time()
+        measure['max_rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if tracemalloc.is_tracing():
+            measure['traced'] = tracemalloc.get_traced_memory()[0]
+        return measure
+
+    def begin(self, name):
+        self.end()
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self.current = { 'name': name, 'items': {}, 'start': self._measure() }
+
+    def items(self, **counts):
+        if self.current is not None:
+            self.current['items'].update(counts)
+
+    def end(self):
+        if self.current is None:
+            return
+        stop = self._measure()
+        stage = self.current
+        start = stage.pop('start')
+        stage['wall_time'] = stop['wall'] - start['wall']
+        stage['cpu_time'] = stop['cpu'] - start['cpu']
+        stage['max_rss_kb'] = stop['max_rss']
+        stage['max_rss_growth_kb'] = stop['max_rss'] - start['max_rss']
+        if 'traced' in start and 'traced' in stop:
+            stage['traced_delta'] = stop['traced'] - start['traced']
+            stage['traced_peak'] = tracemalloc.get_traced_memory()[1] - start['traced']
+        self.stages.append(stage)
+        self.current = None
+
+    def to_dict(self):
+        total = {}
+        total['wall_time'] = sum([ stage['wall_time'] for stage in self.stages ])
+        total['cpu_time'] = sum([ stage['cpu_time'] for stage in self.stages ])
+        total['max_rss_kb'] = max([ stage['max_rss_kb'] for stage in self.stages ], default=0)
+        return { 'stages': self.stages, 'total': total }
+
+    def _line(self, name, stage):
+        line = "%-12s %10.3f %10.3f %12d" % (name, stage['wall_time'], stage['cpu_time'], stage['max_rss_kb'])
+        if 'traced_peak' in stage:
+            line += " %12d %12d" % (stage['traced_delta'] / 1024, stage['traced_peak'] / 1024)
+        items = stage.get('items', {})
+        if items:
+            line += "  " + " ".join([ str(k) + "=" + str(v) for k, v in items.items() ])
+        return line + "\n"
+
+    def write(self, stream):
+        header = "%-12s %10s %10s %12s" % ("stage", "wall (s)", "cpu (s)", "max rss (kB)")
+        if any([ 'traced_peak' in stage for stage in self.stages ]):
+            header += " %12s %12s" % ("alloc (kB)", "peak (kB)")
+        stream.write(header + "  items\n")
+        for stage in self.stages:
+            stream.write(self._line(stage['name'], stage))
+        stream.write(self._line("total", self.to_dict()['total']))
+
+    #
+    # End the current stage and write the stages, to stderr if
+    # file_name is "-", otherwise as JSON to the file
+    #
+    def output(self, file_name):
+        self.end()
+        if file_name == "-":
+            self.write(sys.stderr)
+        else:
+            with open(file_name, "w") as fp:
+                json.dump(self.to_dict(), fp, indent=4)
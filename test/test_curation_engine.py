@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from scancode_manifestor.curation_engine import CurationEngine
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestCurationEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.utils = ManifestUtils(ManifestLogger(False))
+
+    def _files(self):
+        files = sample_data.files()
+        files['included'].append(sample_data.sample_file("empty.txt", "otherdir", []))
+        return files
+
+    def _curated(self, files):
+        curated = {}
+        for f in files['included']:
+            if 'scancode_manifestor' in f:
+                manifestor_map = f['scancode_manifestor']
+                curated[f['path']] = (manifestor_map['curation_type'], manifestor_map['curation_expr'], manifestor_map['curated_license'])
+        return curated
+
+    # curate with one curation at a time
+    def _curate_sequential(self, file_curations, license_curations, missing_license_curation):
+        files = self._files()
+        for curation in file_curations:
+            for regexp in curation[:-1]:
+                self.utils._curate_file_license(files, regexp, curation[-1])
+        for curation in license_curations:
+            for regexp in curation[:-1]:
+                self.utils._curate_license(files, regexp, curation[-1])
+        if missing_license_curation:
+            self.utils._curate_license(files, "[]", missing_license_curation)
+        return self._curated(files)
+
+    def _curate(self, file_curations, license_curations, missing_license_curation):
+        files = self._files()
+        self.utils._curate(files, file_curations, license_curations, missing_license_curation)
+        return self._curated(files)
+
+    def _assert_same(self, file_curations, license_curations, missing_license_curation=None):
+        expected = self._curate_sequential(file_curations, license_curations, missing_license_curation)
+        actual = self._curate(file_curations, license_curations, missing_license_curation)
+        self.assertTrue(expected == actual)
+        return actual
+
+    def test_file_curations(self):
+        curated = self._assert_same([ [ "bonkey.txt", "mit" ], [ "key", "dit/", "bsd-new" ], [ "onkey", "x11" ] ], [])
+        self.assertTrue(curated["git/dit//bonkey.txt"] == ('file', "onkey", "(x11)"))
+        self.assertTrue(curated["git/dit//flunkey.txt"] == ('file', "dit/", "(bsd-new)"))
+        self.assertTrue("otherdir/readme.txt" not in curated)
+
+    def test_license_curations(self):
+        curated = self._assert_same([], [ [ "gpl-2.0-or-later", "mit" ], [ "gpl-3.0-or-later", "x11", "bsd-new" ] ], "isc")
+        self.assertTrue(curated["git/dit//bonkey.txt"] == ('license', "gpl-3.0-or-later", "(gpl-2.0-or-later AND bsd-new)"))
+        self.assertTrue(curated["git/dit//monkey.txt"] == ('license', "gpl-2.0-or-later", "(mit)"))
+        self.assertTrue(curated["otherdir/empty.txt"] == ('license', "[]", "(isc)"))
+
+    def test_mixed_curations(self):
+        self._assert_same([ [ "txt$", "mit" ] ], [ [ "x11", "bsd-new" ], [ "[]", "mit" ] ])
+        self._assert_same([ [ "txt$", "mit" ] ], [ [ "[]", "x11" ], [ "gpl-3.0-only", "mit" ], [ "x11", "isc" ] ], "bsd-new")
+
+    def test_bad_curation(self):
+        self.assertRaises(ValueError, lambda: CurationEngine([ [ "mit" ] ], []))
+        self.assertRaises(ValueError, lambda: CurationEngine([], [ [ "mit" ] ]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import json
+import unittest
+
+from scancode_manifestor.file_record import FileRecord
+from scancode_manifestor.file_record import ManifestorData
+from scancode_manifestor.file_record import copyright_values
+from scancode_manifestor.file_record import file_records
+from scancode_manifestor.file_record import spdx_license_keys
+from scancode_manifestor.file_record import to_dict
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import FilterAttribute
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestFileRecord(unittest.TestCase):
+
+    def setUp(self):
+        self.utils = ManifestUtils(ManifestLogger(False))
+        self.files = sample_data.files()['included']
+        for f in self.files:
+            f['file_type'] = "ASCII text"
+            f['licenses'] = [ { 'key': l, 'spdx_license_key': l.upper(), 'start_line': 1 } for l in f['license_expressions'] ]
+            f['copyrights'] = [ { 'value': "Copyright " + f['name'], 'start_line': 2 } ]
+
+    def test_records(self):
+        records = list(file_records(self.files))
+        for f, record in zip(self.files, records):
+            self.assertTrue(isinstance(record, FileRecord))
+            self.assertTrue(record['path'] == f['path'])
+            self.assertTrue(record['name'] == f['name'])
+            self.assertTrue(record['type'] == f['type'])
+            self.assertTrue(list(record['license_expressions']) == f['license_expressions'])
+            self.assertTrue(list(spdx_license_keys(record)) == spdx_license_keys(f))
+            self.assertTrue(list(copyright_values(record)) == copyright_values(f))
+            # not kept
+            self.assertFalse('licenses' in record)
+            self.assertRaises(KeyError, lambda: record['licenses'])
+            self.assertRaises(KeyError, lambda: record['copyrights'])
+
+        # equal licenses are shared
+        copies = list(file_records([ self.files[1], dict(self.files[1]) ]))
+        self.assertTrue(copies[0]['license_expressions'] is copies[1]['license_expressions'])
+
+        # equal copyright strings are shared, not the copyrights
+        copyright = "Copyright " + str(len(self.files)) + " Inc"
+        first = dict(self.files[1], copyrights=[ { 'value': copyright } ])
+        second = dict(self.files[1], copyrights=[ { 'value': "".join(list(copyright)) }, { 'value': "Copyright Other" } ])
+        copies = list(file_records([ first, second ]))
+        self.assertTrue(copies[0]['copyright_values'][0] is copies[1]['copyright_values'][0])
+
+        # already records
+        self.assertTrue(list(file_records(records)) == records)
+
+    def test_manifestor_data(self):
+        record = next(file_records(self.files))
+        self.assertFalse('scancode_manifestor' in record)
+
+        self.utils._add_filter_data(record, FilterAttribute.PATH, FilterAction.EXCLUDE, "README")
+        manifestor_map = record['scancode_manifestor']
+        self.assertTrue(isinstance(manifestor_map, ManifestorData))
+        self.assertTrue('scancode_manifestor' in record)
+        self.assertTrue(manifestor_map['filter_expr'] == "README")
+        self.assertFalse('license_key' in manifestor_map)
+        self.assertTrue(manifestor_map.get('license_key') == None)
+        self.assertRaises(KeyError, lambda: manifestor_map['license_key'])
+        self.assertRaises(KeyError, lambda: manifestor_map.__setitem__('unknown', 1))
+
+    def test_transform(self):
+        records = list(file_records(self.files))
+        self.utils._transform_files_helper(records)
+        self.utils._transform_files_helper(self.files)
+        for f, record in zip(self.files, records):
+            self.assertTrue(record['scancode_manifestor'].to_dict() == f['scancode_manifestor'])
+
+    def test_to_dict(self):
+        records = list(file_records(self.files))
+        self.utils._transform_files_helper(records)
+        f = json.loads(json.dumps(records[0], default=to_dict))
+        self.assertTrue(f['path'] == self.files[0]['path'])
+        self.assertTrue(f['licenses'] == [ { 'spdx_license_key': "GPL-2.0-OR-LATER" }, { 'spdx_license_key': "GPL-3.0-OR-LATER" } ])
+        self.assertTrue(f['scancode_manifestor']['license_spdx'] == records[0]['scancode_manifestor']['license_spdx'])
+
+
+if __name__ == '__main__':
+    unittest.main()
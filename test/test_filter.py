@@ -240,7 +240,63 @@ class TestFilterGeneric(unittest.TestCase):
 
 
         
-    
+
+
+class TestFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = ManifestLogger(False)
+        self.utils = ManifestUtils(self.logger)
+
+    def test_exclude(self):
+        files = sample_data.files()
+
+        files = self.utils._filter(files, [[]], [["txt$", "onkey"], ["readme"]])
+
+        self.assertTrue( len(files['included']) == 0)
+        self.assertTrue( len(files['excluded']) == 6)
+
+        # first matching regexp wins
+        for f in files['excluded']:
+            manifestor_map = f['scancode_manifestor']
+            self.assertTrue(manifestor_map['filter_type'] == FilterAttribute.PATH)
+            self.assertTrue(manifestor_map['filter_action'] == FilterAction.EXCLUDE)
+            self.assertTrue(manifestor_map['filter_expr'] == "txt$")
+
+    def test_exclude_order(self):
+        files = sample_data.files()
+
+        files = self.utils._filter(files, [[]], [["readme", "onkey"]])
+
+        included = [ f['name'] for f in files['included'] ]
+        excluded = [ f['name'] for f in files['excluded'] ]
+        self.assertTrue(included == ["flunkey.txt", "splungy.txt"])
+        # files are grouped per matching regexp
+        self.assertTrue(excluded == ["readme.txt", "bonkey.txt", "monkey.txt", "donkey.txt"])
+        self.assertTrue(files['excluded'][1]['scancode_manifestor']['filter_expr'] == "onkey")
+
+    def test_include(self):
+        files = sample_data.files()
+
+        files = self.utils._filter(files, [["readme"], ["bonkey", "txt"]], [["monkey"]])
+
+        included = [ f['name'] for f in files['included'] ]
+        excluded = [ f['name'] for f in files['excluded'] ]
+        self.assertTrue(included == ["readme.txt", "bonkey.txt", "donkey.txt", "flunkey.txt", "splungy.txt"])
+        self.assertTrue(excluded == ["monkey.txt"])
+        self.assertTrue(files['included'][0]['scancode_manifestor']['filter_expr'] == "readme")
+        self.assertTrue(files['included'][2]['scancode_manifestor']['filter_expr'] == "txt")
+        self.assertTrue(files['excluded'][0]['scancode_manifestor']['filter_action'] == FilterAction.EXCLUDE)
+
+    def test_stream(self):
+        files = sample_data.files()
+        files['included'] = iter(files['included'])
+
+        files = self.utils._filter(files, [[]], [["onkey"]])
+
+        self.assertTrue( len(files['included']) == 3)
+        self.assertTrue( len(files['excluded']) == 3)
+
 
 if __name__ == '__main__':
     unittest.main()
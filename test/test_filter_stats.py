@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from scancode_manifestor.filter_stats import FilterStats
+from scancode_manifestor.manifestor_utils import FilterAttribute
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestFilterStats(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = ManifestLogger(False)
+        self.utils = ManifestUtils(self.logger)
+        self.utils.filter_stats = FilterStats()
+
+    def _stats(self, attribute, action, regexp):
+        return self.utils.filter_stats.patterns[(attribute, action, regexp)]
+
+    def test_path(self):
+        files = sample_data.files()
+        files = self.utils._filter(files, [["txt$"]], [["readme", "onkey", "nomatch"]])
+        self.assertTrue(len(files['included']) == 2)
+
+        stats = self._stats(FilterAttribute.PATH, FilterAction.INCLUDE, "txt$")
+        self.assertTrue(stats['tested'] == 6)
+        self.assertTrue(stats['matched'] == 6)
+
+        stats = self._stats(FilterAttribute.PATH, FilterAction.EXCLUDE, "readme")
+        self.assertTrue(stats['matched'] == 1)
+        stats = self._stats(FilterAttribute.PATH, FilterAction.EXCLUDE, "onkey")
+        self.assertTrue(stats['matched'] == 3)
+        self.assertTrue(stats['time'] >= 0)
+
+        # never tried, the literal prefilter rules it out
+        stats = self._stats(FilterAttribute.PATH, FilterAction.EXCLUDE, "nomatch")
+        self.assertTrue(stats['tested'] == 0)
+        self.assertTrue(stats['matched'] == 0)
+
+    def test_same_result(self):
+        files = self.utils._filter(sample_data.files(), [[]], [["readme", "onkey"]])
+        utils = ManifestUtils(self.logger)
+        expected = utils._filter(sample_data.files(), [[]], [["readme", "onkey"]])
+        self.assertTrue([ f['path'] for f in files['included'] ] == [ f['path'] for f in expected['included'] ])
+        self.assertTrue([ f['path'] for f in files['excluded'] ] == [ f['path'] for f in expected['excluded'] ])
+
+    def test_generic(self):
+        files = sample_data.files()
+        files = self.utils._filter_generic(files, FilterAttribute.LICENSE, "gpl", FilterAction.EXCLUDE)
+        self.assertTrue(len(files['excluded']) == 3)
+
+        stats = self._stats(FilterAttribute.LICENSE, FilterAction.EXCLUDE, "gpl")
+        self.assertTrue(stats['tested'] == 6)
+        self.assertTrue(stats['matched'] == 3)
+
+    def test_output(self):
+        self.utils._filter(sample_data.files(), [[]], [["readme", "onkey"]])
+
+        out = io.StringIO()
+        self.utils.filter_stats.write(out)
+        lines = out.getvalue().strip().split("\n")
+        self.assertTrue(len(lines) == 3)
+        self.assertTrue(lines[0].split()[-1] == "expression")
+        self.assertTrue(sorted([ line.split()[-1] for line in lines[1:] ]) == [ "onkey", "readme" ])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "stats.json")
+            self.utils.filter_stats.output(file_name)
+            with open(file_name) as fp:
+                stats = json.load(fp)
+        self.assertTrue(len(stats) == 2)
+        for pattern in stats:
+            self.assertTrue(pattern['attribute'] == "file")
+            self.assertTrue(pattern['action'] == "exclude")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import io
+import unittest
+
+import scancode_manifestor.format_html
+from scancode_manifestor.format_html import HtmlFormatter
+from scancode_manifestor.format_html import _MarkdownHtmlStream
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestFormatHtml(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = ManifestLogger(False)
+        self.utils = ManifestUtils(self.logger)
+
+    def _html(self, markdown):
+        out = io.StringIO()
+        stream = _MarkdownHtmlStream(out)
+        # written in pieces, as MarkdownFormatter does
+        for i in range(0, len(markdown), 3):
+            stream.write(markdown[i:i + 3])
+        stream.close()
+        return out.getvalue()
+
+    def test_markdown(self):
+        html = self._html("# 5 Excluded & filtered\n\n*explained*\n\n [5.1 Filters](#Filters (all))\n\n")
+        self.assertTrue(html == "<h1>5 Excluded &amp; filtered</h1>\n<p><em>explained</em></p>\n<p><a href=\"#Filters (all)\">5.1 Filters</a></p>\n")
+
+    def test_lists(self):
+        html = self._html("<details>\n<summary>Click</summary>\n\n * <a name=\"\\.h$\">\\.h$</a>\n\n    * ***file***: a<b\n\n * mit\n\n</details>\n")
+        self.assertTrue(html == "<details>\n<summary>Click</summary>\n" +
+                        "<ul>\n<li><a name=\"\\.h$\">\\.h$</a><ul>\n<li><strong><em>file</em></strong>: a&lt;b</li>\n</ul>\n" +
+                        "</li>\n<li>mit</li>\n</ul>\n</details>\n")
+
+    def test_chunks(self):
+        chunk_size = scancode_manifestor.format_html.DETAILS_CHUNK_SIZE
+        scancode_manifestor.format_html.DETAILS_CHUNK_SIZE = 2
+        try:
+            html = self._html("<details open>\n<summary>Click</summary>\n\n * a\n\n    * a1\n\n * b\n\n * c\n\n</details>\n")
+        finally:
+            scancode_manifestor.format_html.DETAILS_CHUNK_SIZE = chunk_size
+        self.assertTrue(html == "<details open>\n<summary>Click</summary>\n" +
+                        "<ul>\n<li>a<ul>\n<li>a1</li>\n</ul>\n</li>\n<li>b</li>\n</ul>\n</details>\n" +
+                        "<details open>\n<summary>Click (part 2)</summary>\n<ul>\n<li>c</li>\n</ul>\n</details>\n")
+
+    def test_format(self):
+        report = {}
+        f = sample_data.sample_file("bonkey.txt", "git/dit", [ "mit" ])
+        f['file_type'] = "ASCII text"
+        f['scancode_manifestor'] = { 'license_key': "mit" }
+        excluded = sample_data.sample_dir("git")
+        report['files'] = { 'included': [ f ], 'excluded': [ excluded ] }
+        report['conclusion'] = { 'copyright': [ "Copyright <Henrik>" ],
+                                 'license_expression': "mit",
+                                 'license_expression_original': "mit" }
+        report['meta'] = { 'arguments': { 'excluded_regexps': [],
+                                          'included_regexps': [],
+                                          'file_curations': [],
+                                          'missing_license_curation': None } }
+        args = { 'add_explanations': False, 'no_conclusion': False }
+        html = HtmlFormatter(args, self.utils).format(report)
+        self.assertTrue(html.startswith("<!DOCTYPE html>\n<html>\n"))
+        self.assertTrue(html.endswith("</body>\n</html>\n"))
+        self.assertTrue("<li>Copyright &lt;Henrik&gt;</li>" in html)
+        self.assertTrue("<li><a href=\"git/dit/bonkey.txt\">git/dit/bonkey.txt</a></li>" in html)
+        self.assertTrue("<pre>\n{\n    \"arguments\": {\n" in html)
+
+if __name__ == '__main__':
+    unittest.main()
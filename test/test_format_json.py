@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import io
+import json
+import unittest
+
+from scancode_manifestor.file_record import FileRecordFactory
+from scancode_manifestor.format_json import JSONFormatter
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import FilterAttribute
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestFormatJSON(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = ManifestLogger(False)
+        self.utils = ManifestUtils(self.logger)
+        self.formatter = JSONFormatter({}, self.utils)
+
+    def _report(self, files):
+        report = {}
+        report['files'] = files
+        report['files']['included_files_count'] = len(files['included'])
+        report['files']['excluded_files_count'] = len(files['excluded'])
+        report['conclusion'] = { 'copyright': [ "Copyright Henrik" ],
+                                 'license_expression': "mit" }
+        report['meta'] = { 'arguments': { 'excluded_regexps': [ [ "\\.h$" ] ] } }
+        return report
+
+    def test_format_stream(self):
+        report = self._report(sample_data.files())
+        report['files']['excluded'].append(sample_data.sample_dir("git"))
+        out = io.StringIO()
+        self.formatter.format_stream(report, out)
+        self.assertTrue(out.getvalue() == json.dumps(report))
+        self.assertTrue(self.formatter.format(report) == json.dumps(report))
+
+    def test_format_empty_files(self):
+        report = self._report({ 'included': [], 'excluded': [] })
+        self.assertTrue(self.formatter.format(report) == json.dumps(report))
+
+    def test_format_enums(self):
+        files = sample_data.files()
+        excluded = files['included'].pop()
+        self.utils._add_filter_data(excluded, FilterAttribute.PATH, FilterAction.EXCLUDE, "\\.txt$")
+        files['excluded'].append(excluded)
+        formatted = json.loads(self.formatter.format(self._report(files)))
+        manifestor_map = formatted['files']['excluded'][0]['scancode_manifestor']
+        self.assertTrue(manifestor_map['filter_type'] == "file")
+        self.assertTrue(manifestor_map['filter_action'] == "exclude")
+        self.assertTrue(manifestor_map['filter_expr'] == "\\.txt$")
+
+    def test_format_include_filter(self):
+        files = self.utils._filter(sample_data.files(), [ [ "onkey" ] ], [ [ "monkey" ] ])
+        formatted = json.loads(self.formatter.format(self._report(files)))
+        self.assertTrue(len(formatted['files']['included']) == 2)
+        for f in formatted['files']['included']:
+            self.assertTrue(f['scancode_manifestor']['filter_action'] == "include")
+            self.assertTrue(f['scancode_manifestor']['filter_expr'] == "onkey")
+        for f in formatted['files']['excluded']:
+            if 'scancode_manifestor' in f:
+                self.assertTrue(f['scancode_manifestor']['filter_action'] == "exclude")
+
+    def test_format_records(self):
+        f = sample_data.file()
+        f['file_type'] = "ASCII text"
+        f['licenses'] = [ { 'spdx_license_key': "GPL-2.0-or-later" } ]
+        f['copyrights'] = [ { 'value': "Copyright Henrik" } ]
+        record = FileRecordFactory().from_scancode(f)
+        self.utils._add_filter_data(record, FilterAttribute.LICENSE, FilterAction.INCLUDE, "gpl")
+        formatted = json.loads(self.formatter.format(self._report({ 'included': [ record ], 'excluded': [] })))
+        included = formatted['files']['included'][0]
+        self.assertTrue(included['path'] == f['path'])
+        self.assertTrue(included['copyrights'] == f['copyrights'])
+        self.assertTrue(included['scancode_manifestor']['filter_type'] == "license")
+        self.assertTrue(included['scancode_manifestor']['filter_action'] == "include")
+
+if __name__ == '__main__':
+    unittest.main()
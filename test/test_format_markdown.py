@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import io
+import unittest
+
+from scancode_manifestor.format_markdown import MarkdownFormatter
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import FilterAttribute
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class WriteCounter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+class TestFormatMarkdown(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = ManifestLogger(False)
+        self.utils = ManifestUtils(self.logger)
+        self.args = { 'add_explanations': True, 'no_conclusion': False }
+
+    def _file(self, name, path, lic):
+        f = sample_data.sample_file(name, path, [ lic ])
+        f['file_type'] = "ASCII text"
+        f['scancode_manifestor'] = { 'license_key': lic, 'license_spdx': lic, 'copyright': [] }
+        return f
+
+    def _report(self):
+        included = [ self._file("bonkey.txt", "git/dit", "mit"),
+                     self._file("monkey.txt", "git/dit", "gpl-2.0-or-later") ]
+        excluded = [ self._file("donkey.h", "git/dit", "bsd-new") ]
+        self.utils._add_filter_data(excluded[0], FilterAttribute.PATH, FilterAction.EXCLUDE, "\\.h$")
+        report = {}
+        report['files'] = { 'included': included, 'excluded': excluded }
+        report['conclusion'] = { 'copyright': [ "Copyright Henrik" ],
+                                 'license_expression': "mit AND gpl-2.0-or-later",
+                                 'license_expression_original': "mit and gpl-2.0-or-later" }
+        report['meta'] = { 'arguments': { 'excluded_regexps': [ [ "\\.h$" ] ],
+                                          'included_regexps': [],
+                                          'file_curations': [],
+                                          'missing_license_curation': None } }
+        return report
+
+    def _without_date(self, formatted):
+        return [ line for line in formatted.split("\n") if "***date***" not in line ]
+
+    def test_format_stream(self):
+        report = self._report()
+        out = WriteCounter()
+        MarkdownFormatter(self.args, self.utils).format_stream(report, out)
+        streamed = out.getvalue()
+
+        # written while formatting, not as one string
+        self.assertTrue(out.writes > 1)
+        self.assertTrue(self._without_date(streamed) == self._without_date(MarkdownFormatter(self.args, self.utils).format(report)))
+
+        self.assertTrue("# 5 " in streamed)
+        self.assertTrue("    * [git/dit/donkey.h](git/dit/donkey.h)" in streamed)
+        self.assertTrue(" * ***Simplified***: mit AND gpl-2.0-or-later" in streamed)
+
+    def test_filter_expr_files(self):
+        files = [ self._file("a.h", "src", "mit"),
+                  self._file("b.c", "src", "mit"),
+                  self._file("c.h", "src", "mit"),
+                  sample_data.sample_dir("src") ]
+        self.utils._add_filter_data(files[0], FilterAttribute.PATH, FilterAction.EXCLUDE, "\\.h$")
+        self.utils._add_filter_data(files[2], FilterAttribute.PATH, FilterAction.EXCLUDE, "\\.h$")
+        # b.c has no filter information, e.g. not matching any include expression
+        expr_files = MarkdownFormatter(self.args, self.utils)._filter_expr_files(files)
+        self.assertTrue(expr_files == { "\\.h$": [ files[0], files[2] ] })
+
+    def test_excluded_not_matching_include(self):
+        report = self._report()
+        report['files']['excluded'].append(self._file("readme.txt", "git", "mit"))
+        out = io.StringIO()
+        MarkdownFormatter(self.args, self.utils).format_stream(report, out)
+        self.assertTrue(" * [git/readme.txt](git/readme.txt)" in out.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
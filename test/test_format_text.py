@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from scancode_manifestor.format_text import TextFormatter
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestFormatText(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = ManifestLogger(False)
+        self.utils = ManifestUtils(self.logger)
+
+    def _report(self):
+        files = sample_data.files()
+        for f in files['included']:
+            f['scancode_manifestor'] = { 'license_key': f['license_expressions'][0],
+                                         'copyright': [ "Copyright Henrik" ] }
+        files['included'][0]['scancode_manifestor']['curated_license'] = "(mit)"
+        files['included'].append(sample_data.sample_dir("git"))
+        report = {}
+        report['files'] = files
+        report['project'] = { 'name': "dit", 'version': "1.0" }
+        report['conclusion'] = { 'copyright': [ "Copyright Henrik" ], 'license_expression': "mit" }
+        return report
+
+    def _table(self, formatted, title):
+        lines = formatted.split("\n")
+        start = lines.index(title) + 3
+        return lines[start:lines.index("", start)]
+
+    def test_format(self):
+        formatted = TextFormatter({}, self.utils).format(self._report())
+        self.assertTrue("Project:         dit\n" in formatted)
+        self.assertTrue("Included files:  6\n" in formatted)
+
+        table = self._table(formatted, "Included files")
+        self.assertTrue(len(table) == 8)
+        self.assertTrue(table[0].split() == [ "path", "license", "curation", "copyrights" ])
+        self.assertTrue(table[2].split() == [ "git/dit//bonkey.txt", "gpl-2.0-or-later", "(mit)", "1" ])
+        self.assertTrue(table[3].split() == [ "git/dit//monkey.txt", "gpl-2.0-or-later", "-", "1" ])
+        # fixed width columns
+        self.assertTrue(len(set([ line.index(" -  ") for line in table[3:] ])) == 1)
+
+        self.assertTrue(self._table(formatted, "Excluded files")[2:] == [])
+
+    def test_pages(self):
+        formatted = TextFormatter({ 'text_page_lines': 4 }, self.utils).format(self._report())
+        self.assertTrue(formatted.count("\f") == 1)
+        pages = formatted.split("\f\n")
+        self.assertTrue(len(self._table(pages[0], "Included files")) == 6)
+        self.assertTrue(len(self._table(pages[1], "Included files (page 2)")) == 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import json
+import unittest
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from scancode_manifestor.format_json import JSONFormatter
+from scancode_manifestor.format_yaml import YamlFormatter
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import FilterAttribute
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestFormatYaml(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = ManifestLogger(False)
+        self.utils = ManifestUtils(self.logger)
+        self.formatter = YamlFormatter({}, self.utils)
+
+    def _report(self):
+        files = sample_data.files()
+        excluded = files['included'].pop()
+        self.utils._add_filter_data(excluded, FilterAttribute.PATH, FilterAction.EXCLUDE, "\\.txt$")
+        files['excluded'].append(excluded)
+        files['excluded'].append(sample_data.sample_dir("git"))
+        files['included_files_count'] = len(files['included'])
+        report = {}
+        report['files'] = files
+        report['conclusion'] = { 'copyright': [ "Copyright \"Henrik\": 2021", "Copyright Åsa\u2028\x85\x7f\ud83d😀" ],
+                                 'license_expression': None }
+        report['meta'] = { 'arguments': { 'excluded_regexps': [ [ "\\.h$", "#" ], [] ],
+                                          'hide_only': False,
+                                          'on': "yes" } }
+        return report
+
+    def test_format(self):
+        formatted = self.formatter.format(self._report())
+        self.assertTrue(formatted.startswith("---\nfiles:\n  included:\n  - name: \"bonkey.txt\"\n"))
+        self.assertTrue("\n  included_files_count: 5\n" in formatted)
+        self.assertTrue("\n    -\n      - \"\\\\.h$\"\n      - \"#\"\n    - []\n" in formatted)
+        self.assertTrue("\n    \"on\": \"yes\"\n" in formatted)
+
+    def test_format_include_filter(self):
+        files = self.utils._filter(sample_data.files(), [ [ "onkey" ] ], [ [ "monkey" ] ])
+        report = { 'files': files, 'conclusion': {}, 'meta': {} }
+        formatted = self.formatter.format(report)
+        self.assertTrue(formatted.count("filter_action: \"include\"\n") == 2)
+        self.assertTrue(formatted.count("filter_action: \"exclude\"\n") == 1)
+        self.assertFalse("filter_action: true" in formatted)
+
+    @unittest.skipIf(yaml is None, "yaml not installed")
+    def test_same_as_json(self):
+        report = self._report()
+        from_json = json.loads(JSONFormatter({}, self.utils).format(report))
+        from_yaml = yaml.safe_load(self.formatter.format(report))
+        self.assertTrue(from_json == from_yaml)
+
+if __name__ == '__main__':
+    unittest.main()
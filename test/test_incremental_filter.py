@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from scancode_manifestor.incremental_filter import IncrementalFilter
+from scancode_manifestor.manifestor_utils import FilterAction
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestIncrementalFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.utils = ManifestUtils(ManifestLogger(False))
+
+    def _files(self):
+        files = sample_data.files()
+        files['included'].append(sample_data.dir())
+        return files
+
+    def _paths(self, files):
+        return sorted([ f['path'] for f in files if f['type'] == "file" ])
+
+    # files included when filtering all files with all regexps
+    def _filtered(self, included_regexps, excluded_regexps):
+        if included_regexps == []:
+            included_regexps = [[]]
+        files = self.utils._filter(self._files(), included_regexps, excluded_regexps)
+        return self._paths(files['included'])
+
+    def _assert_filtered(self, files, included_regexps, excluded_regexps):
+        self.assertTrue(self._paths(files['included']) == self._filtered(included_regexps, excluded_regexps))
+        for f in files['excluded']:
+            if f['type'] == "file" and 'scancode_manifestor' in f and 'filter_action' in f['scancode_manifestor']:
+                self.assertTrue(f['scancode_manifestor']['filter_action'] == FilterAction.EXCLUDE)
+
+    # filter annotation (type, action, expression) of each file, by path
+    def _annotations(self, files):
+        annotations = {}
+        for f in files['included'] + files['excluded']:
+            if f['type'] == "file":
+                data = f.get('scancode_manifestor', {})
+                annotations[f['path']] = (data.get('filter_type'), data.get('filter_action'), data.get('filter_expr'))
+        return annotations
+
+    def _assert_annotated(self, files, included_regexps, excluded_regexps):
+        if included_regexps == []:
+            included_regexps = [[]]
+        filtered = self.utils._filter(self._files(), included_regexps, excluded_regexps)
+        self.assertTrue(self._annotations(files) == self._annotations(filtered))
+
+    def test_add_excludes(self):
+        files = self.utils._filter(self._files(), [[]], [])
+        incremental_filter = IncrementalFilter(self.utils, files, [[]], [])
+        # only files are included
+        self.assertTrue(len(files['included']) == 6)
+
+        moved_in, moved_out = incremental_filter.add_excludes([ "onkey" ])
+        self.assertTrue(self._paths(moved_out) == [ "git/dit//bonkey.txt", "git/dit//donkey.txt", "git/dit//monkey.txt" ])
+        self._assert_filtered(files, [], [ [ "onkey" ] ])
+        self.assertTrue(files['excluded'][-1]['scancode_manifestor']['filter_expr'] == "onkey")
+
+        incremental_filter.add_excludes([ "readme", "monkey" ])
+        self._assert_filtered(files, [], [ [ "onkey" ], [ "readme", "monkey" ] ])
+
+    def test_add_includes(self):
+        files = self.utils._filter(self._files(), [[]], [ [ "bonkey" ] ])
+        incremental_filter = IncrementalFilter(self.utils, files, [[]], [ [ "bonkey" ] ])
+
+        incremental_filter.add_includes([ "onkey" ])
+        self._assert_filtered(files, [ [ "onkey" ] ], [ [ "bonkey" ] ])
+        for f in files['included']:
+            self.assertTrue(f['scancode_manifestor']['filter_expr'] == "onkey")
+
+        incremental_filter.add_includes([ "readme" ])
+        self._assert_filtered(files, [ [ "onkey" ], [ "readme" ] ], [ [ "bonkey" ] ])
+
+    def test_remove(self):
+        files = self.utils._filter(self._files(), [ [ "dit" ] ], [ [ "onkey" ], [ "txt$" ] ])
+        incremental_filter = IncrementalFilter(self.utils, files, [ [ "dit" ] ], [ [ "onkey" ], [ "txt$" ] ])
+        self.assertTrue(files['included'] == [])
+
+        incremental_filter.remove_exclude("txt$")
+        self._assert_filtered(files, [ [ "dit" ] ], [ [ "onkey" ] ])
+
+        incremental_filter.remove_exclude("onkey")
+        self._assert_filtered(files, [ [ "dit" ] ], [])
+        for f in files['included']:
+            self.assertTrue(f['scancode_manifestor']['filter_action'] == FilterAction.INCLUDE)
+
+        incremental_filter.remove_include("dit")
+        self._assert_filtered(files, [], [])
+        for f in files['included']:
+            self.assertFalse('filter_type' in f.get('scancode_manifestor', {}))
+
+        self.assertRaises(ValueError, lambda: incremental_filter.remove_include("dit"))
+
+    def test_sequence(self):
+        included_regexps = []
+        excluded_regexps = []
+        files = self.utils._filter(self._files(), [[]], [])
+        incremental_filter = IncrementalFilter(self.utils, files, [[]], [])
+        actions = [ ('exclude', "flunkey"), ('include', "dit/"), ('exclude', "bonkey"),
+                    ('include', "readme"), ('remove_exclude', "flunkey"), ('exclude', "txt$"),
+                    ('remove_include', "dit/"), ('remove_exclude', "txt$"), ('exclude', "onkey"),
+                    ('remove_include', "readme"), ('remove_exclude', "bonkey") ]
+        for action, regexp in actions:
+            if action == 'exclude':
+                incremental_filter.add_excludes([ regexp ])
+                excluded_regexps.append([ regexp ])
+            elif action == 'include':
+                incremental_filter.add_includes([ regexp ])
+                included_regexps.append([ regexp ])
+            elif action == 'remove_exclude':
+                incremental_filter.remove_exclude(regexp)
+                excluded_regexps.remove([ regexp ])
+            else:
+                incremental_filter.remove_include(regexp)
+                included_regexps.remove([ regexp ])
+            self._assert_filtered(files, included_regexps, excluded_regexps)
+            self._assert_annotated(files, included_regexps, excluded_regexps)
+
+    def test_annotations(self):
+        sequences = [
+            [ ('include', "bonkey"), ('exclude', "onkey"), ('include', "readme") ],
+            [ ('exclude', "onkey"), ('include', "bonkey"), ('remove_exclude', "onkey") ],
+            [ ('exclude', "dit/"), ('include', "readme"), ('include', "monkey"),
+              ('remove_include', "readme"), ('remove_include', "monkey") ],
+            [ ('include', "txt$"), ('exclude', "flunkey"), ('include', "flunkey"),
+              ('remove_include', "txt$"), ('exclude', "readme"), ('remove_exclude', "flunkey") ] ]
+        for actions in sequences:
+            included_regexps = []
+            excluded_regexps = []
+            files = self.utils._filter(self._files(), [[]], [])
+            incremental_filter = IncrementalFilter(self.utils, files, [[]], [])
+            for action, regexp in actions:
+                if action == 'exclude':
+                    incremental_filter.add_excludes([ regexp ])
+                    excluded_regexps.append([ regexp ])
+                elif action == 'include':
+                    incremental_filter.add_includes([ regexp ])
+                    included_regexps.append([ regexp ])
+                elif action == 'remove_exclude':
+                    incremental_filter.remove_exclude(regexp)
+                    excluded_regexps.remove([ regexp ])
+                else:
+                    incremental_filter.remove_include(regexp)
+                    included_regexps.remove([ regexp ])
+                self._assert_filtered(files, included_regexps, excluded_regexps)
+                self._assert_annotated(files, included_regexps, excluded_regexps)
+
+    def test_repeated_expression(self):
+        files = self.utils._filter(self._files(), [[]], [])
+        twice = sample_data.sample_file("twice.txt", "otherdir", [ "mit", "mit" ])
+        files['included'].append(twice)
+        index = self.utils._index_licenses(files)
+        incremental_filter = IncrementalFilter(self.utils, files, [[]], [])
+
+        # moved out of (and back in to) the license index
+        incremental_filter.add_excludes([ "twice" ])
+        self.assertFalse(twice in index)
+        self.assertTrue(twice in files['excluded'])
+
+        incremental_filter.remove_exclude("twice")
+        self.assertTrue(twice in index)
+        self.assertTrue(twice in files['included'])
+        self.assertTrue(twice in index.files_with_expression("mit"))
+
+
+if __name__ == '__main__':
+    unittest.main()
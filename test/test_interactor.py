@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from scancode_manifestor.manifestor_commands import ManifestorCommands
+from scancode_manifestor.manifestor_interactor import ManifestorInteractor
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestInteractor(unittest.TestCase):
+
+    def setUp(self):
+        self.utils = ManifestUtils(ManifestLogger(False))
+        self.interactor = ManifestorInteractor(ManifestorCommands(), self.utils, ManifestLogger(False))
+        files = sample_data.files()
+        files['included'].append(sample_data.sample_file("empty.txt", "otherdir", []))
+        files['included'].append(sample_data.dir())
+        for f in files['included']:
+            f['licenses'] = []
+            f['copyrights'] = []
+        self.args = { 'included_regexps': [[]], 'excluded_regexps': [],
+                      'file_curations': [], 'license_curations': [ [ "x11", "mit" ] ],
+                      'missing_license_curation': None }
+        self.files = self.utils._filter(files, self.args['included_regexps'], self.args['excluded_regexps'])
+
+    # information found by looking at all files
+    def _assert_info(self, info):
+        included = list(self.files['included'])
+        self.assertTrue(info['included_count'] == len(included))
+        self.assertTrue(info['excluded_count'] == len(self.files['excluded']))
+        self.assertTrue(info['unknown_count'] == self.utils._unknown_license_count_transformed(included))
+        self.assertTrue(info['licenses'] == self.utils._licenses_in_transformed(included))
+
+    def test_live_info(self):
+        info = self.interactor._live_info(self.files, self.args)
+        self._assert_info(info)
+        self.assertTrue(info['included_count'] == 7)
+        self.assertTrue(info['unknown_count'] == 1)
+        self.assertTrue("(mit)" in info['licenses'])
+
+        self.interactor._parse_action("exclude-files onkey", self.files, self.args)
+        self._assert_info(self.interactor._live_info(self.files, self.args))
+
+        self.interactor._parse_action("include-files dit readme", self.files, self.args)
+        info = self.interactor._live_info(self.files, self.args)
+        self._assert_info(info)
+        self.assertTrue(info['unknown_count'] == 0)
+
+        self.interactor._parse_action("remove-include-files dit readme", self.files, self.args)
+        self.interactor._parse_action("remove-exclude-files onkey", self.files, self.args)
+        self.interactor._parse_action("curate-missing-license bsd-new", self.files, self.args)
+        info = self.interactor._live_info(self.files, self.args)
+        self._assert_info(info)
+        self.assertTrue(info['included_count'] == 7)
+        self.assertTrue(info['unknown_count'] == 0)
+        self.assertTrue("(bsd-new)" in info['licenses'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from scancode_manifestor.license_index import LicenseIndex
+from scancode_manifestor.license_index import effective_license
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.manifestor_utils import ManifestUtils
+
+from test import sample_data
+
+class TestLicenseIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.utils = ManifestUtils(ManifestLogger(False))
+        self.files = sample_data.files()
+        self.files['included'].append(sample_data.sample_file("empty.txt", "otherdir", []))
+        for f in self.files['included']:
+            f['licenses'] = []
+            f['copyrights'] = []
+
+    def _names(self, files):
+        return sorted([ f['name'] for f in files ])
+
+    def test_index(self):
+        index = LicenseIndex(self.files['included'])
+        self.assertTrue(len(index) == 7)
+        self.assertTrue(self._names(index.files_with_expression("gpl-2.0-or-later")) == [ "bonkey.txt", "monkey.txt" ])
+        self.assertTrue(self._names(index.files_with_expression(None)) == [ "empty.txt" ])
+        self.assertTrue(index.files_with_expression("isc") == [])
+
+        bonkey = self.files['included'][0]
+        index.remove(bonkey)
+        self.assertFalse(bonkey in index)
+        self.assertTrue(self._names(index.files_with_expression("gpl-2.0-or-later")) == [ "monkey.txt" ])
+        self.assertTrue(index.files_with_expression("gpl-3.0-or-later") == [])
+
+    def test_repeated_expression(self):
+        twice = sample_data.sample_file("twice.txt", "otherdir", [ "mit", "mit" ])
+        index = LicenseIndex([ twice ])
+        self.assertTrue(index.files_with_expression("mit") == [ twice ])
+
+        index.remove(twice)
+        self.assertFalse(twice in index)
+        self.assertTrue(index.files_with_expression("mit") == [])
+        self.assertTrue(len(index) == 0)
+
+    def test_transform(self):
+        self.utils._transform_files(self.files)
+        index = self.utils._indexed(self.files['included'])
+        self.assertTrue(index is not None)
+        licenses = set([ effective_license(f) for f in self.files['included'] ])
+        self.assertTrue(self.utils._licenses_in_transformed(self.files['included']) == licenses)
+        self.assertTrue(self.utils._unknown_license_count_transformed(self.files['included']) == 1)
+        self.assertTrue(self.utils._license_count_transformed("x11", self.files['included']) == 1)
+
+        # not indexed
+        self.assertTrue(self.utils._indexed(list(self.files['included'])) == None)
+        self.assertTrue(self.utils._unknown_license_count_transformed(list(self.files['included'])) == 1)
+
+    def test_curate(self):
+        self.utils._transform_files(self.files)
+        self.utils._curate(self.files, [], [ [ "x11", "mit" ] ], "bsd-new")
+        self.assertTrue(self.utils._unknown_license_count_transformed(self.files['included']) == 0)
+        self.assertTrue(self.utils._license_count_transformed("x11", self.files['included']) == 0)
+        self.assertTrue(self.utils._license_count_transformed("(mit)", self.files['included']) == 1)
+        self.assertTrue(self.utils._curate_license(self.files, "gpl-3.0-only", "isc") == 1)
+        self.assertTrue(self.utils._license_count_transformed("(isc)", self.files['included']) == 1)
+
+    def test_filter(self):
+        self.utils._transform_files(self.files)
+        self.utils._filter(self.files, [[]], [ [ "otherdir/" ] ])
+        self.assertTrue(self.utils._unknown_license_count_transformed(self.files['included']) == 0)
+        self.assertTrue(self.utils._license_count_transformed("x11", self.files['included']) == 0)
+        self.assertTrue(len(self.utils.license_index) == len(self.files['included']))
+
+        self.utils._filter(self.files, [ [ "readme" ] ], [[]])
+        self.assertTrue(self.utils._license_count_transformed("x11", self.files['included']) == 1)
+        self.assertTrue(len(self.utils.license_index) == len(self.files['included']))
+
+
+if __name__ == '__main__':
+    unittest.main()
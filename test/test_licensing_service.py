@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from license_expression import Licensing
+
+from scancode_manifestor.licensing_service import LicensingService
+
+class TestLicensingService(unittest.TestCase):
+
+    def setUp(self):
+        self.service = LicensingService()
+
+    def _parse_all(self, expressions):
+        return Licensing()._parse_and_simplify(" AND ".join([ " ( " + e + " ) " for e in expressions ]))
+
+    def test_parse(self):
+        parsed = self.service.parse("mit and bsd-new")
+        self.assertTrue(str(parsed) == "bsd-new AND mit")
+        # cached
+        self.assertTrue(self.service.parse("mit and bsd-new") is parsed)
+        self.assertTrue(self.service.parse("") == None)
+
+    def test_conclusion(self):
+        self.assertTrue(self.service.conclusion([]) == None)
+        self.assertTrue(str(self.service.conclusion([ "mit" ])) == "mit")
+
+        expressions = [ "mit", "gpl-2.0-or-later or mit", "(bsd-new and mit) or x11", "x11", "mit and apache-2.0" ]
+        for count in range(2, len(expressions) + 1):
+            self.assertTrue(str(self.service.conclusion(expressions[:count])) == str(self._parse_all(expressions[:count])))
+
+    def test_bad_expression(self):
+        self.assertRaises(Exception, lambda: self.service.conclusion([ "mit", "mit and" ]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from scancode_manifestor.literal_prefilter import required_literal
+from scancode_manifestor.literal_prefilter import AhoCorasick
+from scancode_manifestor.literal_prefilter import LiteralPrefilter
+
+class TestRequiredLiteral(unittest.TestCase):
+
+    def test_plain(self):
+        self.assertTrue(required_literal("Makefile\\.am$") == "Makefile.am")
+        self.assertTrue(required_literal("autom4te\\.cache/") == "autom4te.cache/")
+        self.assertTrue(required_literal("^/build-aux/") == "/build-aux/")
+        self.assertTrue(required_literal("[.]git/") == ".git/")
+
+    def test_longest(self):
+        self.assertTrue(required_literal("[mM]akefile[\\.\\-\\w]*") == "akefile")
+        self.assertTrue(required_literal("ChangeLog[\\.\\-\\w]*") == "ChangeLog")
+        self.assertTrue(required_literal("x?yz") == "yz")
+        self.assertTrue(required_literal("(docs)+/x") == "docs")
+
+    def test_no_literal(self):
+        self.assertTrue(required_literal("a|b") == None)
+        self.assertTrue(required_literal("(?i)readme") == None)
+        self.assertTrue(required_literal("[0-9]+") == None)
+        self.assertTrue(required_literal("[]") == None)
+
+
+class TestAhoCorasick(unittest.TestCase):
+
+    def test_search(self):
+        automaton = AhoCorasick()
+        for index, word in enumerate(["he", "she", "his", "hers"]):
+            automaton.add(word, index)
+        automaton.build()
+
+        self.assertTrue(automaton.search("ushers") == {0, 1, 3})
+        self.assertTrue(automaton.search("ahishe") == {0, 1, 2})
+        self.assertTrue(automaton.search("xyz") == set())
+        self.assertTrue(automaton.search("") == set())
+
+    def test_add_after_build(self):
+        automaton = AhoCorasick()
+        automaton.add("he", 0)
+        automaton.build()
+        self.assertRaises(ValueError, lambda: automaton.add("she", 1))
+
+
+class TestLiteralPrefilter(unittest.TestCase):
+
+    def test_candidates(self):
+        prefilter = LiteralPrefilter(["Makefile\\.am$", "[0-9]+", "README"])
+        self.assertTrue(prefilter.candidates("src/main.c") == [1])
+        self.assertTrue(prefilter.candidates("src/README/Makefile.am") == [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -51,6 +51,18 @@ class TestMiscIs(unittest.TestCase):
         right_list = ['bsd-new', 'gpl-2.0-or-later', 'gpl-3.0-only', 'gpl-3.0-or-later', 'mit']
         self.assertTrue(right_list == lic_list)
 
+    def test_dirs_licenses(self):
+        files = sample_data.files()
+        for path in [ "git", "git/dit", "otherdir" ]:
+            d = sample_data.sample_dir(path)
+            d['license_expressions'] = []
+            files['included'].append(d)
+        dirs_licenses = self.utils._dirs_licenses(files, "included")
+        self.assertTrue(sorted(dirs_licenses.keys()) == [ "git", "git/dit", "otherdir" ])
+        for f in files['included']:
+            if self.utils._isdir(f):
+                self.assertTrue(dirs_licenses[f['path']] == self.utils._dir_licenses(files, f, "included"))
+
     def test_keep_file(self):
         f = sample_data.file()
 
@@ -69,6 +81,48 @@ class TestMiscIs(unittest.TestCase):
         self.assertTrue(expected_l == fl)
 
 
-        
+    def test_transform_files(self):
+        files = sample_data.files()
+        for f in files['included']:
+            f['licenses'] = []
+            f['copyrights'] = []
+        first_dir = sample_data.sample_dir("git")
+        second_dir = sample_data.sample_dir("git/dit")
+        excluded_dir = sample_data.sample_dir("otherdir")
+        files['included'].insert(0, first_dir)
+        files['included'].insert(3, second_dir)
+        files['included'].append(excluded_dir)
+        files['excluded'].append(excluded_dir)
+        included = [ f for f in files['included'] if f['type'] == "file" ]
+
+        self.utils._transform_files(files)
+        self.assertTrue(files['included'] == included)
+        # same order, and no duplicates
+        self.assertTrue(files['excluded'] == [ excluded_dir, first_dir, second_dir ])
+
+
+    def test_no_verbose_messages(self):
+        logger = CountingLogger(False)
+        utils = ManifestUtils(logger)
+        files = sample_data.files()
+        for f in files['included']:
+            utils._match_generic(f, FilterAttribute.PATH, "dit", FilterModifier.ANY)
+        utils._dir_licenses(files, sample_data.dir(), "included")
+        self.assertTrue(logger.messages == 0)
+
+        logger.mode(True)
+        utils._match_generic(sample_data.file(), FilterAttribute.PATH, "dit", FilterModifier.ANY)
+        self.assertTrue(logger.messages == 3)
+
+
+class CountingLogger(ManifestLogger):
+    def __init__(self, debug):
+        super().__init__(debug)
+        self.messages = 0
+
+    def verbose(self, msg):
+        self.messages += 1
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from scancode_manifestor.path_matcher import PathMatcher
+
+class TestPathMatcher(unittest.TestCase):
+
+    def test_first_match(self):
+        matcher = PathMatcher(["Makefile\\.am$", "README", " src/ ", "[]"])
+
+        # both match, the first expression wins
+        self.assertTrue(matcher.first_match("x/README/Makefile.am") == 0)
+        self.assertTrue(matcher.first_match_expr("x/README/Makefile.am") == "Makefile\\.am$")
+
+        self.assertTrue(matcher.first_match("x/README.md") == 1)
+
+        # expressions are stripped
+        self.assertTrue(matcher.first_match_expr("x/src/main.c") == " src/ ")
+
+        self.assertTrue(matcher.first_match("x/main.c") == None)
+        self.assertTrue(matcher.first_match_expr("x/main.c") == None)
+
+    def test_first_matches(self):
+        regexps = ["\\.c$", "cache/", "main", "/build-aux/"]
+        paths = ["p/cache/x.c",
+                 "p/cache/main.h",
+                 "p/cache/sub/other.h",
+                 "p/cache",
+                 "p/src/main.h",
+                 "p/src/build-aux/x.h",
+                 "p/build-aux",
+                 "README",
+                 "/abs/main.py"]
+        matcher = PathMatcher(regexps)
+        matches = matcher.first_matches(paths)
+        self.assertTrue(matches == [0, 1, 1, None, 2, 3, None, None, 2])
+
+        # same result as matching path by path
+        self.assertTrue(matches == [ matcher.first_match(path) for path in paths ])
+
+    def test_empty(self):
+        matcher = PathMatcher([])
+        self.assertTrue(matcher.first_match("x/main.c") == None)
+        self.assertTrue(matcher.first_matches(["x/main.c"]) == [None])
+
+        # "[]" never matches a path
+        matcher = PathMatcher(["[]"])
+        self.assertTrue(matcher.first_match("[]") == None)
+
+    def test_bad_regexp(self):
+        self.assertRaises(Exception, lambda: PathMatcher(["(unbalanced"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import unittest
+
+from scancode_manifestor.path_tree import PathTree
+
+class TestPathTree(unittest.TestCase):
+
+    def test_add(self):
+        tree = PathTree()
+        tree.add("git/dit/bonkey.txt", 1)
+        tree.add("git/dit/monkey.txt", 2)
+        tree.add("git/dit", 3)
+
+        self.assertTrue(list(tree.root.children.keys()) == ["git"])
+        self.assertTrue(tree.node("git/dit").values == [3])
+        self.assertTrue(tree.node("git/dit/monkey.txt").values == [2])
+        self.assertTrue(sorted(tree.node("git/dit").children.keys()) == ["bonkey.txt", "monkey.txt"])
+        self.assertTrue(tree.node("git").values == [])
+
+    def test_missing(self):
+        tree = PathTree()
+        tree.add("git/dit/bonkey.txt", 1)
+        self.assertTrue(tree.node("git/dat") == None)
+        self.assertTrue(tree.node("git/dat/x", create=True).values == [])
+        self.assertTrue(tree.node("git/dat") != None)
+
+    def test_walk_post_order(self):
+        tree = PathTree()
+        tree.add("git/dit/bonkey.txt", 1)
+        tree.add("git/readme.txt", 2)
+        tree.add("other", 3)
+
+        paths = [ path for path, node in tree.walk_post_order() ]
+        self.assertTrue(sorted(paths) == [ "git", "git/dit", "git/dit/bonkey.txt", "git/readme.txt", "other" ])
+        # children before parents
+        self.assertTrue(paths.index("git/dit/bonkey.txt") < paths.index("git/dit") < paths.index("git"))
+        self.assertTrue(paths.index("git/readme.txt") < paths.index("git"))
+
+
+if __name__ == '__main__':
+    unittest.main()
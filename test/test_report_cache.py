@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import json
+import os
+import tempfile
+import unittest
+
+from scancode_manifestor.file_record import FileRecord
+from scancode_manifestor.file_record import copyright_values
+from scancode_manifestor.file_record import spdx_license_keys
+from scancode_manifestor.manifestor_utils import ManifestLogger
+from scancode_manifestor.report_cache import ReportCache
+from scancode_manifestor.report_cache import CachingReader
+from scancode_manifestor.report_cache import SnapshotReader
+
+from test import sample_data
+
+class TestReportCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.logger = ManifestLogger(False)
+
+        files = sample_data.files()['included']
+        for f in files:
+            f['file_type'] = "ASCII text"
+            f['licenses'] = [ { 'key': l, 'spdx_license_key': l.upper(), 'start_line': 1 } for l in f['license_expressions'] ]
+            f['copyrights'] = [ { 'value': "Copyright " + f['name'], 'start_line': 2 } ]
+        d = sample_data.dir()
+        d['file_type'] = None
+        d['license_expressions'] = []
+        d['licenses'] = []
+        d['copyrights'] = []
+        files.append(d)
+        self.files = files
+        self.headers = [ { 'tool_name': "scancode-toolkit", 'tool_version': "3.2.3" } ]
+
+        self.report_file = os.path.join(self.tmp_dir.name, "report.json")
+        with open(self.report_file, "w") as fp:
+            json.dump({ 'headers': self.headers, 'files': self.files }, fp)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _used(self, f):
+        return (f['path'], f['name'], f['type'], f['file_type'], list(f['license_expressions']),
+                list(spdx_license_keys(f)),
+                list(copyright_values(f)))
+
+    def test_cache(self):
+        cache = ReportCache(self.cache_dir, self.logger)
+
+        reader = cache.reader(self.report_file)
+        self.assertTrue(isinstance(reader, CachingReader))
+        files = list(reader.files())
+        self.assertTrue(files == self.files)
+        self.assertTrue(reader.headers() == self.headers)
+
+        reader = cache.reader(self.report_file)
+        self.assertTrue(isinstance(reader, SnapshotReader))
+        files = list(reader.files())
+        self.assertTrue(all([ isinstance(f, FileRecord) for f in files ]))
+        self.assertTrue([ self._used(f) for f in files ] == [ self._used(f) for f in self.files ])
+        self.assertTrue(reader.headers() == self.headers)
+        self.assertTrue(reader.files_count == { 'dirs': 1, 'files': 6 })
+
+    def test_changed_report(self):
+        cache = ReportCache(self.cache_dir, self.logger)
+        list(cache.reader(self.report_file).files())
+
+        with open(self.report_file, "w") as fp:
+            json.dump({ 'headers': self.headers, 'files': self.files[:2] }, fp)
+
+        reader = cache.reader(self.report_file)
+        self.assertTrue(isinstance(reader, CachingReader))
+        self.assertTrue(len(list(reader.files())) == 2)
+
+    def test_snapshot_format(self):
+        cache = ReportCache(self.cache_dir, self.logger)
+        list(cache.reader(self.report_file).files())
+        snapshot = cache.snapshot_name(self.report_file)
+
+        # only data, one JSON document per line
+        with open(snapshot) as fp:
+            lines = fp.read().split("\n")
+        self.assertTrue(json.loads(lines[0]) == [ "scancode-manifestor-snapshot", 3 ])
+        self.assertTrue(json.loads(lines[1])[0] == self.files[0]['path'])
+
+        with open(snapshot, "w") as fp:
+            fp.write(json.dumps([ "scancode-manifestor-snapshot", 2 ]) + "\n")
+        self.assertRaises(ValueError, lambda: list(SnapshotReader(snapshot).files()))
+
+    def test_incomplete_read(self):
+        cache = ReportCache(self.cache_dir, self.logger)
+        files = cache.reader(self.report_file).files()
+        next(files)
+        files.close()
+
+        # nothing cached
+        self.assertTrue(os.listdir(self.cache_dir) == [])
+        self.assertTrue(isinstance(cache.reader(self.report_file), CachingReader))
+
+
+if __name__ == '__main__':
+    unittest.main()
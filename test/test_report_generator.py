@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import os
+import tempfile
+import unittest
+
+from bench.report_generator import ReportGenerator
+from bench.report_generator import parse_license_mix
+from scancode_manifestor.scancode_report import ScancodeReportReader
+
+class TestReportGenerator(unittest.TestCase):
+
+    def _files(self, entries):
+        return [ entry for entry in entries if entry['type'] == "file" ]
+
+    def test_tree(self):
+        entries = list(ReportGenerator(1000, depth=3, files_per_dir=10).entries())
+        files = self._files(entries)
+        self.assertTrue(len(files) == 1000)
+
+        paths = [ entry['path'] for entry in entries ]
+        self.assertTrue(len(set(paths)) == len(paths))
+        # directories before the entries in them
+        seen = set()
+        for path in paths:
+            self.assertTrue(path == "proj" or os.path.dirname(path) in seen)
+            seen.add(path)
+        for f in files:
+            self.assertTrue(f['path'].count("/") == 4)
+            self.assertTrue(f['path'].endswith("/" + f['name']))
+
+    def test_same_seed(self):
+        first = list(ReportGenerator(200, seed=3).entries())
+        self.assertTrue(first == list(ReportGenerator(200, seed=3).entries()))
+        self.assertTrue(first != list(ReportGenerator(200, seed=4).entries()))
+
+    def test_licenses(self):
+        files = self._files(ReportGenerator(500, unknown_ratio=0.0, license_mix={ "mit": 1, "bsd-new": 1 }).entries())
+        for f in files:
+            self.assertTrue(len(f['license_expressions']) > 0)
+            self.assertTrue(set(f['license_expressions']) <= set([ "mit", "bsd-new" ]))
+            self.assertTrue(len(f['licenses']) == len(f['license_expressions']))
+        spdx = set([ lic['spdx_license_key'] for f in files for lic in f['licenses'] ])
+        self.assertTrue(spdx == set([ "MIT", "BSD-3-Clause" ]))
+
+        files = self._files(ReportGenerator(100, unknown_ratio=1.0).entries())
+        self.assertTrue(all([ f['license_expressions'] == [] for f in files ]))
+
+    def test_copyrights(self):
+        files = self._files(ReportGenerator(100, copyright_density=0.0).entries())
+        self.assertTrue(all([ f['copyrights'] == [] for f in files ]))
+
+        files = self._files(ReportGenerator(100, copyright_density=1.0).entries())
+        for f in files:
+            self.assertTrue(1 <= len(f['copyrights']) <= 3)
+            self.assertTrue(f['copyrights'][0]['value'].startswith("Copyright (c) "))
+
+    def test_bad_arguments(self):
+        self.assertRaises(ValueError, lambda: ReportGenerator(-1))
+        self.assertRaises(ValueError, lambda: ReportGenerator(10, files_per_dir=0))
+        self.assertRaises(ValueError, lambda: ReportGenerator(10, unknown_ratio=2))
+        self.assertRaises(ValueError, lambda: ReportGenerator(10, license_mix={}))
+
+    def test_license_mix(self):
+        self.assertTrue(parse_license_mix("mit=3, gpl-2.0 OR mit=1,x11") == { "mit": 3, "gpl-2.0 OR mit": 1, "x11": 1 })
+
+    def test_write(self):
+        generator = ReportGenerator(300)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "report.json")
+            with open(file_name, "w") as fp:
+                generator.write(fp)
+            reader = ScancodeReportReader(file_name, chunk_size=1024)
+            entries = list(reader.files())
+            self.assertTrue(reader.headers()[0]['tool_name'] == "scancode-toolkit")
+        self.assertTrue(entries == list(generator.entries()))
+        self.assertTrue(reader.files_count['files'] == 300)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import json
+import os
+import tempfile
+import unittest
+
+from scancode_manifestor.scancode_report import ScancodeReportReader
+
+from test import sample_data
+
+class TestScancodeReportReader(unittest.TestCase):
+
+    def setUp(self):
+        files = sample_data.files()['included']
+        files.append(sample_data.dir())
+        self.report = {}
+        self.report['files'] = files
+        self.report['headers'] = [ { 'tool_name': "scancode-toolkit", 'tool_version': "3.2.3", 'files_count': 6 } ]
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_report(self, report, indent=None):
+        file_name = os.path.join(self.tmp_dir.name, "report.json")
+        with open(file_name, "w") as fp:
+            json.dump(report, fp, indent=indent)
+        return file_name
+
+    def test_read_files(self):
+        for indent in [ None, 2 ]:
+            file_name = self._write_report(self.report, indent)
+            # small chunks to make entries span several reads
+            reader = ScancodeReportReader(file_name, chunk_size=7)
+            files = list(reader.files())
+            self.assertTrue(files == self.report['files'])
+            self.assertTrue(reader.files_count == { 'dirs': 1, 'files': 6})
+            self.assertTrue(reader.headers() == self.report['headers'])
+
+    def test_headers_after_files(self):
+        report = {}
+        report['files'] = self.report['files']
+        report['headers'] = self.report['headers']
+        file_name = self._write_report(report)
+
+        reader = ScancodeReportReader(file_name, chunk_size=5)
+        self.assertTrue(reader.headers() == self.report['headers'])
+        self.assertTrue(list(reader.files()) == self.report['files'])
+
+    def test_no_headers(self):
+        file_name = self._write_report({ 'files': self.report['files'] })
+        reader = ScancodeReportReader(file_name)
+        self.assertTrue(list(reader.files()) == self.report['files'])
+
+        # the report is not read again for the headers
+        reader._top_level = None
+        self.assertTrue(reader.headers() == [])
+
+    def test_empty_files(self):
+        file_name = self._write_report({ 'headers': [], 'files': [] })
+        reader = ScancodeReportReader(file_name)
+        self.assertTrue(list(reader.files()) == [])
+        self.assertTrue(reader.files_count == { 'dirs': 0, 'files': 0})
+
+    def test_truncated_report(self):
+        file_name = os.path.join(self.tmp_dir.name, "report.json")
+        with open(file_name, "w") as fp:
+            fp.write(json.dumps(self.report)[:-20])
+        reader = ScancodeReportReader(file_name, chunk_size=5)
+        self.assertRaises(ValueError, lambda: list(reader.files()))
+
+
+if __name__ == '__main__':
+    unittest.main()
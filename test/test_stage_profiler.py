@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+
+###################################################################
+#
+# Scancode report -> manifest creator
+#
+# SPDX-FileCopyrightText: 2021 Henrik Sandklef
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+###################################################################
+
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from scancode_manifestor.stage_profiler import StageProfiler
+
+class TestStageProfiler(unittest.TestCase):
+
+    def test_stages(self):
+        profiler = StageProfiler()
+        profiler.begin("load")
+        profiler.items(files=3)
+        profiler.begin("filter")
+        sum(range(100000))
+        profiler.items(included=2, excluded=1)
+        profiler.end()
+        # nothing to end
+        profiler.end()
+
+        profile = profiler.to_dict()
+        self.assertTrue([ stage['name'] for stage in profile['stages'] ] == [ "load", "filter" ])
+        self.assertTrue(profile['stages'][0]['items'] == { 'files': 3 })
+        self.assertTrue(profile['stages'][1]['items'] == { 'included': 2, 'excluded': 1 })
+        for stage in profile['stages']:
+            self.assertTrue(stage['wall_time'] >= 0)
+            self.assertTrue(stage['cpu_time'] >= 0)
+            self.assertTrue(stage['max_rss_kb'] > 0)
+        self.assertTrue(profile['total']['wall_time'] == profile['stages'][0]['wall_time'] + profile['stages'][1]['wall_time'])
+
+        out = io.StringIO()
+        profiler.write(out)
+        lines = out.getvalue().split("\n")
+        self.assertTrue(lines[0].split()[0] == "stage")
+        self.assertTrue(lines[2].split()[0] == "filter")
+        self.assertTrue(lines[2].endswith("included=2 excluded=1"))
+        self.assertTrue(lines[3].split()[0] == "total")
+
+    def test_traced(self):
+        profiler = StageProfiler()
+        tracemalloc.start()
+        try:
+            profiler.begin("allocate")
+            data = [ str(i) for i in range(10000) ]
+            profiler.end()
+        finally:
+            tracemalloc.stop()
+        stage = profiler.to_dict()['stages'][0]
+        self.assertTrue(stage['traced_delta'] > 0)
+        self.assertTrue(stage['traced_peak'] >= stage['traced_delta'])
+
+    def test_output_json(self):
+        profiler = StageProfiler()
+        profiler.begin("load")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "stages.json")
+            profiler.output(file_name)
+            with open(file_name) as fp:
+                profile = json.load(fp)
+        self.assertTrue(profile['stages'][0]['name'] == "load")
+
+if __name__ == '__main__':
+    unittest.main()